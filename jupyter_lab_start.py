@@ -1,25 +1,27 @@
-import subprocess
 import sys
-import time
+
+import pack_jupyter
 
 print("🌐 Iniciando Jupyter Lab...")
 print("=" * 40)
-print("O navegador abrirá automaticamente")
-print("URL: http://localhost:8888/lab")
-print("=" * 40)
-print("Para parar, feche esta janela")
-print("Ou pressione Ctrl+C no terminal")
-print("=" * 40)
 
 try:
-    # Executar o Jupyter Lab
-    process = subprocess.Popen([sys.executable, "-m", "jupyter", "lab"])
-    
+    # Porta livre, espera a API responder e abre o navegador já autenticado
+    servidor = pack_jupyter.iniciar()
+    print(f"URL: {servidor['url']}")
+    print(f"⏱️  Pronto em {servidor['segundos_pronto']:.1f}s")
+    print("=" * 40)
+
     # Manter a janela aberta
-    input("\nPressione Enter para parar o Jupyter Lab...\n")
-    process.terminate()
+    try:
+        input("\nPressione Enter para parar o Jupyter Lab...\n")
+    except KeyboardInterrupt:
+        pass
+    pack_jupyter.parar(servidor)
     print("Jupyter Lab finalizado!")
-    
+
+except pack_jupyter.JupyterErro as e:
+    print("❌ Erro:", str(e))
 except Exception as e:
     print("❌ Erro:", str(e))
 
@@ -2,7 +2,8 @@
 import os
 import sys
 import subprocess
-import time
+
+import pack_jupyter
 
 print("🌐 JUPYTER LAB - INICIADOR RÁPIDO")
 print("=" * 40)
@@ -20,6 +21,13 @@ except:
     input("Pressione Enter para sair...")
     sys.exit(1)
 
+# Servidores já abertos por outras janelas continuam rodando lado a lado
+abertos = pack_jupyter.listar()
+if abertos:
+    print(f"ℹ️  {len(abertos)} Jupyter Lab já em execução:")
+    for servidor in abertos:
+        print(f"   {servidor['url']}  ({servidor['diretorio']})")
+
 # Perguntar se quer abrir em pasta específica
 abrir_em = input("Abrir em pasta específica? (Enter para atual): ").strip()
 if abrir_em and os.path.exists(abrir_em):
@@ -27,8 +35,21 @@ if abrir_em and os.path.exists(abrir_em):
     print(f"📁 Mudando para: {abrir_em}")
 
 print("\n🚀 Iniciando Jupyter Lab...")
-print("💡 Dica: Para parar, feche esta janela ou Ctrl+C")
+print("💡 Dica: Para parar, pressione Enter ou Ctrl+C")
 print("=" * 40)
 
 # Iniciar o Jupyter Lab
-os.system(f'"{sys.executable}" -m jupyter lab')
+try:
+    servidor = pack_jupyter.iniciar()
+except pack_jupyter.JupyterErro as e:
+    print(f"❌ {e}")
+    input("Pressione Enter para sair...")
+    sys.exit(1)
+pack_jupyter.imprimir_servidor(servidor)
+
+try:
+    input("\nPressione Enter para parar o Jupyter Lab...\n")
+except KeyboardInterrupt:
+    pass
+pack_jupyter.parar(servidor)
+print("🛑 Jupyter Lab finalizado!")
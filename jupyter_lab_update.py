@@ -1,85 +1,99 @@
-import subprocess
-import sys
+# Atualiza o Jupyter e a família dele numa única transação do resolver.
+#
+# Versões antes/depois vêm dos metadados instalados (pack_index), sem
+# `pip show`. A checagem de desatualizados se limita às dependências
+# instaladas da família e consulta o índice em paralelo, com cache por
+# ETag (pack_outdated) - nada de `pip list --outdated` varrendo o ambiente.
+
 import time
 
-def run_command(command, description):
-    """Executa um comando e mostra o resultado"""
-    print(f"\n🔄 {description}...")
-    print("-" * 40)
-    
-    try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        print("✅ Comando executado com sucesso!")
-        if result.stdout:
-            print(f"📋 Saída: {result.stdout.strip()}")
-        return True
-        
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Erro no comando:")
-        print(f"🔴 Erro: {e.stderr.strip() if e.stderr else 'Nenhuma mensagem de erro'}")
-        return False
-        
-    except Exception as e:
-        print(f"❌ Erro inesperado: {str(e)}")
-        return False
+import pack_backend
+import pack_falhas
+import pack_index
+import pack_outdated
+import pack_progress
+
+FAMILIA = ["jupyterlab", "notebook", "ipykernel", "ipython", "traitlets"]
+
+
+def versoes(pacotes):
+    """{pacote: versão instalada} lida dos metadados, no próprio processo"""
+    return {pacote: pack_index.get_current_version(pacote) for pacote in pacotes}
+
+
+def comando_atualizacao(desatualizados):
+    """Um único install --upgrade (pip ou uv) com a família e as dependências desatualizadas"""
+    extras = [p for p in desatualizados if p not in FAMILIA]
+    return pack_backend.comando_install(["--upgrade", *FAMILIA, *extras])
+
 
 def main():
     print("=" * 60)
     print("🚀 ATUALIZADOR DO JUPYTER LAB")
     print("=" * 60)
-    
-    # Verificar versão atual
-    print("📋 Versão atual do Jupyter Lab:")
-    run_command("python -m pip show jupyterlab", "Verificando instalação atual")
-    
-    # Atualizar o Jupyter Lab
-    success = run_command(
-        "python -m pip install --upgrade jupyterlab", 
-        "Atualizando Jupyter Lab para a versão mais recente"
-    )
-    
-    if success:
+
+    antes = versoes(FAMILIA)
+    print("📋 Versões atuais:")
+    for pacote, versao in antes.items():
+        print(f"   {pacote:12} {versao}")
+
+    # Só a família e o que ela puxa: dezenas de consultas em paralelo, não o ambiente inteiro
+    inicio = time.perf_counter()
+    fechamento = pack_index.fechamento_dependencias(FAMILIA)
+    plano, erros = pack_outdated.calcular_plano(fechamento)
+    print(f"\n🔍 {len(fechamento)} pacotes na família do Jupyter verificados em "
+          f"{time.perf_counter() - inicio:.1f}s - {len(plano)} desatualizados")
+    for pacote, atual, nova in plano:
+        print(f"   {pacote:28} {atual} → {nova}")
+    for pacote, erro in erros:
+        print(f"   ⚠️  {pacote}: {erro}")
+
+    faltando = [p for p, v in antes.items() if v == pack_index.NAO_INSTALADO]
+    if not plano and not faltando:
+        print("\n✅ Jupyter Lab e pacotes relacionados já estão atualizados!")
+        return
+
+    print("\n🔄 Atualizando tudo em uma única transação...")
+    print("-" * 40)
+    result = pack_backend.executar(comando_atualizacao([p for p, _, _ in plano]),
+                                   descricao=f"jupyter: {len(FAMILIA)} + {len(plano)} pacotes")
+    pack_index.invalidar()
+
+    if result.returncode == 0:
         print("\n" + "🎉" * 10)
         print("✅ JUPYTER LAB ATUALIZADO COM SUCESSO!")
         print("🎉" * 10)
-        
-        # Mostrar nova versão
-        print("\n📋 Nova versão instalada:")
-        run_command("python -m pip show jupyterlab", "Verificando nova versão")
-        
     else:
         print("\n" + "⚠️" * 10)
         print("❌ ATUALIZAÇÃO FALHOU!")
         print("⚠️" * 10)
-        print("\n💡 Dicas para resolver:")
-        print("1. Execute este arquivo como Administrador")
-        print("2. Feche todas as instâncias do Jupyter Lab abertas")
-        print("3. Verifique sua conexão com a internet")
-    
-    # Atualizar pacotes relacionados também
-    print("\n🔧 Atualizando pacotes relacionados...")
-    packages_related = ["notebook", "ipykernel", "ipython", "traitlets"]
-    
-    for package in packages_related:
-        run_command(f"python -m pip install --upgrade {package}", f"Atualizando {package}")
-    
+        for linha in pack_progress.linhas_de_erro(result):
+            print(f"   {linha}")
+        print(f"\n💡 {pack_falhas.dica(result.falha)}")
+        if result.falha in (pack_falhas.PERMISSAO, pack_falhas.DESCONHECIDA):
+            print("💡 Feche todas as instâncias do Jupyter Lab abertas (arquivos em uso não podem ser trocados)")
+
     print("\n" + "=" * 60)
     print("📋 RESUMO DA ATUALIZAÇÃO:")
-    run_command("python -m jupyter --version", "Versão do Jupyter")
-    run_command("python -m pip list --outdated", "Pacotes desatualizados")
-    
+    depois = versoes(FAMILIA + [p for p, _, _ in plano if p not in FAMILIA])
+    for pacote, versao in depois.items():
+        anterior = antes.get(pacote) or next(a for p, a, _ in plano if p == pacote)
+        marca = "⬆️ " if versao != anterior else "  "
+        print(f"   {marca}{pacote:28} {anterior} → {versao}")
+    # O plano já diz a versão alvo de cada um: não precisa consultar o índice de novo.
+    # A comparação é de versões ("2.0" == "2.0.0", "+cpu" ignorado), não de texto
+    retidos = [p for p, atual, nova in plano
+               if pack_outdated.situacao_atualizacao(atual, depois.get(p), nova, result.returncode == 0)
+               == pack_outdated.RETIDO]
+    if retidos:
+        print(f"\n⚠️  Ainda desatualizados (restrições de outros pacotes): {', '.join(retidos)}")
+
     print("\n🎯 Comando para iniciar o Jupyter Lab atualizado:")
     print("python -m jupyter lab")
-    
+
     print("\n⭐ Dica: Execute este arquivo periodicamente")
     print("   para manter seu Jupyter Lab sempre atualizado!")
 
 if __name__ == "__main__":
     main()
-    input("\n👆 Pressione Enter para sair...")
+    pack_progress.pausar("\n👆 Pressione Enter para sair...")
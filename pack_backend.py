@@ -0,0 +1,206 @@
+# PACK BACKEND: camada de backends de instalação (pip ou uv)
+#
+# Todos os run_command / instalar_categoria / atualizações passam por aqui:
+#   • executar() aplica o wheelhouse local, converte o comando para o backend
+#     escolhido, mede o tempo de cada chamada e repete falhas transitórias
+#     (pack_falhas)
+#   • Backend automático: uv se estiver no PATH, senão pip
+#   • Forçar: --backend pip|uv na linha de comando ou PACK_BACKEND=pip|uv
+#   • `python pack_backend.py comparar numpy pandas` instala os mesmos pacotes
+#     em venvs temporários com cada backend e compara os tempos
+
+import argparse
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import pack_falhas
+import pack_progress
+import pack_trace
+import pack_wheelhouse
+
+
+class PipBackend:
+    nome = "pip"
+
+    def disponivel(self):
+        return True
+
+    def comando_install(self, args, python=None):
+        """Linha de comando de `pip install` para o interpretador"""
+        return [python or sys.executable, "-m", "pip", "install", *args]
+
+
+class UvBackend:
+    nome = "uv"
+
+    def __init__(self):
+        self.executavel = shutil.which("uv")
+
+    def disponivel(self):
+        return self.executavel is not None
+
+    def comando_install(self, args, python=None):
+        """Linha de comando de `uv pip install` apontando para o interpretador"""
+        return [self.executavel, "pip", "install", "--python", python or sys.executable, *args]
+
+
+BACKENDS = {"pip": PipBackend, "uv": UvBackend}
+
+# Histórico de tempos da execução: [(backend, descrição, segundos, sucesso)]
+TEMPOS = []
+
+
+def _backend_solicitado():
+    """Backend pedido via --backend ou PACK_BACKEND (padrão: auto)"""
+    if "--backend" in sys.argv:
+        posicao = sys.argv.index("--backend") + 1
+        if posicao < len(sys.argv):
+            return sys.argv[posicao]
+    for arg in sys.argv:
+        if arg.startswith("--backend="):
+            return arg.split("=", 1)[1]
+    return os.environ.get("PACK_BACKEND", "auto")
+
+
+def selecionar(nome=None):
+    """Retorna o backend pedido, com fallback para pip se o uv não estiver disponível"""
+    nome = (nome or _backend_solicitado()).lower()
+    if nome in ("auto", "uv"):
+        uv = UvBackend()
+        if uv.disponivel():
+            return uv
+        if nome == "uv":
+            # stderr: o stdout da pack_cli é reservado ao JSON lines
+            print("⚠️  uv não encontrado no PATH - usando pip", file=sys.stderr)
+    return PipBackend()
+
+
+# Escolhido no primeiro uso (atual()), não na importação: a pack_cli define
+# o backend a partir do próprio argv antes de instalar qualquer coisa
+backend = None
+
+
+def atual():
+    """Backend desta execução, selecionado no primeiro uso"""
+    global backend
+    if backend is None:
+        backend = selecionar()
+    return backend
+
+
+def comando_install(args, python=None):
+    """Linha de comando de install do backend atual"""
+    return atual().comando_install(list(args), python)
+
+
+def converter_comando(command):
+    """Reescreve um comando `pip install ...` (string ou lista) para o backend atual"""
+    lista = shlex.split(command, posix=os.name != 'nt') if isinstance(command, str) else list(command)
+    if "pip" not in lista or "install" not in lista:
+        return command
+    if os.path.basename(lista[0]).lower() in ("uv", "uv.exe"):
+        # Já está no formato do uv
+        return command
+
+    args = lista[lista.index("install") + 1:]
+    nova = atual().comando_install(args)
+    if isinstance(command, str):
+        return subprocess.list2cmdline(nova) if os.name == 'nt' else shlex.join(nova)
+    return nova
+
+
+def executar(command, check=False, mostrar=True, wheelhouse=True, descricao=None):
+    """Executa um comando de instalação pelo backend atual, medindo o tempo
+
+    Falhas de rede são repetidas com espera exponencial (pack_falhas); com
+    check=True a CalledProcessError leva a classe da falha em `falha`.
+    """
+    if wheelhouse:
+        command = pack_wheelhouse.ajustar_comando(command)
+    command = converter_comando(command)
+
+    backend = atual()
+    inicio = time.perf_counter()
+    sucesso = False
+    try:
+        with pack_trace.span(descricao or "install", "install", mede_cpu=True, backend=backend.nome) as span:
+            result = pack_falhas.repetir(lambda c: pack_progress.executar(c, mostrar=mostrar), command,
+                                         descricao or "install")
+            span["bytes"] = result.progresso.get("bytes", 0)
+            span["codigo"] = result.returncode
+            if result.falha or result.tentativas:
+                span.update(falha=result.falha, tentativas=result.tentativas,
+                            segundos_perdidos=result.segundos_perdidos)
+        sucesso = result.returncode == 0
+        if check and not sucesso:
+            excecao = subprocess.CalledProcessError(result.returncode, result.args, result.stdout, result.stderr)
+            excecao.log = result.log
+            excecao.falha = result.falha
+            raise excecao
+        return result
+    finally:
+        duracao = time.perf_counter() - inicio
+        if descricao is None:
+            descricao = command if isinstance(command, str) else " ".join(command)
+        TEMPOS.append((backend.nome, descricao, duracao, sucesso))
+        print(f"⏱️  {backend.nome}: {duracao:.1f}s")
+
+
+def relatorio_tempos():
+    """Resumo dos tempos por backend nesta execução"""
+    por_backend = {}
+    for nome, _, duracao, _ in TEMPOS:
+        total, chamadas = por_backend.get(nome, (0.0, 0))
+        por_backend[nome] = (total + duracao, chamadas + 1)
+    return por_backend
+
+
+def comparar(pacotes):
+    """Instala os mesmos pacotes em venvs temporários com cada backend disponível"""
+    resultados = {}
+    for nome, classe in BACKENDS.items():
+        candidato = classe()
+        if not candidato.disponivel():
+            resultados[nome] = None
+            continue
+        with tempfile.TemporaryDirectory(prefix=f"pack_backend_{nome}_") as venv:
+            subprocess.run([sys.executable, "-m", "venv", venv], check=True)
+            python = os.path.join(venv, "Scripts" if os.name == 'nt' else "bin", "python")
+            inicio = time.perf_counter()
+            result = subprocess.run(candidato.comando_install(pacotes, python), capture_output=True, text=True)
+            resultados[nome] = (time.perf_counter() - inicio, result.returncode == 0)
+    return resultados
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Backends de instalação (pip / uv)")
+    parser.add_argument("--backend", choices=["auto", "pip", "uv"])
+    sub = parser.add_subparsers(dest="comando", required=True)
+    sub.add_parser("info", help="mostrar o backend selecionado")
+    p_comparar = sub.add_parser("comparar", help="comparar o tempo de instalação entre backends")
+    p_comparar.add_argument("pacotes", nargs="+")
+    args = parser.parse_args()
+
+    if args.comando == "info":
+        print(f"🔧 Backend selecionado: {atual().nome}")
+        for nome, classe in BACKENDS.items():
+            print(f"• {nome}: {'✅ disponível' if classe().disponivel() else '❌ não encontrado'}")
+    else:
+        print(f"⏱️  Comparando backends: {', '.join(args.pacotes)}")
+        print("=" * 60)
+        for nome, resultado in comparar(args.pacotes).items():
+            if resultado is None:
+                print(f"{nome:5} - ❌ não disponível")
+            else:
+                duracao, ok = resultado
+                print(f"{nome:5} - {'✅' if ok else '❌'} {duracao:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
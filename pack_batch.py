@@ -0,0 +1,308 @@
+# PACK BATCH: instalação em lote de uma categoria inteira
+#
+# Em vez de um `pip install` por pacote (com pausas entre eles), o lote:
+#   1. Resolve a categoria inteira em uma única passada do resolver
+#      (`pip install --dry-run --report`) e, antes de baixar qualquer wheel,
+#      confere o espaço em disco e a memória (pack_espaco) - o que não cabe
+#      é recusado ou o plano é refeito
+#   2. Baixa/constrói em paralelo (pool limitado de workers) só as wheels que
+#      ainda não estão no wheelhouse local, guardando-as lá - as maiores que
+#      pack_download.LIMIAR_MB vão em faixas paralelas e retomáveis. Se o
+#      lote tiver alguma dessas, o pack_escalonador agenda downloads e
+#      instalações pelo tamanho (os pequenos instalam enquanto os grandes baixam)
+#   3. Instala tudo em uma única chamada a partir do wheelhouse, pelo backend
+#      selecionado (pip ou uv) - o instalador ordena pelas dependências
+#   4. Informa o resultado de cada pacote no formato ✅/❌ de sempre
+#
+# Resolve e downloads repetem falhas de rede (pack_falhas); a classe da
+# falha de cada pacote fica em BatchInstaller.classes.
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote, urlparse
+
+import pack_backend
+import pack_download
+import pack_escalonador
+import pack_espaco
+import pack_falhas
+import pack_index
+import pack_trace
+import pack_wheelhouse
+
+# Downloads são limitados por rede, não por CPU
+MAX_WORKERS = 4
+
+
+def _rodar(command):
+    return subprocess.run(command, capture_output=True, text=True)
+
+
+def _pip(*args):
+    """Monta a linha de comando do pip do interpretador atual
+
+    Resolve (`install --dry-run --report`) e build de wheels ficam sempre no
+    pip: o uv não tem `pip wheel` nem o relatório JSON do resolver. Só a
+    instalação final passa pelo backend escolhido.
+    """
+    return [sys.executable, "-m", "pip", *args]
+
+
+def _primeira_linha_erro(stderr):
+    """Extrai a linha mais útil de uma saída de erro do pip"""
+    linhas = [l.strip() for l in (stderr or "").strip().split('\n') if l.strip()]
+    for linha in linhas:
+        if linha.startswith("ERROR:"):
+            return linha
+    return linhas[-1] if linhas else "Erro desconhecido"
+
+
+class BatchInstaller:
+    def __init__(self, max_workers=MAX_WORKERS, extra_args=None):
+        self.max_workers = max_workers
+        self.extra_args = list(extra_args or [])
+        if pack_wheelhouse.OFFLINE:
+            self.extra_args = []
+        self.extra_args += pack_wheelhouse.argumentos_pip()
+        # Segundos gastos por distribuição (download/build) e na instalação final
+        self.tempos = {}
+        self.tempo_instalacao = 0.0
+        # Classe da falha (pack_falhas) de cada pacote que não instalou
+        self.classes = {}
+
+    def resolver(self, pacotes):
+        """Resolve os pacotes em uma única passada; retorna (itens, erro)"""
+        itens, erro, _ = self._resolver(pacotes)
+        return itens, erro
+
+    def _resolver(self, pacotes):
+        """Como resolver(), com a classe da falha: (itens, erro, classe)"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            relatorio = os.path.join(tmpdir, "report.json")
+            descricao = f"resolver {len(pacotes)} pacotes"
+            with pack_trace.span(descricao, "resolve", mede_cpu=True, pacotes=list(pacotes)) as span:
+                result = pack_falhas.repetir(
+                    _rodar,
+                    _pip("install", "--dry-run", "--quiet", "--report", relatorio, *self.extra_args, *pacotes),
+                    descricao
+                )
+                span.update(falha=result.falha, tentativas=result.tentativas)
+            if result.returncode != 0:
+                return None, _primeira_linha_erro(result.stderr), result.falha
+            with open(relatorio, encoding="utf-8") as fp:
+                dados = json.load(fp)
+
+        itens = []
+        for item in dados.get("install", []):
+            itens.append({
+                "name": item["metadata"]["name"],
+                "version": item["metadata"]["version"],
+                "url": item["download_info"]["url"],
+                "sha256": item["download_info"].get("archive_info", {}).get("hashes", {}).get("sha256"),
+                "requires": item["metadata"].get("requires_dist", []),
+            })
+        return itens, None, None
+
+    @staticmethod
+    def _no_wheelhouse(item):
+        """Retorna True se o resolver escolheu uma wheel que já está no wheelhouse"""
+        url = urlparse(item["url"])
+        return url.scheme == "file" and pack_wheelhouse.contem(os.path.basename(unquote(url.path)))
+
+    @staticmethod
+    def _grande(item):
+        """True para wheels remotas acima de pack_download.LIMIAR_MB em servidores com Range"""
+        if "grande" not in item:
+            url = urlparse(item["url"])
+            item["grande"] = False
+            if url.scheme in ("http", "https") and url.path.endswith(".whl") and item.get("tamanho"):
+                # Tamanho já veio do índice (pack_escalonador.medir_tamanhos)
+                item["grande"] = pack_escalonador.pesado(item)
+            elif url.scheme in ("http", "https") and url.path.endswith(".whl"):
+                try:
+                    tamanho, aceita_faixas = pack_download.sondar(item["url"])
+                    item["grande"] = bool(aceita_faixas and tamanho and tamanho >= pack_download.LIMIAR_MB * 1e6)
+                except (OSError, ValueError):
+                    pass
+        return item["grande"]
+
+    def _construir_wheel(self, item, staging):
+        """Baixa (ou constrói) a wheel de um item resolvido e guarda no wheelhouse"""
+        if self._no_wheelhouse(item):
+            return True, "", None
+        destino = tempfile.mkdtemp(dir=staging)
+        inicio = time.perf_counter()
+        # Wheel pronta no índice é só download; sdist precisa de build
+        etapa = "download" if urlparse(item["url"]).path.endswith(".whl") else "build"
+        with pack_trace.span(item["name"], etapa, mede_cpu=True, versao=item["version"]) as span:
+            if etapa == "download" and self._grande(item):
+                span["faixas"] = pack_download.PARTES
+                try:
+                    caminho = pack_download.baixar(item["url"], sha256=item.get("sha256"))
+                    shutil.move(caminho, destino)
+                    erro = None
+                except pack_download.DownloadErro as e:
+                    erro, classe = str(e), e.classe
+                    span["falha"] = classe
+                except OSError as e:
+                    # Disco cheio ou sem permissão no staging: falha só deste pacote, não do lote
+                    erro, classe = f"{item['name']}: {e}", pack_falhas.classificar(str(e))
+                    span["falha"] = classe
+            else:
+                result = pack_falhas.repetir(
+                    _rodar,
+                    _pip("wheel", "--no-deps", "--quiet", "--wheel-dir", destino, *self.extra_args, item["url"]),
+                    item["name"]
+                )
+                erro = _primeira_linha_erro(result.stderr) if result.returncode != 0 else None
+                classe = result.falha
+                span.update(falha=result.falha, tentativas=result.tentativas)
+            span["bytes"] = sum(e.stat().st_size for e in os.scandir(destino) if e.is_file())
+        self.tempos[pack_index.normalizar_nome(item["name"])] = time.perf_counter() - inicio
+        if erro is not None:
+            return False, erro, classe
+        pack_wheelhouse.importar_diretorio(destino)
+        return True, "", None
+
+    def preparar(self, itens, staging):
+        """Baixa/constrói as wheels que faltam em paralelo; retorna {nome: (ok, erro, classe)}"""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futuros = {item["name"]: pool.submit(self._construir_wheel, item, staging) for item in itens}
+            return {nome: futuro.result() for nome, futuro in futuros.items()}
+
+    def baixar_grandes(self, pacotes):
+        """Leva ao wheelhouse só as wheels grandes que a resolução dos pacotes escolher
+
+        Usado antes de uma atualização: o `pip install --upgrade` que vem depois
+        acha as wheels no wheelhouse (--find-links) e não baixa de novo.
+        Retorna {nome: (ok, erro, classe)}.
+        """
+        itens, _ = self.resolver(pacotes)
+        if not itens:
+            # A própria atualização vai relatar o erro da resolução
+            return {}
+        grandes = [item for item in itens if not self._no_wheelhouse(item) and self._grande(item)]
+        if not grandes:
+            return {}
+        print(f"⬇️  Pré-baixando {len(grandes)} wheels grandes em faixas paralelas: "
+              f"{', '.join(item['name'] for item in grandes)}")
+        staging = tempfile.mkdtemp(prefix="pack_batch_")
+        try:
+            return self.preparar(grandes, staging)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _resolver_isolando_falhas(self, pacotes):
+        """Resolve o lote; se falhar, resolve cada pacote em paralelo para achar os culpados
+
+        Retorna (itens, {pacote: (erro, classe)}).
+        """
+        itens, erro, classe = self._resolver(pacotes)
+        if itens is not None:
+            return itens, {}
+        if len(pacotes) == 1 or classe not in (pack_falhas.CONFLITO, pack_falhas.DESCONHECIDA):
+            # Rede, disco, permissão...: isolar pacote por pacote não muda o resultado
+            return [], {p: (erro, classe) for p in pacotes}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            resultados = dict(zip(pacotes, pool.map(lambda p: self._resolver([p]), pacotes)))
+
+        falhas = {p: (erro, classe) for p, (itens_p, erro, classe) in resultados.items() if itens_p is None}
+        validos = [p for p in pacotes if p not in falhas]
+        if not validos:
+            return [], falhas
+
+        itens, erro, classe = self._resolver(validos)
+        if itens is None:
+            # Conflito entre pacotes válidos isoladamente - nada é instalado
+            falhas.update({p: (erro, classe) for p in validos})
+            return [], falhas
+        return itens, falhas
+
+    def instalar(self, pacotes):
+        """Instala o lote e retorna {pacote: (sucesso, mensagem)}"""
+        resultados = {}
+        itens, falhas = self._resolver_isolando_falhas(pacotes)
+        for pacote, (erro, classe) in falhas.items():
+            resultados[pacote] = (False, erro)
+            self.classes[pacote] = classe
+
+        pendentes = [p for p in pacotes if p not in falhas]
+        if not pendentes:
+            return resultados
+
+        # Tamanhos e espaço livre antes de qualquer download (o staging vem
+        # depois: a pré-verificação pode mudar o diretório temporário)
+        pack_escalonador.medir_tamanhos(itens, self.extra_args)
+        itens, pendentes, recusados = pack_espaco.pre_verificar(self, itens, pendentes)
+        for pacote, motivo in recusados.items():
+            resultados[pacote] = (False, motivo)
+            self.classes[pacote] = pack_falhas.DISCO
+        if not pendentes:
+            return resultados
+
+        staging = tempfile.mkdtemp(prefix="pack_batch_")
+        try:
+            faltando = sum(1 for item in itens if not self._no_wheelhouse(item))
+            print(f"⚙️  {len(itens)} distribuições resolvidas ({len(itens) - faltando} no wheelhouse)"
+                  f" - baixando {faltando} com {self.max_workers} workers...")
+            if len(pendentes) > 1 and any(pack_escalonador.pesado(i) for i in itens if not self._no_wheelhouse(i)):
+                escalonador = pack_escalonador.Escalonador(self, itens, pendentes)
+                escalonador.imprimir_plano()
+                preparados = escalonador.executar(staging)
+            else:
+                preparados = self.preparar(itens, staging)
+            erros_wheel = [f"{nome}: {erro}" for nome, (ok, erro, _) in preparados.items() if not ok]
+            classes_wheel = [classe for ok, _, classe in preparados.values() if not ok]
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        # Instalação final pelo backend selecionado (pip ou uv), só do wheelhouse
+        inicio = time.perf_counter()
+        result = pack_backend.executar(
+            pack_backend.comando_install([*pack_wheelhouse.argumentos_pip(offline=True), *pendentes]),
+            mostrar=False,
+            wheelhouse=False,
+            descricao=f"lote: {' '.join(pendentes)}"
+        )
+        self.tempo_instalacao = time.perf_counter() - inicio
+        erro_instalacao = None if result.returncode == 0 else _primeira_linha_erro(result.stderr)
+        classe_instalacao = result.falha or next(iter(classes_wheel), None)
+
+        pack_index.invalidar()
+        for pacote in pendentes:
+            versao = pack_index.get_current_version(pacote)
+            if versao != pack_index.NAO_INSTALADO:
+                resultados[pacote] = (True, versao)
+            else:
+                resultados[pacote] = (False, erro_instalacao or "; ".join(erros_wheel) or "Não instalado")
+                self.classes[pacote] = classe_instalacao
+        return resultados
+
+
+def instalar_lote(pacotes, descricoes=None, extra_args=None):
+    """Instala uma lista de pacotes em lote e imprime o resultado de cada um"""
+    descricoes = descricoes or {}
+    instalador = BatchInstaller(extra_args=extra_args)
+    resultados = instalador.instalar(list(pacotes))
+
+    sucessos = 0
+    for pacote in pacotes:
+        sucesso, mensagem = resultados[pacote]
+        if sucesso:
+            print(f"✅ {pacote} instalado com sucesso! (v{mensagem})")
+            sucessos += 1
+        else:
+            print(f"❌ Erro ao instalar {pacote}:")
+            print(f"   {mensagem}")
+            if instalador.classes.get(pacote):
+                print(f"   💡 {pack_falhas.dica(instalador.classes[pacote])}")
+        if descricoes.get(pacote):
+            print(f"   {descricoes[pacote]}")
+    return sucessos
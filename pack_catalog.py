@@ -0,0 +1,567 @@
+# PACK CATALOG: catálogo único de pacotes e motor comum de todos os menus
+#
+# pack_catalog.toml descreve fases, categorias, pacotes, descrições, tamanhos
+# e índices extras. Este módulo:
+#   • carrega o catálogo só quando alguém precisa dele e guarda a versão
+#     compilada (pickle) no cache, invalidada pelo mtime/tamanho do TOML -
+#     o parse só acontece quando o arquivo muda
+#   • fornece CatalogInstaller: status, instalação em lote, atualização por
+#     plano e menus para as Fases 1-4, o SCI PACK e os scripts avulsos
+
+import hashlib
+import os
+import pickle
+import subprocess
+
+import pack_backend
+import pack_batch
+import pack_download
+import pack_falhas
+import pack_index
+import pack_ml_benchmark
+import pack_outdated
+import pack_progress
+import pack_trace
+import pack_wheelhouse
+
+ARQUIVO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pack_catalog.toml")
+# Incrementar quando o formato compilado mudar
+VERSAO_FORMATO = 2
+# Acima deste total (MB) a instalação pede confirmação
+LIMITE_PESADO_MB = 1000
+
+_CAMPOS_PACOTE = ("descricao", "tamanho_mb", "extra_index_url", "acompanha", "modulo")
+
+_catalogo = None
+
+
+def _ler_toml(caminho):
+    try:
+        import tomllib
+    except ImportError:
+        from pip._vendor import tomli as tomllib
+    with open(caminho, "rb") as fp:
+        return tomllib.load(fp)
+
+
+def compilar(dados):
+    """Resolve as referências do TOML: cada categoria vira {pacote: info completa}"""
+    globais = dados.get("pacotes", {})
+    menus = {}
+    for menu_id, menu in dados.get("menus", {}).items():
+        categorias = []
+        for categoria in menu.get("categorias", []):
+            pacotes = {}
+            for entrada in categoria["pacotes"]:
+                if isinstance(entrada, str):
+                    entrada = {"nome": entrada}
+                nome = entrada["nome"]
+                info = {campo: None for campo in _CAMPOS_PACOTE}
+                info.update(globais.get(nome, {}))
+                info.update({k: v for k, v in entrada.items() if k != "nome"})
+                info["descricao"] = info["descricao"] or ""
+                info["acompanha"] = list(info["acompanha"] or [])
+                pacotes[nome] = info
+            categorias.append({
+                "id": categoria["id"],
+                "nome": categoria["nome"],
+                "rotulo": categoria.get("rotulo", f"Instalar {categoria['nome']}"),
+                "pacotes": pacotes,
+            })
+        compilado = {chave: valor for chave, valor in menu.items() if chave != "categorias"}
+        compilado["categorias"] = categorias
+        menus[menu_id] = compilado
+    return {"menus": menus}
+
+
+def _arquivo_compilado(caminho):
+    chave = hashlib.sha1(os.path.abspath(caminho).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(pack_index.diretorio_cache(), f"catalog-{chave}.pickle")
+
+
+def carregar(caminho=ARQUIVO):
+    """Retorna o catálogo compilado (memória → pickle no cache → parse do TOML)"""
+    global _catalogo
+    estado = os.stat(caminho)
+    assinatura = (VERSAO_FORMATO, estado.st_mtime_ns, estado.st_size)
+    if _catalogo is not None and _catalogo[0] == (caminho, assinatura):
+        return _catalogo[1]
+
+    cache = _arquivo_compilado(caminho)
+    dados = None
+    try:
+        with open(cache, "rb") as fp:
+            salvo = pickle.load(fp)
+        if salvo.get("assinatura") == assinatura:
+            dados = salvo["dados"]
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        pass
+
+    if dados is None:
+        dados = compilar(_ler_toml(caminho))
+        temporario = f"{cache}.{os.getpid()}.tmp"
+        try:
+            with open(temporario, "wb") as fp:
+                pickle.dump({"assinatura": assinatura, "dados": dados}, fp, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporario, cache)
+        except OSError:
+            pass
+
+    _catalogo = ((caminho, assinatura), dados)
+    return dados
+
+
+def menu(menu_id=None):
+    """Definição compilada de um menu do catálogo (None = catálogo inteiro)"""
+    menus = carregar()["menus"]
+    if menu_id is not None:
+        return menus[menu_id]
+    categorias = [categoria for definicao in menus.values() for categoria in definicao["categorias"]]
+    return {"titulo": "📦 CATÁLOGO COMPLETO", "categorias": categorias}
+
+
+def modulo_de_import(pacote, info=None):
+    """Nome do módulo importado por um pacote (campo modulo ou o nome com _)"""
+    info = info if info is not None else {}
+    return info.get("modulo") or pacote.replace("-", "_").lower()
+
+
+def pacotes_do_menu(menu_id=None):
+    """Todos os pacotes de um menu, na ordem do catálogo e sem repetição"""
+    pacotes = []
+    for categoria in menu(menu_id)["categorias"]:
+        pacotes.extend(categoria["pacotes"])
+    return list(dict.fromkeys(pacotes))
+
+
+class CatalogInstaller:
+    def __init__(self, menu_id=None, benchmark=None):
+        self.menu_id = menu_id
+        # Benchmark de CPU depois de instalar numpy/torch/tensorflow (padrão: --benchmark/PACK_BENCHMARK)
+        self.benchmark = pack_ml_benchmark.APOS_INSTALAR if benchmark is None else benchmark
+        self.definicao = menu(menu_id)
+        self.categorias = self.definicao["categorias"]
+        self.info = {}
+        for categoria in self.categorias:
+            # Compatível com o formato antigo: self.pacotes_<categoria> = {pacote: descrição}
+            setattr(self, f"pacotes_{categoria['id']}",
+                    {nome: info["descricao"] for nome, info in categoria["pacotes"].items()})
+            for nome, info in categoria["pacotes"].items():
+                self.info.setdefault(nome, info)
+
+    def todos_pacotes(self):
+        """{pacote: descrição} de todas as categorias do menu"""
+        return {nome: info["descricao"] for nome, info in self.info.items()}
+
+    def categoria(self, categoria_id):
+        """Definição de uma categoria pelo id"""
+        for categoria in self.categorias:
+            if categoria["id"] == categoria_id:
+                return categoria
+        raise KeyError(categoria_id)
+
+    def _info(self, pacote):
+        return self.info.get(pacote, {"descricao": "", "tamanho_mb": None, "extra_index_url": None,
+                                      "acompanha": [], "modulo": None})
+
+    def _argumentos_indice(self, pacotes):
+        """--extra-index-url exigidos pelos pacotes (ex.: PyTorch CPU)"""
+        urls = dict.fromkeys(self._info(p)["extra_index_url"] for p in pacotes)
+        return [arg for url in urls if url for arg in ("--extra-index-url", url)]
+
+    def _com_acompanhantes(self, pacotes):
+        lote = []
+        for pacote in pacotes:
+            lote.append(pacote)
+            lote.extend(self._info(pacote)["acompanha"])
+        return list(dict.fromkeys(lote))
+
+    def lote_de_instalacao(self, pacotes):
+        """(lote com acompanhantes, argumentos extras de índice) para instalar os pacotes"""
+        return self._com_acompanhantes(pacotes), self._argumentos_indice(pacotes)
+
+    def indices_extras(self, pacotes):
+        """{pacote: [extra_index_url]} para o pack_outdated consultar o índice certo de cada pacote"""
+        return {p: [self._info(p)["extra_index_url"]] for p in pacotes if self._info(p)["extra_index_url"]}
+
+    def comando_atualizacao(self, plano):
+        """Comando único de `pip install --upgrade` para um plano do pack_outdated
+
+        Vão só os nomes, sem fixar a versão nova de cada um: se as mais
+        recentes forem incompatíveis entre si (tensorflow ainda pedindo
+        numpy<2, por exemplo), o resolver escolhe um conjunto consistente em
+        vez de falhar a categoria inteira.
+        """
+        nomes = [pacote for pacote, _, _ in plano]
+        acompanhantes = [p for p in self._com_acompanhantes(nomes) if p not in nomes]
+        return pack_backend.comando_install(["--upgrade", *self._argumentos_indice(nomes), *nomes, *acompanhantes])
+
+    def run_command(self, command, pacote_nome):
+        """Executa um comando de instalação"""
+        print(f"📦 Instalando {pacote_nome}...")
+        descricao = self._info(pacote_nome)["descricao"]
+        if descricao:
+            print(f"   {descricao}")
+        print("-" * 50)
+
+        try:
+            pack_backend.executar(command, check=True)
+            pack_index.invalidar()
+            print(f"✅ {pacote_nome} instalado com sucesso!")
+            return True
+
+        except subprocess.CalledProcessError as e:
+            print(f"❌ Erro ao instalar {pacote_nome}:")
+            for line in pack_progress.linhas_de_erro(e):
+                print(f"   {line}")
+            print(f"   💡 {pack_falhas.dica(getattr(e, 'falha', None))}")
+            return False
+
+        except Exception as e:
+            print(f"❌ Erro inesperado: {str(e)}")
+            return False
+
+    def get_current_version(self, pacote_nome):
+        """Obtém a versão atual de um pacote (índice em memória, sem subprocess)"""
+        return pack_index.get_current_version(pacote_nome)
+
+    def verificar_tudo(self):
+        """Verifica o status de todos os pacotes do menu"""
+        grupo = self.definicao.get("grupo", "")
+        print(f"🔍 VERIFICANDO STATUS DOS PACOTES {grupo.upper()}".rstrip())
+        print("=" * 60)
+
+        todos_pacotes = self.todos_pacotes()
+        instalados = []
+        faltantes = []
+
+        with pack_trace.span(f"status {self.menu_id or 'catálogo'}", "status", pacotes=len(todos_pacotes)):
+            versoes = {pacote: self.get_current_version(pacote) for pacote in todos_pacotes}
+        for pacote in todos_pacotes:
+            versao = versoes[pacote]
+            if versao != pack_index.NAO_INSTALADO:
+                instalados.append(f"{pacote} (v{versao})")
+            else:
+                faltantes.append(pacote)
+
+        print("✅ INSTALADOS:")
+        for pkg in instalados:
+            print(f"   • {pkg}")
+
+        if faltantes:
+            print(f"\n❌ FALTANTES ({len(faltantes)}):")
+            for pkg in faltantes:
+                print(f"   • {pkg}")
+
+        print(f"\n📊 Total: {len(instalados)}/{len(todos_pacotes)} pacotes {grupo}".rstrip())
+        return len(faltantes)
+
+    def _confirmar_pesados(self, pacotes):
+        """Avisa e pede confirmação quando o lote passa de LIMITE_PESADO_MB"""
+        total_mb = sum(self._info(p)["tamanho_mb"] or 0 for p in pacotes)
+        if total_mb < LIMITE_PESADO_MB:
+            return True
+        print("⚠️  AVISO: Esta instalação pode:")
+        print("   • Demorar vários minutos")
+        print("   • Consumir bastante internet (pacotes grandes)")
+        print(f"   • Ocupar ~{total_mb / 1024:.1f}GB de espaço em disco")
+        print("-" * 50)
+        return pack_progress.confirmar("Deseja continuar? (s/n): ")
+
+    def instalar_pacotes(self, pacotes):
+        """Instala em um único lote os pacotes que faltam; retorna quantos ficaram instalados"""
+        sucessos = 0
+        pendentes = []
+
+        for pacote in pacotes:
+            versao_atual = self.get_current_version(pacote)
+            if versao_atual != pack_index.NAO_INSTALADO:
+                print(f"✅ {pacote} já instalado (v{versao_atual})")
+                sucessos += 1
+            else:
+                pendentes.append(pacote)
+
+        if not pendentes:
+            return sucessos
+        if not self._confirmar_pesados(pendentes):
+            print("Instalação cancelada.")
+            return sucessos
+
+        # Uma única resolução + downloads paralelos para o lote inteiro
+        lote, extra_args = self.lote_de_instalacao(pendentes)
+        print(f"\n📦 Instalando em lote: {', '.join(lote)}")
+        print("-" * 50)
+        pack_batch.instalar_lote(lote, self.todos_pacotes(), extra_args)
+        sucessos += sum(1 for p in pendentes if self.get_current_version(p) != pack_index.NAO_INSTALADO)
+        print()
+        if self.benchmark:
+            self._benchmark_apos_instalar(lote)
+        return sucessos
+
+    def _benchmark_apos_instalar(self, lote):
+        """Roda o pack_ml_benchmark nos frameworks do lote que ficaram instalados"""
+        nomes = {pack_index.normalizar_nome(p) for p in lote}
+        frameworks = [f for f in pack_ml_benchmark.FRAMEWORKS
+                      if f in nomes and self.get_current_version(f) != pack_index.NAO_INSTALADO]
+        if frameworks:
+            pack_ml_benchmark.verificar(frameworks)
+            print()
+
+    def instalar_categoria(self, pacotes_dict, categoria_nome):
+        """Instala todos os pacotes de uma categoria"""
+        print(f"🚀 INSTALANDO {categoria_nome.upper()}")
+        print("=" * 60)
+
+        sucessos = self.instalar_pacotes(list(pacotes_dict))
+
+        print("=" * 60)
+        print(f"📊 {categoria_nome}: {sucessos}/{len(pacotes_dict)} pacotes instalados")
+        return sucessos
+
+    def instalar_todos(self):
+        """Instala todas as categorias do menu"""
+        print(f"🚀 INSTALANDO TODOS OS PACOTES {self.definicao.get('grupo', '').upper()}".rstrip())
+        print("=" * 60)
+
+        total_sucessos = 0
+        total_pacotes = 0
+        for categoria in self.categorias:
+            total_sucessos += self.instalar_categoria(categoria["pacotes"], categoria["nome"])
+            total_pacotes += len(categoria["pacotes"])
+            print()
+
+        print("=" * 60)
+        print(f"🎯 TOTAL: {total_sucessos}/{total_pacotes} pacotes instalados")
+        if total_sucessos < total_pacotes:
+            print("💡 Alguns pacotes podem precisar de execução como Administrador")
+        return total_sucessos
+
+    def _pre_baixar_pesados(self, plano):
+        """Wheels grandes do plano vão antes para o wheelhouse, em faixas retomáveis (pack_download)"""
+        nomes = [pacote for pacote, _, _ in plano]
+        if pack_wheelhouse.OFFLINE or not any((self._info(p)["tamanho_mb"] or 0) >= pack_download.LIMIAR_MB
+                                              for p in nomes):
+            return
+        # Mesma resolução que a atualização vai fazer (nomes sem versão fixa)
+        lote = pack_batch.BatchInstaller(extra_args=["--upgrade", *self._argumentos_indice(nomes)])
+        resultados = lote.baixar_grandes(self._com_acompanhantes(nomes))
+        for nome, (ok, erro, _) in resultados.items():
+            if not ok:
+                print(f"⚠️  {nome}: {erro} - o pip vai tentar baixar por conta própria")
+
+    def atualizar_pacotes(self, pacotes):
+        """Atualiza só os desatualizados: plano pelo índice + uma única chamada ao resolver"""
+        pacotes = list(dict.fromkeys(pacotes))
+        print(f"🔍 Consultando o índice ({pack_outdated.indice_configurado()})...")
+        plano, erros = pack_outdated.calcular_plano(pacotes, indices_extras=self.indices_extras(pacotes))
+
+        for pacote, erro in erros:
+            print(f"⚠️  {pacote}: {erro}")
+
+        if not plano:
+            print(f"✅ Todos os {len(pacotes)} pacotes já estão na versão mais recente!")
+            return 0
+
+        print("📋 PLANO DE ATUALIZAÇÃO:")
+        for pacote, versao_atual, versao_nova in plano:
+            print(f"   • {pacote}: {versao_atual} → {versao_nova}")
+        print("-" * 50)
+
+        self._pre_baixar_pesados(plano)
+        nomes = " ".join(pacote for pacote, _, _ in plano)
+        result = pack_backend.executar(self.comando_atualizacao(plano), descricao=f"atualização: {nomes}")
+        pack_index.invalidar()
+
+        sucessos = 0
+        retidos = 0
+        for pacote, versao_atual, versao_nova in plano:
+            versao_instalada = self.get_current_version(pacote)
+            situacao = pack_outdated.situacao_atualizacao(versao_atual, versao_instalada, versao_nova,
+                                                          result.returncode == 0)
+            if situacao == pack_outdated.ATUALIZADO:
+                print(f"✅ {pacote}: {versao_atual} → {versao_instalada}")
+                sucessos += 1
+            elif situacao == pack_outdated.RETIDO:
+                print(f"⏸️  {pacote}: {versao_atual} → {versao_instalada} (retido pelas dependências; "
+                      f"mais recente: {versao_nova})")
+                retidos += 1
+            else:
+                print(f"❌ {pacote}: continua em {versao_instalada}")
+
+        if result.returncode != 0 and result.stderr:
+            print(f"   {result.stderr.strip().splitlines()[-1]}")
+
+        print(f"\n📊 {sucessos}/{len(plano)} pacotes atualizados!")
+        if retidos:
+            print(f"   ({retidos} retidos numa versão compatível com as dependências)")
+        print(f"   ({len(pacotes) - len(plano)} já estavam na versão mais recente)")
+        return sucessos
+
+    def atualizar_categoria(self, pacotes_dict, categoria_nome):
+        """Atualiza os pacotes desatualizados de uma categoria"""
+        print(f"🔄 ATUALIZANDO {categoria_nome.upper()}")
+        print("=" * 60)
+        sucessos = self.atualizar_pacotes(list(pacotes_dict))
+        print("=" * 60)
+        return sucessos
+
+    def atualizar_tudo(self):
+        """Atualiza os pacotes desatualizados de todas as categorias"""
+        print("🔄 ATUALIZANDO TODOS OS PACOTES")
+        print("=" * 60)
+        sucessos = self.atualizar_pacotes(list(self.todos_pacotes()))
+        print("=" * 60)
+        return sucessos
+
+    def _escolher_pacote(self, pergunta, linha):
+        """Lista os pacotes numerados e retorna o escolhido (ou None)"""
+        pacotes_lista = list(self.todos_pacotes().items())
+        largura = max(len(pacote) for pacote, _ in pacotes_lista) + 2
+
+        for i, (pacote, descricao) in enumerate(pacotes_lista, 1):
+            print(f"{i:2d}. {linha(pacote.ljust(largura), pacote, descricao)}")
+
+        print(f"{len(pacotes_lista)+1:2d}. Voltar")
+        print("=" * 60)
+
+        try:
+            escolha = int(input(pergunta))
+        except ValueError:
+            print("❌ Por favor, digite um número válido.")
+            return None
+
+        if 1 <= escolha <= len(pacotes_lista):
+            return pacotes_lista[escolha-1][0]
+        if escolha != len(pacotes_lista) + 1:
+            print("❌ Opção inválida!")
+        return None
+
+    def instalar_pacote_individual(self):
+        """Instala um pacote específico individualmente"""
+        print("🎯 INSTALAR PACOTE INDIVIDUAL")
+        print("=" * 60)
+        print("📦 Pacotes disponíveis:")
+        print("-" * 60)
+
+        def linha(coluna, pacote, descricao):
+            status = "✅" if self.get_current_version(pacote) != pack_index.NAO_INSTALADO else "❌"
+            return f"{status} {coluna}- {descricao}"
+
+        pacote = self._escolher_pacote("\nEscolha o número do pacote: ", linha)
+        if pacote:
+            self.instalar_pacotes([pacote])
+
+    def atualizar_pacote_individual(self):
+        """Atualiza um pacote específico individualmente"""
+        print("🔄 ATUALIZAR PACOTE INDIVIDUAL")
+        print("=" * 60)
+        print("📦 Pacotes disponíveis para atualização:")
+        print("-" * 60)
+
+        def linha(coluna, pacote, descricao):
+            versao = self.get_current_version(pacote)
+            return f"{coluna}- {'v' + versao if versao != pack_index.NAO_INSTALADO else '❌ Não instalado'}"
+
+        pacote = self._escolher_pacote("\nEscolha o número do pacote para atualizar: ", linha)
+        if not pacote:
+            return
+        if self.get_current_version(pacote) == pack_index.NAO_INSTALADO:
+            print(f"❌ {pacote} não está instalado!")
+            print("💡 Use a opção de instalação individual primeiro")
+        else:
+            self.atualizar_pacotes([pacote])
+
+    def opcoes_extras(self):
+        """Opções adicionais do menu [(rótulo, função)] - sobrescrito pelas Fases"""
+        return []
+
+    def menu(self):
+        """Menu interativo da Fase, montado a partir do catálogo"""
+        print(self.definicao["titulo"])
+        print("=" * 60)
+        if self.definicao.get("subtitulo"):
+            print(self.definicao["subtitulo"])
+            print("=" * 60)
+
+        opcoes = [("Verificar status de todos os pacotes", self.verificar_tudo)]
+        if self.definicao.get("instalar_todos"):
+            opcoes.append((self.definicao["instalar_todos"], self.instalar_todos))
+        for categoria in self.categorias:
+            opcoes.append((categoria["rotulo"],
+                           lambda c=categoria: self.instalar_categoria(c["pacotes"], c["nome"])))
+        opcoes.append(("Instalar pacote INDIVIDUAL", self.instalar_pacote_individual))
+        opcoes.append(("Atualizar pacote INDIVIDUAL", self.atualizar_pacote_individual))
+        opcoes.extend(self.opcoes_extras())
+        sair = str(len(opcoes) + 1)
+
+        while True:
+            print(f"\n{self.definicao.get('cabecalho', '🎯 MENU:')}")
+            for i, (rotulo, _) in enumerate(opcoes, 1):
+                print(f"{i}. {rotulo}")
+            print(f"{sair}. {self.definicao.get('voltar', 'Sair')}")
+            print("-" * 40)
+
+            opcao = input(f"Escolha (1-{sair}): ").strip()
+
+            if opcao == sair:
+                print(self.definicao.get("mensagem_voltar", "Até logo! 👋"))
+                break
+            if opcao.isdigit() and 1 <= int(opcao) < len(opcoes) + 1:
+                opcoes[int(opcao) - 1][1]()
+            else:
+                print("❌ Opção inválida!")
+
+            pack_progress.pausar("\n👆 Pressione Enter para continuar...")
+
+    def mostrar_versoes(self):
+        """Lista a versão atual de cada pacote do menu"""
+        print("📋 Versões atuais:")
+        for pacote in self.todos_pacotes():
+            print(f"• {pacote}: {self.get_current_version(pacote)}")
+
+    def menu_simples(self, modo="instalar"):
+        """Menu dos scripts avulsos de install/update (um pacote por opção + todos)"""
+        atualizar = modo == "atualizar"
+        pacotes = self.todos_pacotes()
+
+        instalados = [f"{p} ({self.get_current_version(p)})" for p in pacotes
+                      if self.get_current_version(p) != pack_index.NAO_INSTALADO]
+        if instalados:
+            print("📦 Pacotes já instalados:")
+            for pkg in instalados:
+                print(f"• {pkg}")
+
+        while True:
+            print("\n" + "=" * 60)
+            print(f"{self.definicao['titulo']} - {'ATUALIZAÇÃO' if atualizar else 'INSTALAÇÃO'}")
+            for i, (pacote, descricao) in enumerate(pacotes.items(), 1):
+                acao = "Atualizar apenas" if atualizar else "Instalar"
+                print(f"{i}. {acao} {pacote} - {descricao}")
+            n = len(pacotes)
+            print(f"{n+1}. {'Atualizar' if atualizar else 'Instalar'} TODOS")
+            print(f"{n+2}. Verificar versões atuais")
+            print(f"{n+3}. Sair")
+
+            choice = input(f"\nEscolha uma opção (1-{n+3}): ").strip()
+            escolha = int(choice) if choice.isdigit() else 0
+
+            if 1 <= escolha <= n:
+                pacote = list(pacotes)[escolha-1]
+                if atualizar:
+                    self.atualizar_pacotes([pacote])
+                else:
+                    self.instalar_pacotes([pacote])
+            elif escolha == n + 1:
+                if atualizar:
+                    self.atualizar_tudo()
+                else:
+                    self.instalar_todos()
+            elif escolha == n + 2:
+                self.mostrar_versoes()
+            elif escolha == n + 3:
+                print("Até logo! 👋")
+                break
+            else:
+                print("❌ Opção inválida!")
+
+            pack_progress.pausar("\n👆 Pressione Enter para voltar ao menu...")
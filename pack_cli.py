@@ -0,0 +1,296 @@
+# PACK CLI: interface não interativa para automação (Ansible, CI, frotas)
+#
+#   python pack_cli.py status [alvo]
+#   python pack_cli.py install <alvo>
+#   python pack_cli.py update --all | <alvo>
+#   python pack_cli.py verify [alvo]
+#   python pack_cli.py benchmark [--salvar-baseline]
+#
+# alvo = menu do catálogo (fase2), menu.categoria (fase2.dl) ou só a
+# categoria (dl) quando o id não é ambíguo; sem alvo vale o catálogo inteiro.
+#
+# Nunca chama input(). O stdout recebe só JSON lines (um objeto por pacote e
+# um "resumo" no fim, com host e tempos) - fácil de agregar de centenas de
+# máquinas. O log legível vai para o stderr (ou some com --quiet).
+# Código de saída: 0 se tudo deu certo, 1 se algum pacote falhou.
+
+import argparse
+import contextlib
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import pack_backend
+import pack_batch
+import pack_catalog
+import pack_falhas
+import pack_index
+import pack_ml_benchmark
+import pack_outdated
+import pack_progress
+import pack_trace
+import pack_wheelhouse
+
+HOST = socket.gethostname()
+
+
+class SaidaJSON:
+    """Escreve um objeto JSON por linha, com host e timestamp"""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def emitir(self, evento, **campos):
+        registro = {"evento": evento, "host": HOST, "ts": round(time.time(), 3), **campos}
+        self.stream.write(json.dumps(registro, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+
+def _versao(pacote):
+    versao = pack_index.get_current_version(pacote)
+    return None if versao in (pack_index.NAO_INSTALADO, pack_index.NAO_ENCONTRADA) else versao
+
+
+def resolver_alvo(alvo):
+    """Converte o alvo da linha de comando em (menu_id, lista de pacotes)"""
+    if not alvo:
+        return None, pack_catalog.pacotes_do_menu()
+
+    menus = pack_catalog.carregar()["menus"]
+    menu_id, _, categoria_id = alvo.partition(".")
+    if menu_id in menus and not categoria_id:
+        return menu_id, pack_catalog.pacotes_do_menu(menu_id)
+    if menu_id in menus:
+        for categoria in menus[menu_id]["categorias"]:
+            if categoria["id"] == categoria_id:
+                return menu_id, list(categoria["pacotes"])
+        raise ValueError(f"categoria '{categoria_id}' não existe em '{menu_id}'")
+
+    encontrados = [(m, c) for m, definicao in menus.items()
+                   for c in definicao["categorias"] if c["id"] == alvo]
+    if len(encontrados) == 1:
+        return encontrados[0][0], list(encontrados[0][1]["pacotes"])
+    if encontrados:
+        opcoes = ", ".join(f"{m}.{c['id']}" for m, c in encontrados)
+        raise ValueError(f"alvo ambíguo '{alvo}': use {opcoes}")
+    raise ValueError(f"alvo desconhecido '{alvo}'")
+
+
+def cmd_status(saida, menu_id, pacotes):
+    """Versão instalada de cada pacote"""
+    faltantes = 0
+    inicio_total = time.perf_counter()
+    with pack_trace.span(f"status {menu_id or 'catálogo'}", "status", pacotes=len(pacotes)):
+        for pacote in pacotes:
+            inicio = time.perf_counter()
+            versao = _versao(pacote)
+            faltantes += versao is None
+            saida.emitir("status", pacote=pacote, instalado=versao is not None, versao=versao,
+                         segundos=round(time.perf_counter() - inicio, 6))
+    saida.emitir("resumo", comando="status", alvo=menu_id, total=len(pacotes),
+                 instalados=len(pacotes) - faltantes, faltantes=faltantes,
+                 segundos=round(time.perf_counter() - inicio_total, 3))
+    return 0
+
+
+def cmd_install(saida, menu_id, pacotes):
+    """Instala em lote os pacotes que faltam"""
+    instalador = pack_catalog.CatalogInstaller(menu_id)
+    inicio_total = time.perf_counter()
+    pendentes = []
+    for pacote in pacotes:
+        versao = _versao(pacote)
+        if versao is None:
+            pendentes.append(pacote)
+        else:
+            saida.emitir("install", pacote=pacote, ok=True, versao=versao, ja_instalado=True, segundos=0.0)
+
+    falhas = 0
+    if pendentes:
+        lote, extra_args = instalador.lote_de_instalacao(pendentes)
+        batch = pack_batch.BatchInstaller(extra_args=extra_args)
+        inicio = time.perf_counter()
+        resultados = batch.instalar(lote)
+        segundos_lote = time.perf_counter() - inicio
+        for pacote in pendentes:
+            ok, mensagem = resultados[pacote]
+            falhas += not ok
+            saida.emitir("install", pacote=pacote, ok=ok, ja_instalado=False,
+                         versao=mensagem if ok else None, erro=None if ok else mensagem,
+                         falha=None if ok else batch.classes.get(pacote),
+                         segundos_download=round(batch.tempos.get(pack_index.normalizar_nome(pacote), 0.0), 3),
+                         segundos_instalacao=round(batch.tempo_instalacao, 3),
+                         segundos_lote=round(segundos_lote, 3))
+
+    retentativas, segundos_perdidos, _ = pack_falhas.resumo()
+    saida.emitir("resumo", comando="install", alvo=menu_id, backend=pack_backend.atual().nome,
+                 total=len(pacotes), instalados_agora=len(pendentes) - falhas, falhas=falhas,
+                 retentativas=retentativas, segundos_perdidos=segundos_perdidos,
+                 segundos=round(time.perf_counter() - inicio_total, 3))
+    return 1 if falhas else 0
+
+
+def cmd_update(saida, menu_id, pacotes):
+    """Atualiza só os desatualizados em uma única transação (pacotes ausentes são ignorados)"""
+    instalador = pack_catalog.CatalogInstaller(menu_id)
+    inicio_total = time.perf_counter()
+    instalados = [p for p in pacotes if _versao(p) is not None]
+    plano, erros = pack_outdated.calcular_plano(instalados, indices_extras=instalador.indices_extras(instalados))
+    segundos_plano = time.perf_counter() - inicio_total
+
+    for pacote, erro in erros:
+        saida.emitir("update", pacote=pacote, ok=False, erro=erro)
+
+    falhas = len(erros)
+    retidos = 0
+    if plano:
+        inicio = time.perf_counter()
+        result = pack_backend.executar(instalador.comando_atualizacao(plano), mostrar=False,
+                                       descricao=f"update: {len(plano)} pacotes")
+        segundos_transacao = time.perf_counter() - inicio
+        pack_index.invalidar()
+        erro = None
+        if result.returncode != 0 and result.stderr:
+            erro = result.stderr.strip().splitlines()[-1]
+        falha = result.falha
+        for pacote, versao_atual, versao_nova in plano:
+            instalada = _versao(pacote)
+            situacao = pack_outdated.situacao_atualizacao(versao_atual, instalada or pack_index.NAO_INSTALADO,
+                                                          versao_nova, result.returncode == 0)
+            ok = situacao != pack_outdated.FALHOU
+            falhas += not ok
+            retidos += situacao == pack_outdated.RETIDO
+            saida.emitir("update", pacote=pacote, ok=ok, situacao=situacao,
+                         de=None if versao_atual == pack_index.NAO_INSTALADO else versao_atual,
+                         para=versao_nova, versao=instalada, erro=None if ok else (erro or "versão não mudou"),
+                         falha=None if ok else falha,
+                         segundos_transacao=round(segundos_transacao, 3))
+
+    retentativas, segundos_perdidos, _ = pack_falhas.resumo()
+    saida.emitir("resumo", comando="update", alvo=menu_id, backend=pack_backend.atual().nome,
+                 total=len(pacotes), instalados=len(instalados), desatualizados=len(plano), falhas=falhas,
+                 retidos=retidos,
+                 retentativas=retentativas, segundos_perdidos=segundos_perdidos,
+                 segundos_plano=round(segundos_plano, 3),
+                 segundos=round(time.perf_counter() - inicio_total, 3))
+    return 1 if falhas else 0
+
+
+def _problemas_pip_check():
+    """{pacote: [problemas]} a partir do `pip check`"""
+    with pack_trace.span("pip check", "verify", mede_cpu=True):
+        result = subprocess.run([sys.executable, "-m", "pip", "check"], capture_output=True, text=True)
+    problemas = {}
+    for linha in result.stdout.splitlines():
+        if linha.strip() and not linha.startswith("No broken"):
+            nome = pack_index.normalizar_nome(linha.split()[0])
+            problemas.setdefault(nome, []).append(linha.strip())
+    return problemas
+
+
+def cmd_verify(saida, menu_id, pacotes):
+    """Confere se os pacotes estão instalados e com dependências consistentes"""
+    inicio_total = time.perf_counter()
+    problemas = _problemas_pip_check()
+    com_falha = 0
+    for pacote in pacotes:
+        versao = _versao(pacote)
+        do_pacote = problemas.get(pack_index.normalizar_nome(pacote), [])
+        ok = versao is not None and not do_pacote
+        com_falha += not ok
+        saida.emitir("verify", pacote=pacote, ok=ok, instalado=versao is not None, versao=versao,
+                     problemas=do_pacote)
+    saida.emitir("resumo", comando="verify", alvo=menu_id, total=len(pacotes), falhas=com_falha,
+                 problemas_ambiente=sum(len(p) for p in problemas.values()),
+                 segundos=round(time.perf_counter() - inicio_total, 3))
+    return 1 if com_falha else 0
+
+
+def cmd_benchmark(saida, args):
+    """Benchmark de CPU do stack de ML comparado com a baseline gravada"""
+    inicio_total = time.perf_counter()
+    caminho = args.baseline or pack_ml_benchmark.caminho_baseline()
+    resultados = pack_ml_benchmark.medir_tudo()
+    baseline = None if args.salvar_baseline else pack_ml_benchmark.ler_baseline(caminho)
+
+    falhas = 0
+    for framework, resultado in resultados.items():
+        if "erro" in resultado:
+            falhas += 1
+            saida.emitir("benchmark", framework=framework, ok=False, erro=resultado["erro"])
+    comparacao = pack_ml_benchmark.comparar(resultados, baseline or {}, args.tolerancia)
+    for framework, teste, gflops, gflops_ref, regrediu in comparacao:
+        resultado = resultados[framework]
+        falhas += regrediu
+        saida.emitir("benchmark", framework=framework, teste=teste, ok=not regrediu, gflops=round(gflops, 2),
+                     gflops_baseline=gflops_ref and round(gflops_ref, 2), versao=resultado["versao"], threads=resultado["threads"],
+                     kernels=resultado["kernels"])
+
+    if args.salvar_baseline:
+        pack_ml_benchmark.salvar_baseline(caminho, {f: r for f, r in resultados.items() if "erro" not in r})
+    saida.emitir("resumo", comando="benchmark", cpu=pack_ml_benchmark.modelo_cpu(),
+                 baseline=caminho if (baseline or args.salvar_baseline) else None,
+                 baseline_salva=args.salvar_baseline, testes=len(comparacao), falhas=falhas,
+                 segundos=round(time.perf_counter() - inicio_total, 3))
+    return 1 if falhas or not resultados else 0
+
+
+def main(argv=None):
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="CLI não interativa dos pacotes pack_* (saída em JSON lines)")
+    parser.add_argument("--quiet", action="store_true", help="descartar o log legível (stderr)")
+    parser.add_argument("--offline", action="store_true", help="instalar apenas a partir do wheelhouse")
+    parser.add_argument("--backend", choices=["auto", "pip", "uv"], help="backend de instalação")
+    parser.add_argument("--no-pause", action="store_true", help="aceito por compatibilidade (a CLI nunca pausa)")
+    parser.add_argument("--trace", action="store_true", help="gravar um trace das etapas (também PACK_TRACE=1)")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p_status = sub.add_parser("status", help="versão instalada de cada pacote")
+    p_status.add_argument("alvo", nargs="?")
+    p_install = sub.add_parser("install", help="instalar um menu ou categoria do catálogo")
+    p_install.add_argument("alvo")
+    p_update = sub.add_parser("update", help="atualizar os pacotes desatualizados")
+    p_update.add_argument("alvo", nargs="?")
+    p_update.add_argument("--all", action="store_true", help="todos os pacotes do catálogo")
+    p_verify = sub.add_parser("verify", help="conferir instalação e dependências (pip check)")
+    p_verify.add_argument("alvo", nargs="?")
+    p_bench = sub.add_parser("benchmark", help="benchmark de CPU do stack de ML contra a baseline")
+    p_bench.add_argument("--baseline", help="arquivo da baseline (padrão: no cache)")
+    p_bench.add_argument("--salvar-baseline", action="store_true", help="gravar o resultado como nova baseline")
+    p_bench.add_argument("--tolerancia", type=float, default=pack_ml_benchmark.TOLERANCIA)
+
+    args = parser.parse_args(argv)
+    if args.comando == "update" and not (args.all or args.alvo):
+        parser.error("informe um alvo ou --all")
+
+    # Os módulos também leem sys.argv ao serem importados; aqui valem as
+    # opções do argv recebido (main([...]) chamado de outro programa)
+    pack_wheelhouse.OFFLINE = args.offline or pack_wheelhouse.OFFLINE
+    pack_trace.ATIVO = args.trace or pack_trace.ATIVO
+
+    try:
+        menu_id, pacotes = resolver_alvo(None if getattr(args, "all", False) else getattr(args, "alvo", None))
+    except ValueError as e:
+        parser.error(str(e))
+
+    # Sem perguntas: confirmações assumem "s" e pausas são ignoradas
+    pack_progress.SEM_PAUSA = True
+    saida = SaidaJSON(sys.stdout)
+    comandos = {"status": cmd_status, "install": cmd_install, "update": cmd_update, "verify": cmd_verify}
+
+    with open(os.devnull, "w") if args.quiet else contextlib.nullcontext(sys.stderr) as log:
+        with contextlib.redirect_stdout(log):
+            # Dentro do redirecionamento: nenhum aviso da seleção chega ao stdout
+            pack_backend.backend = pack_backend.selecionar(args.backend or os.environ.get("PACK_BACKEND", "auto"))
+            if args.comando == "benchmark":
+                codigo = cmd_benchmark(saida, args)
+            else:
+                codigo = comandos[args.comando](saida, menu_id, pacotes)
+    sys.exit(codigo)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+# PACK DOWNLOAD: downloads grandes em faixas paralelas e retomáveis
+#
+# Wheels de centenas de MB (torch, tensorflow) chegam pelo pip num único
+# stream: uma queda no meio recomeça do zero. Aqui o arquivo é dividido em
+# PARTES faixas (HTTP Range) baixadas em paralelo direto para um arquivo
+# .part pré-alocado. O progresso de cada faixa fica num .part.json ao lado,
+# então uma execução interrompida (rede, Ctrl+C, queda de energia) continua
+# de onde parou. No fim o sha256 é conferido antes de o arquivo ganhar o
+# nome final - se não bater, o parcial é descartado.
+#
+# Os parciais ficam em <cache>/downloads. Servidores sem suporte a Range
+# caem num download único, sem retomada.
+#
+# Usado pelo pack_batch para wheels acima de LIMIAR_MB (instalação e
+# pré-download das atualizações da categoria machine_learning).
+#
+#   python pack_download.py <url> [--sha256 H] [--destino pasta] [--partes N]
+
+import argparse
+import json
+import os
+import ssl
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote, urlparse
+
+import pack_falhas
+import pack_index
+
+
+def _inteiro_do_ambiente(nome, padrao):
+    try:
+        return max(1, int(os.environ.get(nome, padrao)))
+    except ValueError:
+        return padrao
+
+
+# Faixas baixadas em paralelo e tamanho mínimo para usar este caminho
+PARTES = _inteiro_do_ambiente("PACK_DOWNLOAD_PARTES", 4)
+LIMIAR_MB = _inteiro_do_ambiente("PACK_DOWNLOAD_LIMIAR_MB", 50)
+TIMEOUT = 30
+BLOCO = 1024 * 1024
+# O .part.json é regravado a cada SALVAR_A_CADA bytes recebidos
+SALVAR_A_CADA = 8 * 1024 * 1024
+
+_contexto_ssl = None
+_trava_ssl = threading.Lock()
+
+
+class DownloadErro(Exception):
+    """Falha definitiva de um download (rede esgotada, HTTP 4xx, sha256 diferente)"""
+
+    def __init__(self, mensagem, classe=pack_falhas.REDE):
+        super().__init__(mensagem)
+        self.classe = classe
+
+
+def _contexto():
+    global _contexto_ssl
+    with _trava_ssl:
+        if _contexto_ssl is None:
+            _contexto_ssl = ssl.create_default_context()
+        return _contexto_ssl
+
+
+def _abrir(url, faixa=None, timeout=TIMEOUT):
+    cabecalhos = {"User-Agent": "python-tool-kit", "Accept-Encoding": "identity"}
+    if faixa:
+        cabecalhos["Range"] = f"bytes={faixa[0]}-{faixa[1]}"
+    requisicao = urllib.request.Request(url, headers=cabecalhos)
+    if urlparse(url).scheme == "https":
+        return urllib.request.urlopen(requisicao, timeout=timeout, context=_contexto())
+    return urllib.request.urlopen(requisicao, timeout=timeout)
+
+
+def sondar(url):
+    """(tamanho ou None, aceita Range) com um GET de um único byte"""
+    with _abrir(url, (0, 0)) as resposta:
+        if resposta.status == 206:
+            total = resposta.headers.get("Content-Range", "").rpartition("/")[2]
+            return (int(total) if total.isdigit() else None), True
+        tamanho = resposta.headers.get("Content-Length")
+        return (int(tamanho) if tamanho and tamanho.isdigit() else None), False
+
+
+def ler_faixa(url, inicio, fim):
+    """Bytes [inicio, fim] (fim inclusivo) de `url`; exige suporte a Range"""
+    with _abrir(url, (inicio, fim)) as resposta:
+        if resposta.status != 206:
+            raise DownloadErro(f"o servidor ignorou o Range (HTTP {resposta.status})")
+        return resposta.read()
+
+
+def diretorio_parciais():
+    caminho = os.path.join(pack_index.diretorio_cache(), "downloads")
+    os.makedirs(caminho, exist_ok=True)
+    return caminho
+
+
+def nome_do_arquivo(url):
+    return os.path.basename(unquote(urlparse(url).path)) or "download"
+
+
+def _dividir(tamanho, partes):
+    """Faixas [inicio, fim, recebidos] (fim inclusivo) de tamanhos parecidos"""
+    partes = max(1, min(partes, tamanho // BLOCO or 1))
+    passo = -(-tamanho // partes)
+    return [[inicio, min(inicio + passo, tamanho) - 1, 0] for inicio in range(0, tamanho, passo)]
+
+
+def _recuperavel(erro):
+    # 4xx (exceto timeout/limite de taxa) não melhora repetindo
+    if isinstance(erro, urllib.error.HTTPError):
+        return erro.code >= 500 or erro.code in (408, 429)
+    return isinstance(erro, (OSError, EOFError, ValueError))
+
+
+class _Download:
+    def __init__(self, url, destino, sha256, tamanho, partes, mostrar):
+        self.url = url
+        self.destino = destino
+        self.parcial = destino + ".part"
+        self.arquivo_estado = self.parcial + ".json"
+        self.sha256 = sha256
+        self.tamanho = tamanho
+        self.mostrar = mostrar
+        self.trava = threading.Lock()
+        self.desde_ultimo_salvamento = 0
+        self.proximo_aviso = 10
+        self.inicio = time.perf_counter()
+        self.recebidos_nesta_execucao = 0
+        self.faixas = self._retomar() or self._novo(partes)
+
+    def _retomar(self):
+        """Faixas do .part.json, se ele for deste mesmo arquivo"""
+        try:
+            with open(self.arquivo_estado, encoding="utf-8") as fp:
+                estado = json.load(fp)
+        except (OSError, ValueError):
+            return None
+        if (estado.get("url") != self.url or estado.get("tamanho") != self.tamanho
+                or estado.get("sha256") != self.sha256 or not os.path.exists(self.parcial)
+                or os.path.getsize(self.parcial) != self.tamanho):
+            return None
+        return estado["faixas"]
+
+    def _novo(self, partes):
+        with open(self.parcial, "wb") as fp:
+            fp.truncate(self.tamanho)
+        faixas = _dividir(self.tamanho, partes)
+        self._salvar(faixas)
+        return faixas
+
+    def _salvar(self, faixas=None):
+        temporario = f"{self.arquivo_estado}.{os.getpid()}.tmp"
+        with open(temporario, "w", encoding="utf-8") as fp:
+            json.dump({"url": self.url, "tamanho": self.tamanho, "sha256": self.sha256,
+                       "faixas": faixas or self.faixas}, fp)
+        os.replace(temporario, self.arquivo_estado)
+
+    @property
+    def recebidos(self):
+        return sum(faixa[2] for faixa in self.faixas)
+
+    def _avisar(self):
+        percentual = 100 * self.recebidos // self.tamanho
+        if not self.mostrar or percentual < self.proximo_aviso:
+            return
+        self.proximo_aviso = percentual // 10 * 10 + 10
+        segundos = max(time.perf_counter() - self.inicio, 1e-6)
+        print(f"   ⬇️  {os.path.basename(self.destino)}: {percentual}% "
+              f"({self.recebidos / 1e6:.0f}/{self.tamanho / 1e6:.0f} MB, "
+              f"{self.recebidos_nesta_execucao / 1e6 / segundos:.1f} MB/s)", flush=True)
+
+    def _baixar_faixa(self, faixa):
+        tentativa = 0
+        while faixa[0] + faixa[2] <= faixa[1]:
+            recebido_antes = faixa[2]
+            try:
+                with _abrir(self.url, (faixa[0] + faixa[2], faixa[1])) as resposta:
+                    if resposta.status != 206:
+                        raise DownloadErro(f"o servidor ignorou o Range (HTTP {resposta.status})")
+                    # Sem buffer: o que foi contado em faixa[2] já está no arquivo
+                    with open(self.parcial, "r+b", buffering=0) as fp:
+                        fp.seek(faixa[0] + faixa[2])
+                        while faixa[0] + faixa[2] <= faixa[1]:
+                            bloco = resposta.read(min(BLOCO, faixa[1] + 1 - faixa[0] - faixa[2]))
+                            if not bloco:
+                                raise EOFError("conexão encerrada antes do fim da faixa")
+                            vista = memoryview(bloco)
+                            while vista:
+                                vista = vista[fp.write(vista):]
+                            with self.trava:
+                                faixa[2] += len(bloco)
+                                self.recebidos_nesta_execucao += len(bloco)
+                                self.desde_ultimo_salvamento += len(bloco)
+                                if self.desde_ultimo_salvamento >= SALVAR_A_CADA:
+                                    self.desde_ultimo_salvamento = 0
+                                    self._salvar()
+                                self._avisar()
+            except DownloadErro:
+                raise
+            except Exception as e:
+                # Quedas esparsas num download longo não se acumulam: a conta recomeça a cada avanço
+                tentativa = 1 if faixa[2] > recebido_antes else tentativa + 1
+                if not _recuperavel(e) or tentativa > pack_falhas.TENTATIVAS_REDE:
+                    raise DownloadErro(f"faixa {faixa[0]}-{faixa[1]}: {e}") from e
+                pausa = pack_falhas.espera(tentativa)
+                print(f"🔁 {os.path.basename(self.destino)}: {e} - retomando a faixa em {pausa:.0f}s", flush=True)
+                time.sleep(pausa)
+
+    def executar(self):
+        pendentes = [f for f in self.faixas if f[0] + f[2] <= f[1]]
+        if self.mostrar and self.recebidos:
+            print(f"   ↪️  Retomando {os.path.basename(self.destino)} em "
+                  f"{self.recebidos / 1e6:.0f}/{self.tamanho / 1e6:.0f} MB", flush=True)
+        self.proximo_aviso = 100 * self.recebidos // self.tamanho // 10 * 10 + 10
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, len(pendentes))) as pool:
+                for futuro in [pool.submit(self._baixar_faixa, f) for f in pendentes]:
+                    futuro.result()
+        finally:
+            with self.trava:
+                self._salvar()
+
+
+def _baixar_sem_faixas(url, parcial, mostrar):
+    """Download em um único stream (servidor sem Range): sem retomada"""
+    if mostrar:
+        print(f"   ⬇️  {os.path.basename(parcial[:-5])}: o servidor não aceita Range - download único", flush=True)
+    with _abrir(url) as resposta, open(parcial, "wb") as fp:
+        for bloco in iter(lambda: resposta.read(BLOCO), b""):
+            fp.write(bloco)
+
+
+def baixar(url, destino=None, sha256=None, partes=PARTES, mostrar=True):
+    """Baixa `url` em faixas paralelas, retomando um parcial anterior; retorna o caminho final
+
+    destino=None grava em <cache>/downloads/<arquivo>. Com sha256, o
+    arquivo só ganha o nome final se o hash conferir.
+    """
+    import pack_wheelhouse
+
+    destino = destino or os.path.join(diretorio_parciais(), nome_do_arquivo(url))
+    os.makedirs(os.path.dirname(os.path.abspath(destino)), exist_ok=True)
+    if _pronto(destino, sha256):
+        return destino
+
+    def avisar():
+        if mostrar:
+            print(f"   ⏳ {os.path.basename(destino)}: outro processo está baixando - aguardando", flush=True)
+
+    # Um processo por parcial: dois escrevendo o mesmo .part/.part.json o corromperiam.
+    # Sem timeout - quem segura a trava está baixando; ao terminar, o arquivo já está pronto
+    with pack_wheelhouse.travar_arquivo(destino + ".part.lock", timeout=None, ao_esperar=avisar):
+        if _pronto(destino, sha256):
+            return destino
+        return _baixar_travado(url, destino, sha256, partes, mostrar)
+
+
+def _pronto(destino, sha256):
+    import pack_wheelhouse
+
+    return os.path.exists(destino) and (sha256 is None or pack_wheelhouse.sha256_arquivo(destino) == sha256)
+
+
+def _baixar_travado(url, destino, sha256, partes, mostrar):
+    """Corpo de baixar(), com a trava do parcial já obtida"""
+    import pack_wheelhouse
+
+    try:
+        tamanho, aceita_faixas = sondar(url)
+        if aceita_faixas and tamanho:
+            download = _Download(url, destino, sha256, tamanho, partes, mostrar)
+            download.executar()
+            parcial = download.parcial
+        else:
+            parcial = destino + ".part"
+            _baixar_sem_faixas(url, parcial, mostrar)
+    except DownloadErro:
+        raise
+    except Exception as e:
+        raise DownloadErro(f"{nome_do_arquivo(url)}: {e}") from e
+
+    if sha256:
+        obtido = pack_wheelhouse.sha256_arquivo(parcial)
+        if obtido != sha256:
+            for caminho in (parcial, parcial + ".json"):
+                if os.path.exists(caminho):
+                    os.remove(caminho)
+            raise DownloadErro(f"{nome_do_arquivo(url)}: sha256 não confere (esperado {sha256[:12]}…, "
+                               f"obtido {obtido[:12]}…) - parcial descartado", pack_falhas.HASH)
+    os.replace(parcial, destino)
+    if os.path.exists(parcial + ".json"):
+        os.remove(parcial + ".json")
+    return destino
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Download em faixas paralelas e retomáveis")
+    parser.add_argument("url")
+    parser.add_argument("--sha256", help="hash esperado do arquivo")
+    parser.add_argument("--destino", help="pasta de destino (padrão: <cache>/downloads)")
+    parser.add_argument("--partes", type=int, default=PARTES, help="faixas baixadas em paralelo")
+    args = parser.parse_args()
+
+    destino = os.path.join(args.destino, nome_do_arquivo(args.url)) if args.destino else None
+    inicio = time.perf_counter()
+    try:
+        caminho = baixar(args.url, destino, args.sha256, args.partes)
+    except DownloadErro as e:
+        print(f"❌ {e}")
+        if e.classe == pack_falhas.REDE:
+            print("💡 Rode de novo para retomar de onde parou")
+        sys.exit(1)
+    tamanho = os.path.getsize(caminho)
+    segundos = time.perf_counter() - inicio
+    print(f"✅ {caminho} ({tamanho / 1e6:.1f} MB em {segundos:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
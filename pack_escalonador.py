@@ -0,0 +1,441 @@
+# PACK ESCALONADOR: agenda downloads e instalações pelo tamanho dos artefatos
+#
+# Numa categoria que mistura wheels de GB (tensorflow, torch) com pacotes de
+# KB (joblib, mlxtend), baixar tudo para só então instalar deixa a máquina
+# parada esperando o maior download. Com os tamanhos lidos antes de começar
+# ("size" da PEP 691 no índice, o arquivo no wheelhouse ou uma sonda Range
+# de 1 byte), o escalonador:
+#   • divide os pacotes pedidos em unidades de instalação, da menor para a
+#     maior: cada uma leva as distribuições do seu fechamento que nenhuma
+#     unidade anterior levou e é instalada com --no-deps assim que as suas
+#     wheels chegam ao wheelhouse
+#   • baixa as wheels grandes desde o início (maior primeiro, no máximo
+#     PESADOS_EM_PARALELO por vez, cada uma em faixas pelo pack_download) e,
+#     ao mesmo tempo, as pequenas na ordem das unidades - as pequenas ficam
+#     prontas e são instaladas enquanto os downloads grandes continuam
+#   • limita as instalações pesadas simultâneas pela memória disponível e
+#     pelo tipo de disco (rotacional = uma por vez); a pressão de I/O já
+#     segura cada instalação no pack_progress
+#   • imprime a cada evento o ETA calculado com as taxas medidas de download
+#     e de instalação (as da execução anterior servem de ponto de partida)
+#
+# Usado pelo pack_batch quando o lote tem alguma wheel acima de
+# pack_download.LIMIAR_MB; a instalação final do lote a partir do wheelhouse
+# continua lá e confere que nada ficou faltando.
+
+import json
+import os
+import queue
+import sysconfig
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote, urlparse
+from urllib.request import url2pathname
+
+import pack_backend
+import pack_download
+import pack_index
+import pack_outdated
+import pack_wheelhouse
+
+try:
+    from packaging.requirements import InvalidRequirement, Requirement
+except ImportError:
+    from pip._vendor.packaging.requirements import InvalidRequirement, Requirement
+
+PESADOS_EM_PARALELO = 2
+# Uma wheel instalada ocupa em média ~3x o arquivo compactado
+FATOR_DESCOMPACTACAO = 3
+# Bytes/s usados antes da primeira medição
+TAXAS_PADRAO = {"download": 10e6, "instalacao": 40e6}
+MAX_WORKERS_TAMANHOS = 8
+
+
+def memoria_disponivel():
+    """MemAvailable em bytes (None fora do Linux)"""
+    try:
+        with open("/proc/meminfo", encoding="ascii") as fp:
+            for linha in fp:
+                if linha.startswith("MemAvailable:"):
+                    return int(linha.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def disco_rotacional(caminho):
+    """True se o caminho está num disco rotacional (Linux; False se não der para saber)"""
+    try:
+        dispositivo = os.stat(caminho).st_dev
+        base = f"/sys/dev/block/{os.major(dispositivo)}:{os.minor(dispositivo)}"
+        # Partições não têm queue/: o dado fica no disco pai
+        for arquivo in (f"{base}/queue/rotational", f"{base}/../queue/rotational"):
+            if os.path.exists(arquivo):
+                with open(arquivo, encoding="ascii") as fp:
+                    return fp.read().strip() == "1"
+    except (OSError, AttributeError):
+        pass
+    return False
+
+
+def _mb(tamanho):
+    return f"{(tamanho or 0) / 1e6:,.1f} MB"
+
+
+def _duracao(segundos):
+    segundos = max(0, int(segundos))
+    return f"{segundos // 60}m{segundos % 60:02d}s" if segundos >= 60 else f"{segundos}s"
+
+
+# ----------------------------------------------------------------------
+# Tamanhos
+# ----------------------------------------------------------------------
+
+def indices_do_lote(extra_args=()):
+    """URLs dos índices que o pip vai consultar (configurado + extras do lote e do ambiente)"""
+    extra_args = list(extra_args)
+    urls = [pack_outdated.indice_configurado()]
+    urls += os.environ.get("PIP_EXTRA_INDEX_URL", "").split()
+    for posicao, arg in enumerate(extra_args):
+        valor = extra_args[posicao + 1] if posicao + 1 < len(extra_args) else None
+        if arg in ("--index-url", "-i") and valor:
+            urls[0] = valor
+        elif arg == "--extra-index-url" and valor:
+            urls.append(valor)
+        elif arg.startswith(("--index-url=", "--extra-index-url=")):
+            urls.append(arg.split("=", 1)[1])
+    return list(dict.fromkeys(urls))
+
+
+def _tamanho_no_indice(clientes, item):
+    nome_arquivo = pack_download.nome_do_arquivo(item["url"])
+    for cliente in clientes:
+        try:
+            dados = cliente.projeto(item["name"])
+        except (OSError, ValueError):
+            continue
+        for arquivo in (dados or {}).get("files", []):
+            if arquivo.get("filename") == nome_arquivo and arquivo.get("size"):
+                return int(arquivo["size"])
+    return None
+
+
+def medir_tamanhos(itens, extra_args=()):
+    """Preenche item["tamanho"] (bytes ou None) de cada item resolvido; retorna {fonte: quantos}"""
+    clientes = [pack_outdated.SimpleIndexClient(url) for url in indices_do_lote(extra_args)]
+
+    def medir(item):
+        url = urlparse(item["url"])
+        if url.scheme == "file":
+            try:
+                item["tamanho"] = os.path.getsize(url2pathname(unquote(url.path)))
+                return "local"
+            except OSError:
+                pass
+        tamanho = _tamanho_no_indice(clientes, item)
+        if tamanho:
+            item["tamanho"] = tamanho
+            return "índice"
+        try:
+            tamanho, aceita_faixas = pack_download.sondar(item["url"])
+        except (OSError, ValueError):
+            tamanho, aceita_faixas = None, False
+        item["tamanho"] = tamanho
+        if tamanho and url.path.endswith(".whl"):
+            # Evita uma segunda sonda no pack_batch
+            item["grande"] = aceita_faixas and tamanho >= pack_download.LIMIAR_MB * 1e6
+        return "sonda" if tamanho else "desconhecido"
+
+    fontes = {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS_TAMANHOS) as pool:
+        for fonte in pool.map(medir, itens):
+            fontes[fonte] = fontes.get(fonte, 0) + 1
+    return fontes
+
+
+def pesado(item):
+    return (item.get("tamanho") or 0) >= pack_download.LIMIAR_MB * 1e6
+
+
+# ----------------------------------------------------------------------
+# Unidades de instalação
+# ----------------------------------------------------------------------
+
+def _dependencias(item, extras):
+    """(nome, extras) das dependências diretas de um item para os extras pedidos"""
+    dependencias = set()
+    for texto in item.get("requires") or []:
+        try:
+            requisito = Requirement(texto)
+        except InvalidRequirement:
+            continue
+        if requisito.marker is not None and not any(requisito.marker.evaluate({"extra": extra})
+                                                    for extra in (extras or ("",))):
+            continue
+        dependencias.add((pack_index.normalizar_nome(requisito.name), tuple(sorted(requisito.extras))))
+    return dependencias
+
+
+def fechamento(pacote, por_nome):
+    """Nomes (normalizados) dos itens resolvidos de que o pacote precisa, ele incluído"""
+    try:
+        requisito = Requirement(pacote)
+        pilha = [(pack_index.normalizar_nome(requisito.name), tuple(sorted(requisito.extras)))]
+    except InvalidRequirement:
+        pilha = [(pack_index.normalizar_nome(pacote), ())]
+    vistos, nomes = set(), []
+    while pilha:
+        chave = pilha.pop()
+        if chave in vistos:
+            continue
+        vistos.add(chave)
+        item = por_nome.get(chave[0])
+        if item is None:
+            # Já instalado (não está no relatório do resolver)
+            continue
+        if chave[0] not in nomes:
+            nomes.append(chave[0])
+        pilha.extend(_dependencias(item, chave[1]))
+    return nomes
+
+
+class Unidade:
+    """Um pacote pedido e as distribuições que só ele traz, instaladas juntas com --no-deps"""
+
+    def __init__(self, pacote, itens):
+        self.pacote = pacote
+        self.itens = itens
+        self.bytes = sum(item.get("tamanho") or 0 for item in itens)
+        self.pesada = any(pesado(item) for item in itens)
+        self.estado = "aguardando"
+        self.erro = None
+
+    @property
+    def nomes(self):
+        return {pack_index.normalizar_nome(item["name"]) for item in self.itens}
+
+
+def montar_unidades(pacotes, itens):
+    """Unidades da menor para a maior; cada distribuição fica na primeira unidade que precisa dela"""
+    por_nome = {pack_index.normalizar_nome(item["name"]): item for item in itens}
+    fechamentos = {pacote: fechamento(pacote, por_nome) for pacote in pacotes}
+    ordem = sorted(pacotes, key=lambda p: sum(por_nome[n].get("tamanho") or 0 for n in fechamentos[p]))
+
+    unidades, levados = [], set()
+    for pacote in ordem:
+        proprios = [por_nome[n] for n in fechamentos[pacote] if n not in levados]
+        levados.update(fechamentos[pacote])
+        unidades.append(Unidade(pacote, proprios))
+    sobras = [item for nome, item in por_nome.items() if nome not in levados]
+    if sobras:
+        unidades.append(Unidade("(dependências)", sobras))
+    return unidades
+
+
+def limite_instalacoes_pesadas(unidades):
+    """Instalações pesadas simultâneas que cabem na memória livre e no disco de destino"""
+    pesadas = [u for u in unidades if u.pesada]
+    if not pesadas:
+        return 1
+    limite = PESADOS_EM_PARALELO
+    livre = memoria_disponivel()
+    # Tamanho instalado medido pelo pack_espaco; sem ele, a estimativa pelo fator
+    maior = max(sum(item.get("instalado") or (item.get("tamanho") or 0) * FATOR_DESCOMPACTACAO
+                    for item in u.itens) for u in pesadas)
+    if livre and maior:
+        limite = min(limite, max(1, int(livre // 2 // maior)))
+    if disco_rotacional(sysconfig.get_paths()["purelib"]):
+        limite = 1
+    return limite
+
+
+# ----------------------------------------------------------------------
+# Taxas medidas (persistidas entre execuções)
+# ----------------------------------------------------------------------
+
+def _arquivo_taxas():
+    return os.path.join(pack_index.diretorio_cache(), "escalonador_taxas.json")
+
+
+def ler_taxas():
+    try:
+        with open(_arquivo_taxas(), encoding="utf-8") as fp:
+            return {**TAXAS_PADRAO, **json.load(fp)}
+    except (OSError, ValueError):
+        return dict(TAXAS_PADRAO)
+
+
+def gravar_taxas(taxas):
+    temporario = f"{_arquivo_taxas()}.{os.getpid()}.tmp"
+    try:
+        with open(temporario, "w", encoding="utf-8") as fp:
+            json.dump(taxas, fp)
+        os.replace(temporario, _arquivo_taxas())
+    except OSError:
+        pass
+
+
+# ----------------------------------------------------------------------
+# Execução
+# ----------------------------------------------------------------------
+
+class Escalonador:
+    def __init__(self, lote, itens, pacotes):
+        """lote: o pack_batch.BatchInstaller que baixa cada wheel (_construir_wheel)"""
+        self.lote = lote
+        self.itens = itens
+        self.unidades = montar_unidades(pacotes, itens)
+        self.limite_pesadas = limite_instalacoes_pesadas(self.unidades)
+        self.eventos = queue.Queue()
+        self.trava_leves = threading.Semaphore(1)
+        self.trava_pesadas = threading.Semaphore(self.limite_pesadas)
+        self.taxas = ler_taxas()
+        self.prontos = set()
+        self.falhos = set()
+        self.bytes_baixados = 0
+        self.bytes_instalados = 0
+        self.segundos_instalando = 0.0
+        self.inicio = None
+
+    # -- estimativas ---------------------------------------------------
+
+    def _a_baixar(self):
+        return [item for item in self.itens if not self.lote._no_wheelhouse(item)]
+
+    def _taxa_download(self):
+        segundos = time.perf_counter() - self.inicio if self.inicio else 0
+        if self.bytes_baixados and segundos > 1:
+            return self.bytes_baixados / segundos
+        return self.taxas["download"]
+
+    def _taxa_instalacao(self):
+        # Unidades pequenas são quase só o tempo de subir o instalador: a taxa
+        # medida nelas faria o ETA das grandes explodir
+        if self.bytes_instalados >= pack_download.LIMIAR_MB * 1e6 and self.segundos_instalando > 0.5:
+            return self.bytes_instalados / self.segundos_instalando
+        return self.taxas["instalacao"]
+
+    def eta(self):
+        """Segundos restantes: downloads + a instalação da última unidade, ou as instalações, o que for maior"""
+        restante_download = sum(item.get("tamanho") or 0 for item in self._a_baixar()
+                                if pack_index.normalizar_nome(item["name"]) not in self.prontos)
+        abertas = [u for u in self.unidades if u.estado in ("aguardando", "instalando")]
+        restante_instalacao = sum(u.bytes for u in abertas)
+        ultima = max((u.bytes for u in abertas if u.nomes - self.prontos), default=0)
+        return max(restante_download / self._taxa_download() + ultima / self._taxa_instalacao(),
+                   restante_instalacao / self._taxa_instalacao())
+
+    def imprimir_plano(self):
+        total = sum(item.get("tamanho") or 0 for item in self._a_baixar())
+        pesadas = [u for u in self.unidades if u.pesada]
+        print(f"📅 AGENDA: {len(self.unidades)} unidades, {_mb(total)} a baixar, "
+              f"{len(pesadas)} pesadas (até {self.limite_pesadas} instalando ao mesmo tempo)")
+        for unidade in self.unidades:
+            marca = "🐘" if unidade.pesada else "🐇"
+            print(f"   {marca} {unidade.pacote:24} {_mb(unidade.bytes):>12}  ({len(unidade.itens)} distribuições)")
+        print(f"⏳ ETA inicial ~{_duracao(self.eta())} (download {self._taxa_download() / 1e6:.1f} MB/s, "
+              f"instalação {self._taxa_instalacao() / 1e6:.1f} MB/s)", flush=True)
+
+    def _imprimir_progresso(self):
+        instaladas = sum(1 for u in self.unidades if u.estado == "instalada")
+        total = sum(item.get("tamanho") or 0 for item in self._a_baixar())
+        print(f"⏳ [{_duracao(time.perf_counter() - self.inicio)}] {instaladas}/{len(self.unidades)} unidades "
+              f"instaladas · {_mb(self.bytes_baixados)} de {_mb(total)} ({self._taxa_download() / 1e6:.1f} MB/s)"
+              f" · ETA {_duracao(self.eta())}", flush=True)
+
+    # -- trabalho ------------------------------------------------------
+
+    def _baixar(self, item, staging):
+        try:
+            resultado = self.lote._construir_wheel(item, staging)
+        except Exception as e:
+            resultado = (False, str(e), None)
+        self.eventos.put(("baixado", item, resultado))
+
+    def _instalar(self, unidade):
+        trava = self.trava_pesadas if unidade.pesada else self.trava_leves
+        with trava:
+            inicio = time.perf_counter()
+            try:
+                result = pack_backend.executar(
+                    pack_backend.comando_install(["--no-deps", *pack_wheelhouse.argumentos_pip(offline=True),
+                                                  *(f"{i['name']}=={i['version']}" for i in unidade.itens)]),
+                    mostrar=False,
+                    wheelhouse=False,
+                    descricao=f"agenda: {unidade.pacote}"
+                )
+                erro = None if result.returncode == 0 else (result.stderr.strip().splitlines() or ["?"])[-1]
+            except Exception as e:
+                erro = str(e)
+            self.eventos.put(("instalado", unidade, erro, time.perf_counter() - inicio))
+
+    def _liberar(self, instalacoes):
+        """Dispara as unidades cujas wheels já chegaram; descarta as que perderam alguma"""
+        for unidade in self.unidades:
+            if unidade.estado != "aguardando":
+                continue
+            if not unidade.itens:
+                # Tudo o que ela precisa veio com unidades anteriores
+                unidade.estado = "instalada"
+            elif unidade.nomes & self.falhos:
+                unidade.estado = "falhou"
+                unidade.erro = "download falhou"
+            elif unidade.nomes <= self.prontos:
+                unidade.estado = "instalando"
+                instalacoes.submit(self._instalar, unidade)
+
+    def executar(self, staging):
+        """Baixa e instala na ordem da agenda; retorna {nome: (ok, erro, classe)} como BatchInstaller.preparar"""
+        self.inicio = time.perf_counter()
+        preparados = {}
+        for item in self.itens:
+            if self.lote._no_wheelhouse(item):
+                self.prontos.add(pack_index.normalizar_nome(item["name"]))
+                preparados[item["name"]] = (True, "", None)
+
+        ordem_unidade = {nome: posicao for posicao, u in enumerate(self.unidades) for nome in u.nomes}
+        a_baixar = [i for i in self.itens if not self.lote._no_wheelhouse(i)]
+        pesados = sorted((i for i in a_baixar if pesado(i)), key=lambda i: -(i.get("tamanho") or 0))
+        leves = sorted((i for i in a_baixar if not pesado(i)),
+                       key=lambda i: (ordem_unidade.get(pack_index.normalizar_nome(i["name"]), 0),
+                                      i.get("tamanho") or 0))
+
+        downloads_pendentes = len(a_baixar)
+        with ThreadPoolExecutor(max_workers=PESADOS_EM_PARALELO) as pool_pesados, \
+                ThreadPoolExecutor(max_workers=self.lote.max_workers) as pool_leves, \
+                ThreadPoolExecutor(max_workers=1 + self.limite_pesadas) as instalacoes:
+            for item in pesados:
+                pool_pesados.submit(self._baixar, item, staging)
+            for item in leves:
+                pool_leves.submit(self._baixar, item, staging)
+            self._liberar(instalacoes)
+
+            while downloads_pendentes or any(u.estado == "instalando" for u in self.unidades):
+                evento = self.eventos.get()
+                if evento[0] == "baixado":
+                    _, item, resultado = evento
+                    downloads_pendentes -= 1
+                    preparados[item["name"]] = resultado
+                    nome = pack_index.normalizar_nome(item["name"])
+                    if resultado[0]:
+                        self.prontos.add(nome)
+                        self.bytes_baixados += item.get("tamanho") or 0
+                    else:
+                        self.falhos.add(nome)
+                else:
+                    _, unidade, erro, segundos = evento
+                    unidade.estado = "falhou" if erro else "instalada"
+                    unidade.erro = erro
+                    if not erro:
+                        self.bytes_instalados += unidade.bytes
+                        self.segundos_instalando += segundos
+                        print(f"✅ {unidade.pacote} instalado ({_mb(unidade.bytes)} em {segundos:.1f}s)", flush=True)
+                self._liberar(instalacoes)
+                self._imprimir_progresso()
+
+        self.taxas = {"download": (self.taxas["download"] + self._taxa_download()) / 2,
+                      "instalacao": (self.taxas["instalacao"] + self._taxa_instalacao()) / 2}
+        gravar_taxas(self.taxas)
+        print(f"📅 Agenda concluída em {_duracao(time.perf_counter() - self.inicio)}", flush=True)
+        return preparados
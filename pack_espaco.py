@@ -0,0 +1,364 @@
+# PACK ESPAÇO: pré-verificação de disco e memória antes de instalar um lote
+#
+# Disco cheio aparecia só depois de minutos de download, como um "No space
+# left on device" no meio da instalação. Logo depois da resolução - antes de
+# qualquer wheel ser transferida - o pack_batch passa o lote por aqui:
+#   • tamanho de download de cada distribuição: o que o pack_escalonador já
+#     mediu ("size" do índice, arquivo local ou sonda Range)
+#   • tamanho instalado: soma dos tamanhos descompactados dos membros da
+#     wheel (os mesmos que o RECORD lista), lidos do diretório central do
+#     zip - no arquivo local ou com até duas requisições Range ao fim do
+#     arquivo remoto. Sdists e servidores sem Range ficam com a estimativa
+#     pack_escalonador.FATOR_DESCOMPACTACAO. Uma wheel publicada não muda,
+#     então o resultado fica em <cache>/espaco_instalado.json e as próximas
+#     execuções não vão à rede
+#   • o que cada destino vai ocupar (site-packages, wheelhouse, temporário,
+#     parciais do pack_download, cache do pip ou do uv) é somado por sistema
+#     de arquivos e comparado com o espaço livre menos MARGEM_MB
+#
+# Se faltar espaço, o plano é refeito antes de desistir: sem o cache do pip
+# (--no-cache-dir), com o temporário no disco do cache e, por fim, só com os
+# pacotes pedidos (menores primeiro) cujo fechamento cabe - os outros são
+# recusados com a classe "disco" do pack_falhas. Com pouca memória livre, o
+# número de downloads/builds em paralelo diminui.
+#
+# PACK_MARGEM_DISCO_MB=N muda a folga exigida em cada disco (padrão 500).
+
+import json
+import os
+import shutil
+import struct
+import sysconfig
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from urllib.parse import unquote, urlparse
+from urllib.request import url2pathname
+
+import pack_backend
+import pack_download
+import pack_escalonador
+import pack_index
+import pack_trace
+import pack_wheelhouse
+
+try:
+    MARGEM_MB = max(0, int(os.environ.get("PACK_MARGEM_DISCO_MB", "500")))
+except ValueError:
+    MARGEM_MB = 500
+# Memória de cada download/build paralelo (um `pip wheel` com o resolver carregado)
+MEMORIA_POR_WORKER = 200e6
+# Bytes lidos do fim de uma wheel remota: o registro final do zip e, quase
+# sempre, o diretório central inteiro
+CAUDA = 64 * 1024
+
+_trava = threading.Lock()
+
+
+def _tamanho(bytes_):
+    return f"{bytes_ / 1e9:.1f} GB" if bytes_ >= 1e9 else f"{bytes_ / 1e6:.0f} MB"
+
+
+# ----------------------------------------------------------------------
+# Tamanho instalado (diretório central das wheels)
+# ----------------------------------------------------------------------
+
+def _arquivo_cache():
+    return os.path.join(pack_index.diretorio_cache(), "espaco_instalado.json")
+
+
+def _ler_cache():
+    try:
+        with open(_arquivo_cache(), encoding="utf-8") as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        return {}
+
+
+def _gravar_cache(dados):
+    temporario = f"{_arquivo_cache()}.{os.getpid()}.tmp"
+    try:
+        with open(temporario, "w", encoding="utf-8") as fp:
+            json.dump(dados, fp)
+        os.replace(temporario, _arquivo_cache())
+    except OSError:
+        pass
+
+
+def _soma_descompactada(arquivo):
+    with zipfile.ZipFile(arquivo) as zf:
+        return sum(info.file_size for info in zf.infolist())
+
+
+def _diretorio_central_remoto(url, total):
+    """Bytes do início do diretório central até o fim de uma wheel remota"""
+    inicio_cauda = max(0, total - CAUDA)
+    cauda = pack_download.ler_faixa(url, inicio_cauda, total - 1)
+    fim = cauda.rfind(b"PK\x05\x06")
+    if fim < 0:
+        raise zipfile.BadZipFile("registro final do zip não encontrado")
+    inicio = struct.unpack_from("<L", cauda, fim + 16)[0]
+    if inicio == 0xFFFFFFFF:
+        # Zip64: o deslocamento real fica no registro zip64, apontado pelo localizador
+        if fim < 20 or cauda[fim - 20:fim - 16] != b"PK\x06\x07":
+            raise zipfile.BadZipFile("localizador zip64 não encontrado")
+        registro = struct.unpack_from("<Q", cauda, fim - 12)[0] - inicio_cauda
+        # Fora da cauda, unpack_from com deslocamento negativo leria do fim do buffer
+        if registro < 0 or cauda[registro:registro + 4] != b"PK\x06\x06":
+            raise zipfile.BadZipFile("registro zip64 fora da cauda lida")
+        inicio = struct.unpack_from("<Q", cauda, registro + 48)[0]
+    if inicio >= inicio_cauda:
+        return cauda[inicio - inicio_cauda:]
+    return pack_download.ler_faixa(url, inicio, inicio_cauda - 1) + cauda
+
+
+def _medir_instalado(item):
+    """Bytes descompactados de uma wheel, ou None (sdist, servidor sem Range, zip ilegível)"""
+    url = urlparse(item["url"])
+    nome = pack_download.nome_do_arquivo(item["url"])
+    if not nome.endswith(".whl"):
+        return None
+    try:
+        if url.scheme == "file":
+            return _soma_descompactada(url2pathname(unquote(url.path)))
+        if pack_wheelhouse.contem(nome):
+            return _soma_descompactada(os.path.join(pack_wheelhouse.diretorio_wheels(), nome))
+        if url.scheme in ("http", "https") and item.get("tamanho"):
+            return _soma_descompactada(BytesIO(_diretorio_central_remoto(item["url"], item["tamanho"])))
+    except (OSError, ValueError, struct.error, zipfile.BadZipFile, pack_download.DownloadErro):
+        pass
+    return None
+
+
+def medir_instalados(itens):
+    """Preenche item["instalado"] (bytes) e item["estimado"]; retorna quantos foram estimados"""
+    cache = _ler_cache()
+    novos = {}
+
+    def medir(item):
+        chave = item.get("sha256") or pack_download.nome_do_arquivo(item["url"])
+        tamanho = cache.get(chave)
+        if tamanho is None:
+            tamanho = _medir_instalado(item)
+            if tamanho is not None:
+                with _trava:
+                    novos[chave] = tamanho
+        item["estimado"] = tamanho is None
+        if tamanho is None:
+            tamanho = (item.get("tamanho") or 0) * pack_escalonador.FATOR_DESCOMPACTACAO
+        item["instalado"] = tamanho
+
+    with ThreadPoolExecutor(max_workers=pack_escalonador.MAX_WORKERS_TAMANHOS) as pool:
+        list(pool.map(medir, itens))
+    if novos:
+        _gravar_cache({**cache, **novos})
+    return sum(1 for item in itens if item["estimado"])
+
+
+# ----------------------------------------------------------------------
+# Destinos e espaço livre
+# ----------------------------------------------------------------------
+
+def _ativado(variavel):
+    return os.environ.get(variavel, "").lower() not in ("", "0", "false", "no", "off")
+
+
+def cache_do_pip(extra_args=()):
+    """Cache HTTP do pip (None se desativado)"""
+    if "--no-cache-dir" in extra_args or _ativado("PIP_NO_CACHE_DIR"):
+        return None
+    if os.environ.get("PIP_CACHE_DIR"):
+        return os.environ["PIP_CACHE_DIR"]
+    try:
+        from pip._internal.utils.appdirs import user_cache_dir
+        return user_cache_dir("pip")
+    except ImportError:
+        return os.path.join(os.path.expanduser("~"), ".cache", "pip")
+
+
+def cache_do_uv():
+    """Cache do uv, onde ele descompacta cada wheel antes de ligá-la ao ambiente"""
+    if _ativado("UV_NO_CACHE"):
+        return None
+    if os.environ.get("UV_CACHE_DIR"):
+        return os.environ["UV_CACHE_DIR"]
+    if os.name == 'nt':
+        return os.path.join(os.environ.get("LOCALAPPDATA", os.path.expanduser("~")), "uv", "cache")
+    return os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "uv")
+
+
+def _existente(caminho):
+    """O próprio caminho ou o ancestral mais próximo que já existe"""
+    caminho = os.path.abspath(caminho)
+    while not os.path.exists(caminho) and os.path.dirname(caminho) != caminho:
+        caminho = os.path.dirname(caminho)
+    return caminho
+
+
+def _dispositivo(caminho):
+    try:
+        return os.stat(_existente(caminho)).st_dev
+    except OSError:
+        return None
+
+
+def necessidades(itens, lote):
+    """[(destino, caminho, bytes)] que o lote vai ocupar em cada diretório"""
+    a_baixar = [item for item in itens if not lote._no_wheelhouse(item)]
+    download = sum(item.get("tamanho") or 0 for item in a_baixar)
+    grandes = sum(item.get("tamanho") or 0 for item in a_baixar if lote._grande(item))
+    instalado = sum(item["instalado"] for item in itens)
+    site_packages = sysconfig.get_paths()["purelib"]
+    temporario = tempfile.gettempdir()
+
+    lista = [
+        ("wheelhouse", pack_wheelhouse.diretorio(), download),
+        # O staging do pack_batch guarda uma cópia de cada wheel até o fim do lote
+        ("temporário", temporario, download),
+    ]
+    parciais = pack_download.diretorio_parciais()
+    if grandes and _dispositivo(parciais) != _dispositivo(temporario):
+        lista.append(("downloads parciais", parciais, grandes))
+    cache_pip = cache_do_pip(lote.extra_args)
+    if cache_pip:
+        lista.append(("cache do pip", cache_pip, download - grandes))
+    cache_uv = cache_do_uv() if pack_backend.atual().nome == "uv" else None
+    if cache_uv:
+        lista.append(("cache do uv", cache_uv, instalado))
+        if (_dispositivo(cache_uv) == _dispositivo(site_packages)
+                and os.environ.get("UV_LINK_MODE", "").lower() != "copy"):
+            # Mesmo disco: o uv liga os arquivos do cache ao ambiente (hardlink/clone)
+            instalado = 0
+    lista.append(("site-packages", site_packages, instalado))
+    return lista
+
+
+def avaliar(itens, lote):
+    """Necessidades somadas por sistema de arquivos: [{destinos, caminho, dispositivo, precisa, livre, falta}]"""
+    discos = {}
+    for destino, caminho, precisa in necessidades(itens, lote):
+        existente = _existente(caminho)
+        dispositivo = _dispositivo(existente)
+        if not precisa or dispositivo is None:
+            continue
+        disco = discos.setdefault(dispositivo, {"destinos": [], "caminho": existente,
+                                                "dispositivo": dispositivo, "precisa": 0})
+        disco["destinos"].append(destino)
+        disco["precisa"] += precisa
+    for disco in discos.values():
+        disco["livre"] = shutil.disk_usage(disco["caminho"]).free
+        disco["falta"] = max(0, disco["precisa"] + MARGEM_MB * 1e6 - disco["livre"])
+    return list(discos.values())
+
+
+def _sem_espaco(discos):
+    return [disco for disco in discos if disco["falta"]]
+
+
+# ----------------------------------------------------------------------
+# Novo plano
+# ----------------------------------------------------------------------
+
+def _mover_temporario(disco):
+    """Aponta o temporário (deste processo e dos filhos) para o disco do cache"""
+    novo = os.path.join(pack_index.diretorio_cache(), "tmp")
+    if _dispositivo(novo) == disco["dispositivo"]:
+        return False
+    os.makedirs(novo, exist_ok=True)
+    for variavel in ("TMPDIR", "TEMP", "TMP"):
+        os.environ[variavel] = novo
+    tempfile.tempdir = None
+    print(f"   ↪️  temporário movido para {novo}")
+    return True
+
+
+def _replanejar(lote, discos):
+    """Ajustes que não mudam o que é instalado; retorna True se algum foi aplicado"""
+    ajustou = False
+    for disco in _sem_espaco(discos):
+        if "cache do pip" in disco["destinos"]:
+            lote.extra_args.append("--no-cache-dir")
+            print("   ↪️  downloads sem o cache do pip (--no-cache-dir)")
+            ajustou = True
+        if "temporário" in disco["destinos"]:
+            ajustou = _mover_temporario(disco) or ajustou
+    return ajustou
+
+
+def _reduzir(lote, itens, pacotes):
+    """Só os pacotes pedidos cujo fechamento cabe, menores primeiro; retorna (itens, pacotes, recusados)"""
+    por_nome = {pack_index.normalizar_nome(item["name"]): item for item in itens}
+    fechamentos = {p: set(pack_escalonador.fechamento(p, por_nome)) for p in pacotes}
+    aceitos = set(por_nome).difference(*fechamentos.values())
+    recusados = {}
+
+    def selecionar(nomes):
+        return [item for nome, item in por_nome.items() if nome in nomes]
+
+    for pacote in sorted(pacotes, key=lambda p: sum(por_nome[n]["instalado"] for n in fechamentos[p])):
+        candidato = aceitos | fechamentos[pacote]
+        faltas = _sem_espaco(avaliar(selecionar(candidato), lote))
+        if not faltas:
+            aceitos = candidato
+            continue
+        disco = faltas[0]
+        recusados[pacote] = (f"Sem espaço em disco: com {pacote} o lote precisa de {_tamanho(disco['precisa'])} "
+                             f"em {disco['caminho']} ({', '.join(disco['destinos'])}), livres "
+                             f"{_tamanho(disco['livre'])} (folga de {MARGEM_MB} MB)")
+
+    restantes = [p for p in pacotes if p not in recusados]
+    if restantes:
+        print(f"   ↪️  Só o que cabe: {', '.join(restantes)} - sem {', '.join(recusados)}")
+    else:
+        print("   ❌ Nenhum pacote do lote cabe no disco - nada foi baixado")
+    return selecionar(aceitos), restantes, recusados
+
+
+def _limitar_workers(lote):
+    livre = pack_escalonador.memoria_disponivel()
+    if not livre:
+        return
+    cabem = max(1, int(livre // 2 // MEMORIA_POR_WORKER))
+    if cabem < lote.max_workers:
+        print(f"   ↪️  Pouca memória livre ({_tamanho(livre)}): {cabem} downloads/builds em paralelo")
+        lote.max_workers = cabem
+
+
+def _imprimir(itens, lote, discos, estimados):
+    a_baixar = [item for item in itens if not lote._no_wheelhouse(item)]
+    download = sum(item.get("tamanho") or 0 for item in a_baixar)
+    desconhecidos = sum(1 for item in a_baixar if not item.get("tamanho"))
+    instalado = sum(item["instalado"] for item in itens)
+    observacoes = [f"{estimados} tamanhos instalados estimados"] if estimados else []
+    if desconhecidos:
+        observacoes.append(f"{desconhecidos} downloads de tamanho desconhecido")
+    print(f"🧮 Pré-verificação: baixar {_tamanho(download)}, ocupar {_tamanho(instalado)} instalado"
+          + (f" ({'; '.join(observacoes)})" if observacoes else ""))
+    for disco in discos:
+        situacao = f"faltam {_tamanho(disco['falta'])}" if disco["falta"] else "ok"
+        print(f"   {'❌' if disco['falta'] else '✅'} {', '.join(disco['destinos'])}: "
+              f"precisa {_tamanho(disco['precisa'])}, livre {_tamanho(disco['livre'])} - {situacao}")
+
+
+def pre_verificar(lote, itens, pacotes):
+    """Confere disco e memória para um lote resolvido, antes de qualquer download
+
+    lote é o pack_batch.BatchInstaller (extra_args e max_workers podem ser
+    ajustados). Retorna (itens, pacotes, {pacote recusado: motivo}) - o plano
+    reduzido ao que cabe no disco.
+    """
+    with pack_trace.span("pré-verificação", "espaco", pacotes=len(pacotes)) as span:
+        estimados = medir_instalados(itens)
+        discos = avaliar(itens, lote)
+        _imprimir(itens, lote, discos, estimados)
+        _limitar_workers(lote)
+        while _sem_espaco(discos) and _replanejar(lote, discos):
+            discos = avaliar(itens, lote)
+        recusados = {}
+        if _sem_espaco(discos):
+            itens, pacotes, recusados = _reduzir(lote, itens, pacotes)
+        span.update(bytes=sum(item.get("tamanho") or 0 for item in itens),
+                    instalado=sum(item["instalado"] for item in itens), recusados=len(recusados))
+    return itens, pacotes, recusados
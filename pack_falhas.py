@@ -0,0 +1,201 @@
+# PACK FALHAS: classificação de falhas do pip/uv e novas tentativas
+#
+# Em vez das dicas genéricas de sempre ("execute como Administrador",
+# "verifique sua conexão"), o stderr de cada chamada que falhou é
+# classificado em:
+#   • rede      - timeout, conexão recusada/interrompida, DNS, HTTP 5xx
+#   • hash      - arquivo baixado não confere com o hash esperado
+#   • build     - falha ao construir uma wheel a partir do sdist
+#   • conflito  - o resolver não achou um conjunto de versões compatível
+#   • disco     - sem espaço em disco / cota excedida
+#   • permissao - sem permissão de escrita no ambiente
+#
+# Falhas transitórias (rede; hash uma vez, sem o cache do pip, que pode ter
+# guardado um arquivo corrompido) são repetidas com espera exponencial, e
+# o pip recebe mais tentativas de retomar downloads interrompidos
+# (--resume-retries) e um timeout maior. As determinísticas falham na hora,
+# com uma dica específica. Cada repetição e o tempo perdido com ela ficam
+# em REGISTRO (e nos spans do pack_trace).
+#
+# PACK_RETRIES=N muda o número de novas tentativas para falhas de rede
+# (padrão 3; 0 desativa).
+
+import os
+import random
+import re
+import shlex
+import subprocess
+import threading
+import time
+
+REDE = "rede"
+HASH = "hash"
+BUILD = "build"
+CONFLITO = "conflito"
+DISCO = "disco"
+PERMISSAO = "permissao"
+DESCONHECIDA = "desconhecida"
+
+# Ordem importa: sem espaço durante um build é disco, não build; rede fora
+# do ar faz o pip dizer "No matching distribution", que não é conflito
+_PADROES = [
+    (DISCO, r"No space left on device|\[Errno 28\]|Disk quota exceeded|\[Errno 122\]|os error 28\b"),
+    (PERMISSAO, r"\[Errno 13\]|Permission denied|PermissionError|Access is denied|\[WinError 5\]"
+                r"|Consider using the `--user` option|os error 13\b"),
+    (HASH, r"DO NOT MATCH THE HASHES|Hash mismatch|hash mismatch"),
+    (REDE, r"ReadTimeoutError|ConnectTimeoutError|timed out|Connection (?:reset|refused|aborted)"
+           r"|ConnectionError|NewConnectionError|RemoteDisconnected|IncompleteRead|ProtocolError"
+           r"|Max retries exceeded|Temporary failure in name resolution|Name or service not known"
+           r"|Could not fetch URL|Network is unreachable|SSLError|HTTP error 5\d\d|\b5\d\d Server Error"
+           r"|error sending request|Failed to download(?! and build)|Connection broken|Failed to fetch"),
+    (BUILD, r"Failed building wheel|Failed to build|Failed to download and build|Build backend failed|subprocess-exited-with-error|metadata-generation-failed"
+            r"|error: command '.*' failed|Building wheel for \S+ \(.*\) \.\.\. error"),
+    (CONFLITO, r"ResolutionImpossible|conflicting dependencies|No matching distribution found"
+               r"|Could not find a version that satisfies|No solution found|Because .* depends on"),
+]
+_PADROES = [(classe, re.compile(padrao)) for classe, padrao in _PADROES]
+
+DICAS = {
+    REDE: "Falha de rede persistente - verifique a conexão, proxy (HTTPS_PROXY) ou o índice configurado",
+    HASH: "O arquivo baixado não confere com o hash esperado - o índice/espelho pode estar servindo "
+          "um arquivo diferente do travado",
+    BUILD: "Não há wheel pronta para esta plataforma e o build falhou - instale o compilador/headers "
+           "do pacote ou fixe uma versão com wheel",
+    CONFLITO: "O resolver não achou versões compatíveis - confira nome/versão/plataforma do pacote "
+              "ou relaxe as versões em conflito",
+    DISCO: "Sem espaço em disco - libere espaço ou aponte TMPDIR/PIP_CACHE_DIR para outro disco",
+    PERMISSAO: "Sem permissão de escrita no ambiente - use um venv, --user ou rode como Administrador",
+    DESCONHECIDA: "Veja o log completo para os detalhes",
+}
+
+# Novas tentativas por classe (além da primeira execução)
+try:
+    TENTATIVAS_REDE = max(0, int(os.environ.get("PACK_RETRIES", "3")))
+except ValueError:
+    TENTATIVAS_REDE = 3
+TENTATIVAS = {REDE: TENTATIVAS_REDE, HASH: min(1, TENTATIVAS_REDE)}
+ESPERA_INICIAL = 2.0
+ESPERA_MAXIMA = 60.0
+
+# Histórico da execução: [{descricao, classe, tentativas, segundos_perdidos, ok}]
+REGISTRO = []
+_trava = threading.Lock()
+
+
+def classificar(stderr):
+    """Classe da falha a partir do stderr do pip/uv (DESCONHECIDA se nada bater)"""
+    texto = stderr or ""
+    for classe, padrao in _PADROES:
+        if padrao.search(texto):
+            return classe
+    return DESCONHECIDA
+
+
+def transitoria(classe):
+    return TENTATIVAS.get(classe, 0) > 0
+
+
+def espera(tentativa):
+    """Espera exponencial com jitter antes da tentativa N (1, 2, ...)"""
+    base = min(ESPERA_MAXIMA, ESPERA_INICIAL * 2 ** (tentativa - 1))
+    return base * random.uniform(0.75, 1.25)
+
+
+def _e_pip(lista):
+    # uv tem as próprias retentativas de rede (UV_HTTP_RETRIES); só o pip recebe ajustes
+    return ("pip" in lista and any(c in lista for c in ("install", "wheel", "download"))
+            and os.path.basename(lista[0]).lower() not in ("uv", "uv.exe"))
+
+
+def _pip_retoma_downloads():
+    import pack_index
+    versao = pack_index.get_current_version("pip")
+    try:
+        return tuple(int(p) for p in versao.split(".")[:2]) >= (25, 1)
+    except ValueError:
+        return False
+
+
+def _trocar_opcao(lista, opcao, valor=None):
+    """Remove `opcao` (e seu valor) da lista e a coloca de novo logo após o subcomando"""
+    nova = []
+    pular = False
+    for item in lista:
+        if pular:
+            pular = False
+            continue
+        if item == opcao:
+            pular = valor is not None
+            continue
+        if item.startswith(opcao + "="):
+            continue
+        nova.append(item)
+    for posicao, item in enumerate(nova):
+        if item in ("install", "wheel", "download"):
+            nova[posicao + 1:posicao + 1] = [opcao] if valor is None else [opcao, str(valor)]
+            break
+    return nova
+
+
+def ajustar_comando(command, classe, tentativa):
+    """Comando da próxima tentativa: mais tolerância de rede ou sem o cache do pip"""
+    lista = shlex.split(command, posix=os.name != 'nt') if isinstance(command, str) else list(command)
+    if not _e_pip(lista):
+        return command
+    if classe == REDE:
+        lista = _trocar_opcao(lista, "--timeout", 15 * 2 ** tentativa)
+        if _pip_retoma_downloads():
+            lista = _trocar_opcao(lista, "--resume-retries", 5 + 5 * tentativa)
+    elif classe == HASH:
+        lista = _trocar_opcao(lista, "--no-cache-dir")
+    if isinstance(command, str):
+        return subprocess.list2cmdline(lista) if os.name == 'nt' else shlex.join(lista)
+    return lista
+
+
+def repetir(rodar, command, descricao):
+    """Roda `rodar(command)` repetindo falhas transitórias; retorna o último resultado
+
+    `rodar` devolve um CompletedProcess (sem check). O resultado ganha os
+    atributos `falha` (classe ou None), `tentativas` e `segundos_perdidos`.
+    """
+    tentativa = 0
+    perdido = 0.0
+    while True:
+        inicio = time.perf_counter()
+        result = rodar(command)
+        classe = None if result.returncode == 0 else classificar(result.stderr)
+        if classe is None or tentativa >= TENTATIVAS.get(classe, 0):
+            break
+        tentativa += 1
+        pausa = espera(tentativa)
+        perdido += time.perf_counter() - inicio + pausa
+        print(f"🔁 {descricao}: falha de {classe} - nova tentativa {tentativa}/{TENTATIVAS[classe]} "
+              f"em {pausa:.0f}s", flush=True)
+        time.sleep(pausa)
+        command = ajustar_comando(command, classe, tentativa)
+
+    result.falha = classe
+    result.tentativas = tentativa
+    result.segundos_perdidos = round(perdido, 3)
+    if tentativa or classe:
+        with _trava:
+            REGISTRO.append({"descricao": descricao, "classe": classe, "tentativas": tentativa,
+                             "segundos_perdidos": round(perdido, 3), "ok": classe is None})
+    return result
+
+
+def resumo():
+    """(novas tentativas, segundos perdidos, {classe: falhas finais}) desta execução"""
+    with _trava:
+        tentativas = sum(r["tentativas"] for r in REGISTRO)
+        perdido = sum(r["segundos_perdidos"] for r in REGISTRO)
+        finais = {}
+        for registro in REGISTRO:
+            if registro["classe"]:
+                finais[registro["classe"]] = finais.get(registro["classe"], 0) + 1
+    return tentativas, round(perdido, 3), finais
+
+
+def dica(classe):
+    return DICAS.get(classe or DESCONHECIDA, DICAS[DESCONHECIDA])
@@ -0,0 +1,222 @@
+# PACK IMPORT TESTER: teste de importação isolado e paralelo, com custo medido
+#
+# Cada pacote é importado em um subprocesso próprio (python -X importtime),
+# vários ao mesmo tempo. Um import pesado ou que derruba o interpretador não
+# afeta os outros. Para cada pacote:
+#   • tempo de parede do import
+#   • detalhamento do -X importtime (submódulos mais caros)
+#   • pico de RSS do processo
+#   • traceback completo em caso de falha
+#   • ImportError (ou processo que morre) é falha; outra exceção durante o
+#     import é aviso e o pacote conta como OK, como no teste original
+#   • para tensorflow/torch, se há GPU/CUDA disponível (SONDAS), consultado
+#     depois de medir o import
+#
+#   python pack_import_tester.py --fase 2             → só a Fase 2
+#   python pack_import_tester.py                      → Fases 1-4
+#   python pack_import_tester.py numpy torch --json relatorio.json
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pack_catalog
+import pack_index
+
+# Imports competem por CPU e disco: poucos workers dão tempos mais fiéis
+MAX_WORKERS = max(1, min(4, (os.cpu_count() or 2) // 2))
+TIMEOUT = 300
+_MARCA = "@@pack_import_tester@@"
+
+# Módulo -> (rótulo, expressão avaliada no filho com o módulo importado em `modulo`)
+SONDAS = {
+    "tensorflow": ("GPU disponível", "'Sim' if modulo.config.list_physical_devices('GPU') else 'Não'"),
+    "torch": ("CUDA disponível", "modulo.cuda.is_available()"),
+}
+
+_FILHO = r"""
+import importlib, json, sys, time, traceback
+inicio = time.perf_counter()
+versao, erro, aviso = None, None, None
+try:
+    modulo = importlib.import_module(sys.argv[1])
+    versao = getattr(modulo, "__version__", None)
+except ImportError:
+    erro = traceback.format_exc()
+except Exception:
+    aviso = traceback.format_exc()
+except BaseException:
+    erro = traceback.format_exc()
+duracao = time.perf_counter() - inicio
+sonda = None
+if erro is None and aviso is None and len(sys.argv) > 3:
+    try:
+        sonda = str(eval(sys.argv[3], {"modulo": modulo}))
+    except Exception as e:
+        sonda = "erro (%s)" % e
+try:
+    import resource
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    pico = pico if sys.platform == "darwin" else pico * 1024
+except ImportError:
+    pico = None
+sys.stdout.write("\n%s%s\n" % (sys.argv[2], json.dumps(
+    {"segundos": duracao, "pico_rss": pico, "versao": str(versao) if versao else None, "erro": erro,
+     "aviso": aviso, "sonda": sonda})))
+"""
+
+
+def ler_importtime(stderr):
+    """Converte as linhas do -X importtime em [(módulo, self_us, cumulativo_us)]"""
+    linhas = []
+    for linha in stderr.splitlines():
+        if not linha.startswith("import time:") or "self [us]" in linha:
+            continue
+        try:
+            self_us, cumulativo_us, nome = linha[len("import time:"):].split("|", 2)
+            linhas.append((nome.strip(), int(self_us), int(cumulativo_us)))
+        except ValueError:
+            continue
+    return linhas
+
+
+def testar(pacote, modulo=None, timeout=TIMEOUT, python=None):
+    """Importa um pacote em um subprocesso isolado; retorna um dicionário com o resultado"""
+    modulo = modulo or pack_catalog.modulo_de_import(pacote)
+    rotulo, expressao = SONDAS.get(modulo, (None, None))
+    resultado = {"pacote": pacote, "modulo": modulo, "ok": False, "segundos": None,
+                 "pico_rss": None, "versao": None, "erro": None, "aviso": None, "importtime": [],
+                 "sonda_rotulo": rotulo, "sonda": None}
+
+    inicio = time.perf_counter()
+    try:
+        proc = subprocess.run([python or sys.executable, "-X", "importtime", "-c", _FILHO, modulo, _MARCA,
+                               *([expressao] if expressao else [])],
+                              capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        resultado["segundos"] = time.perf_counter() - inicio
+        resultado["erro"] = f"tempo esgotado ({timeout}s)"
+        return resultado
+
+    importtime = ler_importtime(proc.stderr)
+    resultado["importtime"] = sorted(importtime, key=lambda l: l[1], reverse=True)
+
+    dados = None
+    for linha in proc.stdout.splitlines():
+        if linha.startswith(_MARCA):
+            dados = json.loads(linha[len(_MARCA):])
+    if dados is None:
+        # O processo morreu antes de responder (segfault, abort, os._exit...)
+        resto = [l for l in proc.stderr.splitlines() if l.strip() and not l.startswith("import time:")]
+        resultado["segundos"] = time.perf_counter() - inicio
+        resultado["erro"] = "\n".join(resto[-20:]) or f"processo terminou com código {proc.returncode}"
+        return resultado
+
+    resultado.update(dados)
+    resultado["ok"] = dados["erro"] is None
+    return resultado
+
+
+def testar_varios(pacotes, max_workers=MAX_WORKERS, timeout=TIMEOUT, modulos=None):
+    """Testa vários pacotes em paralelo; retorna a lista de resultados"""
+    modulos = modulos or {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(lambda p: testar(p, modulos.get(p), timeout), pacotes))
+
+
+def pacotes_das_fases(fases):
+    """{pacote: módulo} das Fases pedidas, na ordem do catálogo"""
+    pacotes = {}
+    for fase in fases:
+        instalador = pack_catalog.CatalogInstaller(f"fase{fase}")
+        for pacote, info in instalador.info.items():
+            pacotes.setdefault(pacote, pack_catalog.modulo_de_import(pacote, info))
+    return pacotes
+
+
+def imprimir_relatorio(resultados, nao_instalados=(), top=3):
+    """Relatório ordenado do import mais lento para o mais rápido"""
+    ordenados = sorted(resultados, key=lambda r: (not r["ok"], -(r["segundos"] or 0)))
+    largura = max([len(r["pacote"]) for r in resultados] + [7])
+
+    print("🧪 RELATÓRIO DE IMPORTAÇÃO")
+    print("=" * 70)
+    print(f"{'pacote':{largura}}  {'status':6}  {'tempo':>8}  {'pico RSS':>9}  versão")
+    print("-" * 70)
+    for r in ordenados:
+        tempo = f"{r['segundos']:.2f}s" if r["segundos"] is not None else "-"
+        pico = f"{r['pico_rss'] / 1024 / 1024:.0f}MB" if r["pico_rss"] else "-"
+        status = "❌" if not r["ok"] else "⚠️" if r["aviso"] else "✅"
+        print(f"{r['pacote']:{largura}}  {status:6}  {tempo:>8}  {pico:>9}  {r['versao'] or ''}")
+        if r["ok"] and top:
+            caros = ", ".join(f"{nome} {self_us / 1000:.0f}ms" for nome, self_us, _ in r["importtime"][:top])
+            if caros:
+                print(f"{'':{largura}}  ↳ {caros}")
+        if r["ok"] and r.get("sonda") is not None:
+            print(f"{'':{largura}}  ↳ {r['sonda_rotulo']}: {r['sonda']}")
+
+    falhas = [r for r in ordenados if not r["ok"]]
+    avisos = [r for r in ordenados if r["ok"] and r["aviso"]]
+    for r in avisos:
+        print(f"\n⚠️  {r['pacote']} (import {r['modulo']}) - aviso, conta como OK:")
+        for linha in r["aviso"].strip().splitlines()[-6:]:
+            print(f"   {linha}")
+    for r in falhas:
+        print(f"\n❌ {r['pacote']} (import {r['modulo']}):")
+        for linha in (r["erro"] or "").strip().splitlines()[-6:]:
+            print(f"   {linha}")
+
+    print("=" * 70)
+    total = sum(r["segundos"] or 0 for r in resultados if r["ok"])
+    com_aviso = f" ({len(avisos)} com aviso)" if avisos else ""
+    print(f"📊 {len(resultados) - len(falhas)}/{len(resultados)} importaram{com_aviso} - "
+          f"soma dos imports: {total:.1f}s")
+    if nao_instalados:
+        print(f"⏭️  Não instalados (ignorados): {', '.join(nao_instalados)}")
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Teste de importação isolado e paralelo dos pacotes das Fases")
+    parser.add_argument("pacotes", nargs="*", help="pacotes específicos (padrão: os das Fases)")
+    parser.add_argument("--fase", type=int, action="append", choices=[1, 2, 3, 4],
+                        help="Fase a testar (pode repetir; padrão: todas)")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    parser.add_argument("--timeout", type=int, default=TIMEOUT)
+    parser.add_argument("--top", type=int, default=3, help="submódulos mais caros exibidos por pacote")
+    parser.add_argument("--json", metavar="ARQUIVO", help="gravar os resultados completos em JSON")
+    args = parser.parse_args()
+
+    if args.pacotes:
+        catalogo = pacotes_das_fases([1, 2, 3, 4])
+        candidatos = {p: catalogo.get(p, pack_catalog.modulo_de_import(p)) for p in args.pacotes}
+    else:
+        candidatos = pacotes_das_fases(args.fase or [1, 2, 3, 4])
+
+    instalados = [p for p in candidatos if pack_index.indice.instalado(p)]
+    nao_instalados = [p for p in candidatos if p not in instalados]
+    if not instalados:
+        print("❌ Nenhum dos pacotes está instalado")
+        sys.exit(1)
+
+    print(f"🔍 Importando {len(instalados)} pacotes em subprocessos isolados ({args.workers} em paralelo)...")
+    inicio = time.perf_counter()
+    resultados = testar_varios(instalados, args.workers, args.timeout, candidatos)
+    print(f"⏱️  {time.perf_counter() - inicio:.1f}s no total\n")
+
+    imprimir_relatorio(resultados, nao_instalados, args.top)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fp:
+            json.dump(resultados, fp, indent=1, ensure_ascii=False)
+        print(f"💾 Resultados gravados em {args.json}")
+
+    sys.exit(0 if all(r["ok"] for r in resultados) else 1)
+
+
+if __name__ == "__main__":
+    main()
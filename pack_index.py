@@ -0,0 +1,230 @@
+# PACK INDEX: índice das distribuições instaladas com cache persistente
+#
+# Substitui o `python -m pip show <pacote>` usado em cada get_current_version.
+# O índice é montado a partir dos metadados *.dist-info / *.egg-info
+# encontrados no sys.path (via importlib.metadata) e responde
+# nome -> versão em microssegundos.
+#
+# O resultado fica salvo em disco, por interpretador + diretórios do sys.path.
+# Em cada execução (e a cada consulta, no máximo a cada INTERVALO_VERIFICACAO)
+# só os diretórios cujo mtime mudou são relistados, e só as entradas
+# *.dist-info adicionadas desde a última varredura são lidas de novo.
+
+import collections
+import hashlib
+import importlib
+import json
+import os
+import re
+import sys
+import time
+
+NAO_INSTALADO = "Não instalado"
+NAO_ENCONTRADA = "Não encontrada"
+
+_SUFIXOS_METADADOS = (".dist-info", ".egg-info")
+
+# Intervalo mínimo entre duas verificações de mtime dos diretórios (segundos)
+INTERVALO_VERIFICACAO = 0.5
+
+
+def diretorio_cache():
+    """Diretório de cache compartilhado pelos scripts pack_*"""
+    base = os.environ.get("PACK_CACHE_DIR")
+    if not base:
+        if os.name == 'nt':
+            base = os.path.join(os.environ.get("LOCALAPPDATA", os.path.expanduser("~")), "python_tool_kit")
+        else:
+            base = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "python_tool_kit")
+    os.makedirs(base, exist_ok=True)
+    return base
+
+
+def normalizar_nome(nome):
+    """Normaliza o nome de um pacote segundo a PEP 503"""
+    return re.sub(r"[-_.]+", "-", nome).lower()
+
+
+class InstalledIndex:
+    def __init__(self, caminhos=None, arquivo_cache=None):
+        self.caminhos = caminhos
+        self.arquivo_cache = arquivo_cache
+        self.versoes = None
+        self.diretorios = {}
+        self.ultima_verificacao = 0.0
+
+    def _diretorios(self):
+        """Retorna os diretórios do sys.path que podem conter metadados"""
+        caminhos = self.caminhos if self.caminhos is not None else sys.path
+        return [c or os.getcwd() for c in caminhos if os.path.isdir(c or os.getcwd())]
+
+    def _caminho_cache(self):
+        """Arquivo de cache para este interpretador + conjunto de diretórios"""
+        if self.arquivo_cache:
+            return self.arquivo_cache
+        chave = "\0".join([sys.executable, *self._diretorios()])
+        nome = hashlib.sha1(chave.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(diretorio_cache(), f"status-{nome}.json")
+
+    def _carregar_cache(self):
+        """Lê o cache persistente (ou {} se ausente/corrompido)"""
+        try:
+            with open(self._caminho_cache(), encoding="utf-8") as fp:
+                dados = json.load(fp)
+            if dados.get("interpretador") == sys.executable:
+                return dados.get("diretorios", {})
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def _salvar_cache(self):
+        """Grava o cache de forma atômica"""
+        caminho = self._caminho_cache()
+        temporario = f"{caminho}.{os.getpid()}.tmp"
+        try:
+            with open(temporario, "w", encoding="utf-8") as fp:
+                json.dump({"interpretador": sys.executable, "diretorios": self.diretorios}, fp)
+            os.replace(temporario, caminho)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _ler_entrada(diretorio, entrada):
+        """Lê nome e versão de uma entrada *.dist-info / *.egg-info"""
+        # Import tardio: com o cache quente importlib.metadata nem é carregado
+        from importlib import metadata
+
+        dist = metadata.PathDistribution.at(os.path.join(diretorio, entrada))
+        try:
+            nome = dist.metadata["Name"]
+            versao = dist.version
+        except Exception:
+            return None
+        if not nome:
+            return None
+        return [normalizar_nome(nome), versao or NAO_ENCONTRADA]
+
+    def _atualizar_diretorio(self, diretorio, anterior):
+        """Relista um diretório e relê apenas as entradas novas; retorna (dados, mudou)"""
+        try:
+            mtime = os.stat(diretorio).st_mtime_ns
+        except OSError:
+            return None, anterior is not None
+        if anterior and anterior.get("mtime") == mtime:
+            return anterior, False
+
+        try:
+            nomes = [e for e in os.listdir(diretorio) if e.endswith(_SUFIXOS_METADADOS)]
+        except OSError:
+            nomes = []
+        conhecidas = (anterior or {}).get("entradas", {})
+        entradas = {}
+        for entrada in nomes:
+            if entrada in conhecidas:
+                entradas[entrada] = conhecidas[entrada]
+            else:
+                entradas[entrada] = self._ler_entrada(diretorio, entrada)
+        return {"mtime": mtime, "entradas": entradas}, True
+
+    def _sincronizar(self, diretorios_anteriores):
+        """Atualiza os diretórios alterados e remonta o mapa nome -> versão"""
+        mudou = False
+        diretorios = {}
+        for diretorio in self._diretorios():
+            dados, alterado = self._atualizar_diretorio(diretorio, diretorios_anteriores.get(diretorio))
+            mudou = mudou or alterado
+            if dados is not None:
+                diretorios[diretorio] = dados
+
+        self.diretorios = diretorios
+        self.ultima_verificacao = time.monotonic()
+        if mudou or self.versoes is None:
+            # Primeira ocorrência no sys.path vence, como no import
+            versoes = {}
+            for dados in diretorios.values():
+                for item in dados["entradas"].values():
+                    if item:
+                        versoes.setdefault(item[0], item[1])
+            self.versoes = versoes
+        return mudou
+
+    def construir(self):
+        """Monta o índice a partir do cache persistente, relendo só o que mudou"""
+        import pack_trace
+        with pack_trace.span("índice de instalados", "status") as span:
+            if self._sincronizar(self._carregar_cache()):
+                self._salvar_cache()
+            span["distribuicoes"] = len(self.versoes)
+        return self.versoes
+
+    def verificar(self):
+        """Revalida o índice pelos mtimes dos diretórios (incremental)"""
+        if self._sincronizar(self.diretorios):
+            self._salvar_cache()
+
+    def invalidar(self):
+        """Força a revalidação na próxima consulta - chamado após instalar/atualizar pacotes"""
+        importlib.invalidate_caches()
+        self.ultima_verificacao = 0.0
+
+    def versao(self, pacote_nome):
+        """Retorna a versão instalada ou "Não instalado" """
+        if self.versoes is None:
+            self.construir()
+        elif time.monotonic() - self.ultima_verificacao > INTERVALO_VERIFICACAO:
+            self.verificar()
+        return self.versoes.get(normalizar_nome(pacote_nome), NAO_INSTALADO)
+
+    def instalado(self, pacote_nome):
+        """Retorna True se o pacote estiver instalado"""
+        return self.versao(pacote_nome) != NAO_INSTALADO
+
+
+# Índice compartilhado por todos os scripts pack_* durante a execução
+indice = InstalledIndex()
+
+
+def get_current_version(pacote_nome):
+    """Obtém a versão atual de um pacote a partir do índice compartilhado"""
+    return indice.versao(pacote_nome)
+
+
+def invalidar():
+    """Invalida o índice compartilhado"""
+    indice.invalidar()
+
+
+def fechamento_dependencias(pacotes):
+    """Nomes normalizados dos pacotes e de todas as dependências instaladas deles
+
+    Lê os Requires-Dist dos metadados (sem extras; marcadores avaliados para
+    este interpretador). Dependências ausentes ficam de fora.
+    """
+    from importlib import metadata
+    try:
+        from packaging.requirements import InvalidRequirement, Requirement
+    except ImportError:
+        from pip._vendor.packaging.requirements import InvalidRequirement, Requirement
+
+    # Conjunto para a pertinência, lista só para devolver na ordem de descoberta
+    vistos = set()
+    ordem = []
+    fila = collections.deque(normalizar_nome(p) for p in pacotes)
+    while fila:
+        nome = fila.popleft()
+        if nome in vistos or not indice.instalado(nome):
+            continue
+        vistos.add(nome)
+        ordem.append(nome)
+        try:
+            requisitos = metadata.distribution(nome).requires or []
+        except metadata.PackageNotFoundError:
+            continue
+        for texto in requisitos:
+            try:
+                requisito = Requirement(texto)
+            except InvalidRequirement:
+                continue
+            if requisito.marker is None or requisito.marker.evaluate({"extra": ""}):
+                fila.append(normalizar_nome(requisito.name))
+    return ordem
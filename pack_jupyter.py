@@ -0,0 +1,307 @@
+# PACK JUPYTER: supervisor de servidores Jupyter Lab
+#
+# Sobe o Jupyter Lab numa porta livre, com token próprio, e consulta a API
+# HTTP local (/api/status) até o servidor responder - o tempo até ficar
+# pronto é medido e gravado. Os servidores ficam num registro em JSON no
+# diretório de cache, então vários rodam lado a lado e qualquer terminal
+# consegue listá-los e pará-los de forma limpa (POST /api/shutdown, que
+# encerra também os kernels; SIGTERM só se a API não responder).
+#
+# Com --pool N (ou PACK_KERNEL_POOL=N) o servidor usa o pack_kernel_pool:
+# N kernels ficam pré-aquecidos, opcionalmente já com a Fase 1 importada
+# (--pre-importar / PACK_KERNEL_POOL_PREIMPORTAR=1).
+#
+#   python pack_jupyter.py start [pasta] [--porta N] [--no-browser] [--pool N]
+#   python pack_jupyter.py list
+#   python pack_jupyter.py stop <porta> | --all
+
+import argparse
+import json
+import os
+import secrets
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+import webbrowser
+
+import pack_index
+
+HOST = "127.0.0.1"
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+TIMEOUT_PRONTO = 120
+INTERVALO_SONDAGEM = 0.1
+
+
+class JupyterErro(Exception):
+    """Falha ao iniciar ou parar um servidor"""
+
+
+def porta_livre():
+    """Porta TCP livre em 127.0.0.1 (o sistema escolhe)"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+def _diretorio_privado():
+    """<cache>/jupyter só para o dono (0700): o registro e os logs contêm os tokens"""
+    caminho = os.path.join(pack_index.diretorio_cache(), "jupyter")
+    os.makedirs(caminho, mode=0o700, exist_ok=True)
+    if os.name == "posix":
+        # makedirs não altera um diretório que já existia
+        os.chmod(caminho, 0o700)
+    return caminho
+
+
+def _abrir_privado(caminho):
+    """Abre para escrita um arquivo com permissão 0600, independente do umask"""
+    descritor = os.open(caminho, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    if os.name == "posix":
+        os.fchmod(descritor, 0o600)
+    return os.fdopen(descritor, "w", encoding="utf-8")
+
+
+def _arquivo_registro():
+    return os.path.join(pack_index.diretorio_cache(), "jupyter", "servidores.json")
+
+
+def _registro_antigo():
+    # Versões anteriores gravavam o registro, legível por todos, na raiz do cache
+    return os.path.join(pack_index.diretorio_cache(), "jupyter_servidores.json")
+
+
+def _ler_registro():
+    for arquivo in (_arquivo_registro(), _registro_antigo()):
+        try:
+            with open(arquivo, encoding="utf-8") as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            continue
+    return []
+
+
+def _gravar_registro(servidores):
+    _diretorio_privado()
+    arquivo = _arquivo_registro()
+    temporario = f"{arquivo}.{os.getpid()}.tmp"
+    with _abrir_privado(temporario) as fp:
+        json.dump(servidores, fp, indent=1, ensure_ascii=False)
+    os.replace(temporario, arquivo)
+    if os.path.exists(_registro_antigo()):
+        os.remove(_registro_antigo())
+
+
+def _api(servidor, caminho, metodo="GET", timeout=2):
+    """Chama a API REST do servidor; retorna o JSON da resposta (ou None se vazia)"""
+    requisicao = urllib.request.Request(f"http://{HOST}:{servidor['porta']}{caminho}", method=metodo,
+                                        headers={"Authorization": f"token {servidor['token']}"})
+    with urllib.request.urlopen(requisicao, timeout=timeout) as resposta:
+        corpo = resposta.read()
+    return json.loads(corpo) if corpo else None
+
+
+def responde(servidor):
+    """True se o servidor atende em /api/status"""
+    try:
+        _api(servidor, "/api/status", timeout=1)
+        return True
+    except (OSError, ValueError):
+        return False
+
+
+def _argumento_token():
+    # jupyter_server 2 moveu o token para o IdentityProvider
+    versao = pack_index.get_current_version("jupyter_server")
+    if versao[:1].isdigit() and int(versao.split(".")[0]) >= 2:
+        return "--IdentityProvider.token"
+    return "--ServerApp.token"
+
+
+def _opcoes_processo():
+    # Sessão própria: Ctrl+C no terminal não derruba o servidor no meio de um shutdown limpo
+    if os.name == "posix":
+        return {"start_new_session": True}
+    return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+
+
+def argumentos_pool(tamanho, pre_importar=(), memoria_maxima_mb=0, ociosidade=0):
+    """Argumentos do jupyter lab para usar o pack_kernel_pool"""
+    classe = "PooledKernelManager"
+    argumentos = [f"--ServerApp.kernel_manager_class=pack_kernel_pool.{classe}",
+                  f"--{classe}.tamanho_pool={tamanho}"]
+    argumentos += [f"--{classe}.pre_importar={modulo}" for modulo in pre_importar]
+    if memoria_maxima_mb:
+        argumentos.append(f"--{classe}.memoria_maxima_mb={memoria_maxima_mb}")
+    if ociosidade:
+        argumentos += [f"--{classe}.cull_idle_timeout={ociosidade}",
+                       f"--{classe}.cull_interval={max(10, min(300, ociosidade // 4))}"]
+    return argumentos
+
+
+def _pool_do_ambiente():
+    try:
+        return int(os.environ.get("PACK_KERNEL_POOL", "0"))
+    except ValueError:
+        return 0
+
+
+def _modulos_pre_importacao():
+    import pack_lazy_imports
+    return [modulo for modulo, _ in pack_lazy_imports.modulos_fase1().values()]
+
+
+def listar():
+    """Servidores registrados que ainda respondem (os mortos saem do registro)"""
+    servidores = _ler_registro()
+    vivos = [s for s in servidores if responde(s)]
+    if len(vivos) != len(servidores):
+        _gravar_registro(vivos)
+    return vivos
+
+
+def iniciar(diretorio=None, porta=None, abrir_navegador=True, timeout=TIMEOUT_PRONTO, argumentos=(),
+            pool=None, pre_importar=None, memoria_maxima_mb=0, ociosidade=0):
+    """Sobe um Jupyter Lab e espera a API responder; retorna o registro do servidor
+
+    pool=None lê PACK_KERNEL_POOL; pre_importar=None lê PACK_KERNEL_POOL_PREIMPORTAR.
+    """
+    diretorio = os.path.abspath(diretorio or os.getcwd())
+    pool = _pool_do_ambiente() if pool is None else pool
+    if pre_importar is None:
+        pre_importar = os.environ.get("PACK_KERNEL_POOL_PREIMPORTAR", "") not in ("", "0")
+    porta = porta or porta_livre()
+    token = secrets.token_hex(24)
+    log = os.path.join(_diretorio_privado(), f"lab-{porta}.log")
+    comando = [sys.executable, "-m", "jupyter", "lab", "--no-browser",
+               f"--ServerApp.ip={HOST}", f"--ServerApp.port={porta}", "--ServerApp.port_retries=0",
+               f"--ServerApp.root_dir={diretorio}", f"{_argumento_token()}={token}", *argumentos]
+    if hasattr(os, "geteuid") and os.geteuid() == 0:
+        # Containers costumam rodar como root; sem isso o servidor se recusa a subir
+        comando.append("--allow-root")
+    ambiente = None
+    if pool > 0:
+        comando += argumentos_pool(pool, _modulos_pre_importacao() if pre_importar else (),
+                                   memoria_maxima_mb, ociosidade)
+        # O servidor importa pack_kernel_pool deste diretório
+        ambiente = dict(os.environ)
+        ambiente["PYTHONPATH"] = os.pathsep.join(filter(None, [DIRETORIO, ambiente.get("PYTHONPATH")]))
+    elif ociosidade:
+        comando.append(f"--MappingKernelManager.cull_idle_timeout={ociosidade}")
+
+    inicio = time.perf_counter()
+    with _abrir_privado(log) as saida:
+        processo = subprocess.Popen(comando, stdout=saida, stderr=subprocess.STDOUT,
+                                    stdin=subprocess.DEVNULL, env=ambiente, **_opcoes_processo())
+    servidor = {"pid": processo.pid, "porta": porta, "token": token, "diretorio": diretorio,
+                "url": f"http://{HOST}:{porta}/lab?token={token}", "log": log,
+                "iniciado_em": round(time.time(), 3), "segundos_pronto": None, "pool": pool}
+
+    while not responde(servidor):
+        if processo.poll() is not None:
+            raise JupyterErro(f"o Jupyter Lab terminou com código {processo.returncode} (veja {log})")
+        if time.perf_counter() - inicio > timeout:
+            processo.terminate()
+            raise JupyterErro(f"o Jupyter Lab não respondeu em {timeout}s (veja {log})")
+        time.sleep(INTERVALO_SONDAGEM)
+    servidor["segundos_pronto"] = round(time.perf_counter() - inicio, 3)
+
+    _gravar_registro(listar() + [servidor])
+    if abrir_navegador:
+        webbrowser.open(servidor["url"])
+    return servidor
+
+
+def parar(servidor, timeout=15):
+    """Encerra o servidor pela API (kernels incluídos); SIGTERM se ela não responder"""
+    try:
+        _api(servidor, "/api/shutdown", metodo="POST")
+    except (OSError, ValueError):
+        pass
+    limite = time.perf_counter() + timeout
+    while responde(servidor) and time.perf_counter() < limite:
+        time.sleep(INTERVALO_SONDAGEM)
+    if responde(servidor):
+        try:
+            os.kill(servidor["pid"], signal.SIGTERM)
+        except OSError:
+            pass
+    _gravar_registro([s for s in _ler_registro() if s["porta"] != servidor["porta"]])
+
+
+def encontrar(porta):
+    for servidor in listar():
+        if servidor["porta"] == porta:
+            return servidor
+    return None
+
+
+def imprimir_servidor(servidor):
+    print(f"🌐 {servidor['url']}")
+    print(f"   📂 {servidor['diretorio']}")
+    print(f"   ⏱️  pronto em {servidor['segundos_pronto']:.1f}s - pid {servidor['pid']} - log {servidor['log']}")
+    if servidor.get("pool"):
+        print(f"   🔥 pool de {servidor['pool']} kernels pré-aquecidos")
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Supervisor de servidores Jupyter Lab")
+    sub = parser.add_subparsers(dest="comando", required=True)
+    p_start = sub.add_parser("start", help="iniciar um Jupyter Lab numa porta livre")
+    p_start.add_argument("diretorio", nargs="?", help="pasta raiz (padrão: a atual)")
+    p_start.add_argument("--porta", type=int)
+    p_start.add_argument("--no-browser", action="store_true", help="não abrir o navegador")
+    p_start.add_argument("--timeout", type=int, default=TIMEOUT_PRONTO)
+    p_start.add_argument("--pool", type=int, default=None, help="kernels pré-aquecidos (padrão: PACK_KERNEL_POOL)")
+    p_start.add_argument("--pre-importar", action="store_true", default=None,
+                         help="importar a Fase 1 (numpy, pandas...) nos kernels do pool")
+    p_start.add_argument("--memoria-maxima", type=int, default=0, metavar="MB",
+                         help="teto de RSS somado dos kernels")
+    p_start.add_argument("--ociosidade", type=int, default=0, metavar="SEG",
+                         help="encerrar kernels ociosos há mais de SEG segundos")
+    sub.add_parser("list", help="listar os servidores em execução")
+    p_stop = sub.add_parser("stop", help="parar um servidor")
+    p_stop.add_argument("porta", type=int, nargs="?")
+    p_stop.add_argument("--all", action="store_true", help="parar todos")
+    args = parser.parse_args()
+
+    if args.comando == "start":
+        print("🚀 Iniciando Jupyter Lab...")
+        try:
+            servidor = iniciar(args.diretorio, args.porta, not args.no_browser, args.timeout, pool=args.pool,
+                               pre_importar=args.pre_importar, memoria_maxima_mb=args.memoria_maxima,
+                               ociosidade=args.ociosidade)
+        except JupyterErro as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        imprimir_servidor(servidor)
+        print(f"💡 Para parar: python {os.path.basename(__file__)} stop {servidor['porta']}")
+
+    elif args.comando == "list":
+        servidores = listar()
+        if not servidores:
+            print("ℹ️  Nenhum Jupyter Lab em execução")
+        for servidor in servidores:
+            imprimir_servidor(servidor)
+
+    else:
+        if args.all:
+            alvos = listar()
+        elif args.porta:
+            alvos = [s for s in [encontrar(args.porta)] if s]
+            if not alvos:
+                print(f"❌ Nenhum servidor na porta {args.porta}")
+                sys.exit(1)
+        else:
+            parser.error("informe a porta ou --all")
+        for servidor in alvos:
+            parar(servidor)
+            print(f"🛑 Jupyter Lab da porta {servidor['porta']} parado")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+# PACK KERNEL POOL: pool de kernels pré-aquecidos para o Jupyter Lab
+#
+# Gerenciador de kernels do jupyter_server que mantém N kernels já
+# iniciados (opcionalmente com numpy/pandas/... já importados) escondidos
+# da API. Quando um notebook pede um kernel, recebe um do pool - só falta
+# trocar o diretório de trabalho - e o pool é reposto em segundo plano.
+#
+# Memória sob controle:
+#   • memoria_maxima_mb      - teto de RSS somado de todos os kernels; acima
+#                              dele o pool encolhe e, se preciso, kernels
+#                              ociosos e sem conexão são encerrados
+#   • memoria_livre_minima_mb - o pool não repõe se a máquina tiver menos
+#                              memória disponível que isso
+#   • cull_idle_timeout      - o coletor de ociosos do próprio jupyter_server
+#                              (os kernels do pool ficam de fora)
+#
+# Usado pelo pack_jupyter (start --pool N); roda dentro do processo do
+# servidor, por isso importa jupyter_server direto.
+
+import asyncio
+
+from jupyter_server._tz import utcnow
+from jupyter_server.services.kernels.kernelmanager import AsyncMappingKernelManager
+from jupyter_server.utils import ensure_async
+from tornado.ioloop import PeriodicCallback
+from traitlets import Integer, List, Unicode
+
+_MB = 1024 * 1024
+
+
+def rss_processo(pid):
+    """RSS do processo em bytes (None se não der para ler /proc)"""
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as fp:
+            for linha in fp:
+                if linha.startswith("VmRSS:"):
+                    return int(linha.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def memoria_disponivel():
+    """MemAvailable em bytes (None fora do Linux)"""
+    try:
+        with open("/proc/meminfo", encoding="ascii") as fp:
+            for linha in fp:
+                if linha.startswith("MemAvailable:"):
+                    return int(linha.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+class PooledKernelManager(AsyncMappingKernelManager):
+    """AsyncMappingKernelManager que entrega kernels de um pool pré-aquecido"""
+
+    tamanho_pool = Integer(2, config=True, help="Kernels mantidos prontos no pool")
+    nome_kernel_pool = Unicode("", config=True, help="Kernelspec do pool (padrão: o kernel padrão)")
+    pre_importar = List(Unicode(), config=True, help="Módulos importados nos kernels do pool")
+    memoria_maxima_mb = Integer(0, config=True, help="Teto de RSS somado dos kernels (0 = sem teto)")
+    memoria_livre_minima_mb = Integer(1024, config=True, help="Não repor o pool abaixo desta memória livre")
+    intervalo_memoria = Integer(15, config=True, help="Segundos entre verificações de memória")
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._pool = []
+        # Iniciados mas ainda rodando a pré-importação: ocultos, mas não entregáveis
+        self._aquecendo = set()
+        self._repondo = False
+        self._encerrando = False
+        self._verificador = None
+        self._pool_iniciado = False
+        # O ServerApp cria o io_loop antes do gerenciador; o pool começa assim
+        # que o loop rodar. Sem ele (outro host), começa no primeiro start_kernel
+        io_loop = getattr(self.parent, "io_loop", None)
+        if io_loop is not None:
+            io_loop.add_callback(self._iniciar_pool)
+
+    def _iniciar_pool(self):
+        """Chamado dentro do loop em execução; só a primeira chamada tem efeito"""
+        if self._pool_iniciado:
+            return
+        self._pool_iniciado = True
+        if self.memoria_maxima_mb > 0:
+            self._verificador = PeriodicCallback(self._verificar_memoria, 1000 * self.intervalo_memoria)
+            self._verificador.start()
+        self._agendar_reposicao()
+
+    @property
+    def _nome_pool(self):
+        return self.nome_kernel_pool or self.default_kernel_name
+
+    # ------------------------------------------------------------------
+    # Pool
+    # ------------------------------------------------------------------
+
+    def _agendar_reposicao(self):
+        if not self._repondo and not self._encerrando and len(self._pool) < self.tamanho_pool:
+            self._repondo = True
+            asyncio.ensure_future(self._repor())
+
+    def _cabe_mais_um(self):
+        livre = memoria_disponivel()
+        if livre is not None and livre < self.memoria_livre_minima_mb * _MB:
+            return False
+        if self.memoria_maxima_mb > 0:
+            usados = [r for r in map(self._rss_kernel, self._kernels) if r]
+            estimativa = max(usados, default=0)
+            if sum(usados) + estimativa > self.memoria_maxima_mb * _MB:
+                return False
+        return True
+
+    async def _repor(self):
+        try:
+            while not self._encerrando and len(self._pool) < self.tamanho_pool and self._cabe_mais_um():
+                kernel_id = await super()._async_start_kernel(kernel_name=self._nome_pool)
+                self._aquecendo.add(kernel_id)
+                try:
+                    await self._executar(kernel_id, self._codigo_pre_importacao())
+                except Exception:
+                    self.log.exception("Pool de kernels: falha ao aquecer %s - encerrando", kernel_id)
+                    await ensure_async(self.shutdown_kernel(kernel_id, now=True))
+                    return
+                finally:
+                    self._aquecendo.discard(kernel_id)
+                if kernel_id not in self._kernels:
+                    # Encerrado durante o aquecimento (shutdown_all, teto de memória)
+                    continue
+                # Só entra no pool aquecido: start_kernel nunca recebe um kernel ainda importando
+                self._pool.append(kernel_id)
+                self.log.info("Pool de kernels: %s pronto (%d/%d)", kernel_id, len(self._pool), self.tamanho_pool)
+        except Exception:
+            self.log.exception("Pool de kernels: falha ao repor")
+        finally:
+            self._repondo = False
+
+    def _codigo_pre_importacao(self):
+        if not self.pre_importar:
+            return ""
+        # Só popula sys.modules: nenhum nome aparece no namespace do usuário
+        return (f"import importlib as _i\nfor _m in {list(self.pre_importar)!r}:\n"
+                "    try:\n        _i.import_module(_m)\n    except ImportError:\n        pass\n"
+                "del _i, _m\n")
+
+    async def _executar(self, kernel_id, codigo):
+        """Roda código silencioso no kernel (sem histórico nem contador de execução)"""
+        if not codigo:
+            return
+        cliente = self.get_kernel(kernel_id).client()
+        cliente.start_channels()
+        try:
+            await cliente.wait_for_ready(timeout=self.kernel_info_timeout)
+            await cliente.execute_interactive(codigo, silent=True, store_history=False,
+                                              timeout=self.kernel_info_timeout, output_hook=lambda msg: None)
+        finally:
+            cliente.stop_channels()
+
+    async def _async_start_kernel(self, *, kernel_id=None, path=None, **kwargs):
+        self._iniciar_pool()
+        nome = kwargs.get("kernel_name") or self.default_kernel_name
+        if kernel_id is None and nome == self._nome_pool and self._pool and set(kwargs) <= {"kernel_name", "env"}:
+            kernel_id = self._pool.pop(0)
+            self._agendar_reposicao()
+            # O kernel já está rodando: diretório e variáveis da sessão (JPY_SESSION_NAME) são aplicados nele
+            ajustes = f"import os as _os\n_os.environ.update({dict(kwargs.get('env') or {})!r})\n"
+            if path is not None:
+                ajustes += f"_os.chdir({self.cwd_for_path(path)!r})\n"
+            await self._executar(kernel_id, ajustes + "del _os\n")
+            # Ociosidade conta a partir da entrega, não de quando o kernel entrou no pool
+            self.get_kernel(kernel_id).last_activity = utcnow()
+            self.log.info("Pool de kernels: entregando %s (%d restantes)", kernel_id, len(self._pool))
+            return kernel_id
+        return await super()._async_start_kernel(kernel_id=kernel_id, path=path, **kwargs)
+
+    start_kernel = _async_start_kernel
+
+    # ------------------------------------------------------------------
+    # Kernels do pool não aparecem na API nem são coletados por ociosidade
+    # ------------------------------------------------------------------
+
+    async def _async_shutdown_all(self, now=False):
+        self._encerrando = True
+        if self._verificador:
+            self._verificador.stop()
+        await super()._async_shutdown_all(now=now)
+
+    shutdown_all = _async_shutdown_all
+
+    def list_kernels(self):
+        return [k for k in super().list_kernels() if k["id"] not in self._pool and k["id"] not in self._aquecendo]
+
+    async def cull_kernel_if_idle(self, kernel_id):
+        if kernel_id not in self._pool and kernel_id not in self._aquecendo:
+            await super().cull_kernel_if_idle(kernel_id)
+
+    def remove_kernel(self, kernel_id):
+        if kernel_id in self._pool:
+            self._pool.remove(kernel_id)
+            self._agendar_reposicao()
+        return super().remove_kernel(kernel_id)
+
+    # ------------------------------------------------------------------
+    # Memória
+    # ------------------------------------------------------------------
+
+    def _rss_kernel(self, kernel_id):
+        kernel = self._kernels.get(kernel_id)
+        pid = getattr(getattr(kernel, "provisioner", None), "pid", None)
+        return rss_processo(pid) if pid else None
+
+    async def _verificar_memoria(self):
+        teto = self.memoria_maxima_mb * _MB
+        uso = {k: self._rss_kernel(k) or 0 for k in list(self._kernels)}
+        total = sum(uso.values())
+        if total <= teto:
+            return
+
+        # Primeiro o pool (mais novo primeiro), depois os ociosos sem conexão há mais tempo
+        candidatos = list(reversed(self._pool))
+        ociosos = [k for k in self._kernels if k not in self._pool and k not in self._aquecendo
+                   and getattr(self._kernels[k], "execution_state", None) != "busy"
+                   and not self._kernel_connections.get(k, 0)]
+        candidatos += sorted(ociosos, key=lambda k: self._kernels[k].last_activity)
+        for kernel_id in candidatos:
+            if total <= teto:
+                break
+            self.log.warning("Pool de kernels: %.0fMB acima do teto de %dMB, encerrando %s",
+                             (total - teto) / _MB, self.memoria_maxima_mb, kernel_id)
+            if kernel_id in self._pool:
+                self._pool.remove(kernel_id)
+            total -= uso.get(kernel_id, 0)
+            await ensure_async(self.shutdown_kernel(kernel_id))
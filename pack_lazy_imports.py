@@ -0,0 +1,209 @@
+# PACK LAZY IMPORTS: custo de import da Fase 1 e shim de imports preguiçosos
+#
+# Kernels e scripts pagam na partida o import de numpy, pandas, scipy,
+# matplotlib, seaborn e plotly mesmo quando não usam nenhum deles. Este
+# módulo:
+#   • perfila o custo de cada módulo com -X importtime (isolado e combinado)
+#   • gera um arquivo de startup (IPython ou PYTHONSTARTUP) que cria np, pd,
+#     sp, plt, sns e px como proxies: o import real acontece no primeiro
+#     acesso a um atributo
+#   • mede a partida fria e quente antes (imports diretos) e depois (shim)
+#
+# "Fria" = bytecode ainda não compilado (pycache_prefix vazio); "quente" =
+# mesma partida com o bytecode já em cache.
+#
+#   python pack_lazy_imports.py                  → perfil + antes/depois
+#   python pack_lazy_imports.py --instalar       → grava no startup do IPython
+#   python pack_lazy_imports.py --saida shim.py  → grava em outro lugar
+#   python pack_lazy_imports.py --remover
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import pack_catalog
+import pack_import_tester
+import pack_index
+
+# pacote → (módulo importado, apelido usual)
+PESADOS = {
+    "numpy": ("numpy", "np"),
+    "pandas": ("pandas", "pd"),
+    "scipy": ("scipy", "sp"),
+    "matplotlib": ("matplotlib.pyplot", "plt"),
+    "seaborn": ("seaborn", "sns"),
+    "plotly": ("plotly.express", "px"),
+}
+ARQUIVO_STARTUP = "00-pack-lazy-imports.py"
+
+_SHIM = '''# Gerado por pack_lazy_imports.py - imports pesados adiados até o primeiro uso
+import importlib as _importlib
+
+
+class _ModuloPreguicoso:
+    """Proxy que importa o módulo no primeiro acesso e se troca por ele no namespace"""
+
+    def __init__(self, nome, apelido, namespace):
+        self.__dict__.update(_nome=nome, _apelido=apelido, _namespace=namespace, _modulo=None)
+
+    def _carregar(self):
+        if self._modulo is None:
+            self.__dict__["_modulo"] = _importlib.import_module(self._nome)
+            if self._namespace.get(self._apelido) is self:
+                self._namespace[self._apelido] = self._modulo
+        return self._modulo
+
+    def __getattr__(self, atributo):
+        return getattr(self._carregar(), atributo)
+
+    def __setattr__(self, atributo, valor):
+        setattr(self._carregar(), atributo, valor)
+
+    def __dir__(self):
+        return dir(self._carregar())
+
+    def __repr__(self):
+        estado = "carregado" if self._modulo is not None else "ainda não importado"
+        return f"<módulo preguiçoso {self._nome!r} ({estado})>"
+
+
+{proxies}
+del _ModuloPreguicoso
+'''
+
+
+def modulos_fase1():
+    """{pacote: (módulo, apelido)} dos pacotes pesados da Fase 1 que estão instalados"""
+    fase1 = pack_catalog.pacotes_do_menu("fase1")
+    return {p: PESADOS[p] for p in PESADOS if p in fase1 and pack_index.indice.instalado(p)}
+
+
+def gerar_shim(modulos):
+    """Código do arquivo de startup com um proxy por módulo"""
+    proxies = "\n".join(f"{apelido} = _ModuloPreguicoso({modulo!r}, {apelido!r}, globals())"
+                        for modulo, apelido in modulos.values())
+    return _SHIM.replace("{proxies}", proxies)
+
+
+def codigo_direto(modulos):
+    """Equivalente sem shim: os imports que um startup comum faria"""
+    return "\n".join(f"import {modulo} as {apelido}" for modulo, apelido in modulos.values())
+
+
+def diretorio_startup_ipython(perfil="default"):
+    """Diretório de startup do perfil do IPython (respeita IPYTHONDIR)"""
+    base = os.environ.get("IPYTHONDIR") or os.path.join(os.path.expanduser("~"), ".ipython")
+    return os.path.join(base, f"profile_{perfil}", "startup")
+
+
+def perfil_combinado(modulos):
+    """Importa tudo em um só processo; retorna ([(módulo, custo_incremental_us)], top submódulos)
+
+    O custo é incremental: pandas não conta de novo o numpy que já foi
+    importado antes dele, como acontece num startup real.
+    """
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", codigo_direto(modulos)],
+                          capture_output=True, text=True)
+    linhas = pack_import_tester.ler_importtime(proc.stderr)
+    cumulativo = {nome: cum for nome, _, cum in linhas}
+    por_modulo = []
+    for modulo, _ in modulos.values():
+        # "matplotlib.pyplot" custa também o pacote "matplotlib" se ele veio primeiro por ele
+        custo = max((cum for nome, cum in cumulativo.items() if nome in (modulo, modulo.split(".")[0])), default=0)
+        por_modulo.append((modulo, custo))
+    return por_modulo, sorted(linhas, key=lambda l: l[1], reverse=True)
+
+
+def medir_partida(codigo, repeticoes=5):
+    """(fria, quente) em segundos para `python -c codigo`, com um pycache_prefix novo"""
+    with tempfile.TemporaryDirectory(prefix="pack-pycache-") as prefixo:
+        comando = [sys.executable, "-X", f"pycache_prefix={prefixo}", "-c", codigo]
+        # Sem isso a partida "quente" nunca acharia bytecode em cache
+        env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+
+        def rodar():
+            inicio = time.perf_counter()
+            subprocess.run(comando, check=True, capture_output=True, env=env)
+            return time.perf_counter() - inicio
+
+        fria = rodar()
+        quente = statistics.median(rodar() for _ in range(repeticoes))
+    return fria, quente
+
+
+def instalar(destino, modulos):
+    os.makedirs(os.path.dirname(os.path.abspath(destino)), exist_ok=True)
+    with open(destino, "w", encoding="utf-8") as fp:
+        fp.write(gerar_shim(modulos))
+    print(f"✅ Shim gravado em {destino}")
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Perfil de import da Fase 1 e shim de imports preguiçosos")
+    acao = parser.add_mutually_exclusive_group()
+    acao.add_argument("--instalar", action="store_true", help="gravar o shim no startup do IPython")
+    acao.add_argument("--saida", metavar="ARQUIVO", help="gravar o shim neste arquivo (ex.: PYTHONSTARTUP)")
+    acao.add_argument("--remover", action="store_true", help="apagar o shim do startup do IPython")
+    parser.add_argument("--perfil", default="default", help="perfil do IPython (padrão: default)")
+    parser.add_argument("--repeticoes", type=int, default=5, help="partidas quentes medidas")
+    parser.add_argument("--top", type=int, default=8, help="submódulos mais caros exibidos")
+    args = parser.parse_args()
+    destino_ipython = os.path.join(diretorio_startup_ipython(args.perfil), ARQUIVO_STARTUP)
+
+    if args.remover:
+        if os.path.exists(destino_ipython):
+            os.remove(destino_ipython)
+            print(f"🗑️  Shim removido de {destino_ipython}")
+        else:
+            print(f"ℹ️  Nenhum shim em {destino_ipython}")
+        return
+
+    modulos = modulos_fase1()
+    if not modulos:
+        print("❌ Nenhum dos pacotes pesados da Fase 1 está instalado")
+        sys.exit(1)
+
+    print(f"🔍 PERFIL DE IMPORT - FASE 1 ({', '.join(modulos)})")
+    print("=" * 70)
+    isolados = {r["modulo"]: r for r in pack_import_tester.testar_varios(list(modulos), max_workers=1,
+                                                                        modulos={p: m for p, (m, _) in modulos.items()})}
+    combinado, submodulos = perfil_combinado(modulos)
+    print(f"{'módulo':20} {'isolado':>10} {'no startup':>12}")
+    print("-" * 70)
+    for modulo, incremental_us in combinado:
+        r = isolados[modulo]
+        isolado = f"{r['segundos'] * 1000:.0f}ms" if r["ok"] else "❌"
+        print(f"{modulo:20} {isolado:>10} {incremental_us / 1000:>10.0f}ms")
+    print("-" * 70)
+    print("Submódulos mais caros (tempo próprio):")
+    for nome, self_us, _ in submodulos[:args.top]:
+        print(f"   {self_us / 1000:>7.1f}ms  {nome}")
+
+    print("\n⏱️  PARTIDA DO INTERPRETADOR")
+    print("=" * 70)
+    print(f"{'':28} {'fria':>10} {'quente':>10}")
+    medidas = {
+        "sem nada": medir_partida("pass", args.repeticoes),
+        "antes (imports diretos)": medir_partida(codigo_direto(modulos), args.repeticoes),
+        "depois (shim)": medir_partida(gerar_shim(modulos), args.repeticoes),
+    }
+    for nome, (fria, quente) in medidas.items():
+        print(f"{nome:28} {fria * 1000:>8.0f}ms {quente * 1000:>8.0f}ms")
+    economia = medidas["antes (imports diretos)"][1] - medidas["depois (shim)"][1]
+    print("=" * 70)
+    print(f"💡 O shim poupa ~{economia * 1000:.0f}ms por partida quente; o custo só é pago no primeiro uso")
+
+    if args.instalar:
+        instalar(destino_ipython, modulos)
+    elif args.saida:
+        instalar(args.saida, modulos)
+        print(f"   Para o REPL padrão: export PYTHONSTARTUP={os.path.abspath(args.saida)}")
+
+
+if __name__ == "__main__":
+    main()
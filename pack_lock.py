@@ -0,0 +1,145 @@
+# PACK LOCK: lockfiles por Fase e reinstalação rápida com hashes
+#
+#   python pack_lock.py congelar --fase 2    → locks/fase2.txt
+#   python pack_lock.py instalar --fase 2    → instala exatamente o lock
+#
+# O lock contém o conjunto resolvido completo (dependências transitivas
+# incluídas) no formato de requirements do pip, com versão e sha256:
+#
+#   numpy==2.1.3 \
+#       --hash=sha256:...
+#
+# A instalação usa `--no-deps --require-hashes`: o resolver não roda, cada
+# arquivo é conferido pelo hash e as wheels já presentes no wheelhouse local
+# são reaproveitadas (também entre máquinas, copiando o wheelhouse).
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from urllib.parse import unquote, urlparse
+
+import pack_backend
+import pack_index
+import pack_wheelhouse
+
+DIRETORIO_LOCKS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locks")
+
+
+def caminho_lock(fase):
+    """Caminho padrão do lockfile de uma Fase"""
+    return os.path.join(DIRETORIO_LOCKS, f"fase{fase}.txt")
+
+
+def _sha256_do_item(item):
+    """Extrai o sha256 do artefato escolhido pelo resolver"""
+    info = item.get("download_info", {})
+    arquivo = info.get("archive_info", {})
+    if arquivo.get("hashes", {}).get("sha256"):
+        return arquivo["hashes"]["sha256"]
+    if arquivo.get("hash", "").startswith("sha256="):
+        return arquivo["hash"].split("=", 1)[1]
+
+    url = urlparse(info.get("url", ""))
+    if url.scheme == "file":
+        return pack_wheelhouse.sha256_arquivo(unquote(url.path))
+    return None
+
+
+def resolver(pacotes, extra_args=None):
+    """Resolve o conjunto completo (ignorando o que já está instalado); retorna [(nome, versão, sha256)]"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        relatorio = os.path.join(tmpdir, "report.json")
+        result = subprocess.run(
+            [sys.executable, "-m", "pip", "install", "--dry-run", "--quiet", "--ignore-installed",
+             "--report", relatorio, *pack_wheelhouse.argumentos_pip(), *(extra_args or []), *pacotes],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip().split('\n')[-1])
+        with open(relatorio, encoding="utf-8") as fp:
+            dados = json.load(fp)
+
+    itens = []
+    for item in dados.get("install", []):
+        nome = pack_index.normalizar_nome(item["metadata"]["name"])
+        itens.append((nome, item["metadata"]["version"], _sha256_do_item(item)))
+    return sorted(itens)
+
+
+def congelar(fase, saida=None, extra_args=None):
+    """Gera o lockfile de uma Fase; retorna (caminho, itens)"""
+    # Os índices do catálogo (torch da CPU) entram na resolução e no próprio lockfile
+    pacotes, indices = pack_wheelhouse.lote_da_fase(fase)
+    itens = resolver(pacotes, [*(extra_args or []), *indices])
+
+    saida = saida or caminho_lock(fase)
+    os.makedirs(os.path.dirname(os.path.abspath(saida)), exist_ok=True)
+    with open(saida, "w", encoding="utf-8") as fp:
+        fp.write(f"# Lockfile da Fase {fase} - gerado por pack_lock.py\n")
+        fp.write(f"# Python {platform.python_version()} / {sys.platform} / {platform.machine()}\n")
+        fp.write(f"# Pacotes: {', '.join(pacotes)}\n")
+        for url in dict.fromkeys(indices[1::2]):
+            fp.write(f"--extra-index-url {url}\n")
+        for nome, versao, sha256 in itens:
+            if sha256:
+                fp.write(f"{nome}=={versao} \\\n    --hash=sha256:{sha256}\n")
+            else:
+                fp.write(f"{nome}=={versao}\n")
+    return saida, itens
+
+
+def instalar(fase=None, arquivo=None, extra_args=None):
+    """Instala um lockfile sem resolver, conferindo os hashes"""
+    arquivo = arquivo or caminho_lock(fase)
+    if not os.path.exists(arquivo):
+        print(f"❌ Lockfile não encontrado: {arquivo}")
+        print(f"💡 Gere com: python pack_lock.py congelar --fase {fase}")
+        return False
+
+    command = pack_backend.comando_install(["--no-deps", "--require-hashes", *(extra_args or []), "-r", arquivo])
+    result = pack_backend.executar(command)
+    pack_index.invalidar()
+    return result.returncode == 0
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Lockfiles por Fase com hashes sha256")
+    parser.add_argument("--offline", action="store_true", help="usar apenas o wheelhouse local")
+    parser.add_argument("--no-pause", action="store_true", help="não aguardar Enter (CI)")
+    parser.add_argument("--backend", choices=["auto", "pip", "uv"], help="backend de instalação")
+    sub = parser.add_subparsers(dest="comando", required=True)
+    for nome, ajuda in (("congelar", "resolver a Fase e gravar o lockfile"),
+                        ("instalar", "instalar o lockfile sem resolver")):
+        p = sub.add_parser(nome, help=ajuda)
+        p.add_argument("--fase", type=int, choices=[1, 2, 3, 4], required=True)
+        p.add_argument("--arquivo", help="caminho do lockfile (padrão: locks/faseN.txt)")
+        p.add_argument("--extra-index-url", action="append", default=[])
+    args = parser.parse_args()
+    extra = [a for url in args.extra_index_url for a in ("--extra-index-url", url)]
+
+    if args.comando == "congelar":
+        print(f"🔒 Resolvendo a Fase {args.fase}...")
+        try:
+            saida, itens = congelar(args.fase, args.arquivo, extra)
+        except RuntimeError as e:
+            print(f"❌ Erro ao resolver: {e}")
+            sys.exit(1)
+        sem_hash = [nome for nome, _, sha256 in itens if not sha256]
+        print(f"✅ {len(itens)} distribuições travadas em {saida}")
+        if sem_hash:
+            print(f"⚠️  Sem hash: {', '.join(sem_hash)}")
+    else:
+        print(f"🚀 Instalando o lock da Fase {args.fase} (sem resolver, com hashes)...")
+        ok = instalar(args.fase, args.arquivo, extra)
+        print("✅ Lock instalado!" if ok else "❌ Falha ao instalar o lock")
+        sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,59 +3,36 @@
 # PyTorch: ~1.8GB
 # Keras: ~200MB
 
-import importlib
-import sys
+import pack_import_tester
+import pack_progress
 
-def test_import(package_name):
-    """Testa se um pacote pode ser importado"""
-    try:
-        importlib.import_module(package_name)
-        print(f"✅ {package_name} - OK")
-        return True
-    except ImportError as e:
-        print(f"❌ {package_name} - Erro: {e}")
-        return False
-    except Exception as e:
-        print(f"⚠️  {package_name} - Aviso: {e}")
-        return True
+PACOTES = ["tensorflow", "torch", "keras"]
 
 print("🧪 TESTANDO INSTALAÇÃO DE MACHINE LEARNING")
 print("=" * 50)
 
-print("🔍 Testando importações...")
+print("🔍 Testando importações (cada pacote em um processo isolado)...")
 print("-" * 30)
 
+resultados = pack_import_tester.testar_varios(PACOTES, max_workers=len(PACOTES))
 success = 0
-total = 3
-
-# Testar TensorFlow
-if test_import("tensorflow"):
-    success += 1
-    try:
-        import tensorflow as tf
-        print(f"   Versão: {tf.__version__}")
-        print(f"   GPU disponível: {'Sim' if tf.config.list_physical_devices('GPU') else 'Não'}")
-    except:
-        pass
-
-# Testar PyTorch
-if test_import("torch"):
-    success += 1
-    try:
-        import torch
-        print(f"   Versão: {torch.__version__}")
-        print(f"   CUDA disponível: {torch.cuda.is_available()}")
-    except:
-        pass
-
-# Testar Keras
-if test_import("keras"):
-    success += 1
-    try:
-        import keras
-        print(f"   Versão: {keras.__version__}")
-    except:
-        pass
+total = len(PACOTES)
+
+for resultado in resultados:
+    if resultado["ok"] and resultado["aviso"]:
+        # Como antes: o import reclamou (não foi ImportError) - aviso, mas conta como funcionando
+        success += 1
+        aviso = resultado["aviso"].strip().splitlines()
+        print(f"⚠️  {resultado['pacote']} - Aviso: {aviso[-1] if aviso else 'desconhecido'}")
+    elif resultado["ok"]:
+        success += 1
+        print(f"✅ {resultado['pacote']} - OK ({resultado['segundos']:.1f}s)")
+        print(f"   Versão: {resultado['versao']}")
+        if resultado["sonda"] is not None:
+            print(f"   {resultado['sonda_rotulo']}: {resultado['sonda']}")
+    else:
+        erro = (resultado["erro"] or "").strip().splitlines()
+        print(f"❌ {resultado['pacote']} - Erro: {erro[-1] if erro else 'desconhecido'}")
 
 print("-" * 30)
 print(f"📊 Resultado: {success}/{total} pacotes funcionando")
@@ -63,6 +40,7 @@ print(f"📊 Resultado: {success}/{total} pacotes funcionando")
 if success == total:
     print("🎉 Tudo pronto para aprender Machine Learning!")
 else:
-    print("💡 Execute update_machine_learning.py para corrigir problemas")
+    print("💡 Execute pack_machine_learning_update.py para corrigir problemas")
+print("💡 Relatório completo de tempos: python pack_import_tester.py --fase 2")
 
-input("\nPressione Enter para sair...")
+pack_progress.pausar("\nPressione Enter para sair...")
@@ -0,0 +1,328 @@
+# PACK ML BENCHMARK: teste de aceitação de desempenho em CPU do stack de ML
+#
+# Para cada framework instalado (numpy, torch, tensorflow), em um subprocesso
+# próprio, roda cargas de tamanho fixo:
+#   • matmul   - float32 1024x1024 @ 1024x1024
+#   • conv2d   - lote 8, 64→64 canais, 56x56, kernel 3x3
+#   • mlp_step - MLP 1024-1024-1024-10, lote 256, forward + backward + SGD
+# e informa GFLOP/s, threads em uso e a biblioteca de kernels ativa
+# (oneDNN/MKL/OpenBLAS, capacidade AVX).
+#
+# O resultado é comparado com uma baseline gravada: uma wheel ruim (build
+# sem AVX, BLAS de referência, threads presas em 1) aparece como regressão
+# na hora da instalação, não em produção.
+#
+#   python pack_ml_benchmark.py                    → mede e compara
+#   python pack_ml_benchmark.py --salvar-baseline  → grava a baseline
+#
+# Os instaladores do catálogo (CatalogInstaller) rodam o benchmark logo
+# depois de instalar numpy/torch/tensorflow quando pedidos com --benchmark
+# ou PACK_BENCHMARK=1 (desligado por padrão: leva alguns segundos por
+# framework).
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+
+import pack_index
+
+FRAMEWORKS = ("numpy", "torch", "tensorflow")
+# Abaixo de (1 - TOLERANCIA) x baseline é regressão
+TOLERANCIA = 0.30
+TIMEOUT = 600
+_MARCA = "@@pack_ml_benchmark@@"
+# Rodar depois das instalações do catálogo (opt-in)
+APOS_INSTALAR = "--benchmark" in sys.argv or os.environ.get("PACK_BENCHMARK", "") not in ("", "0")
+
+# FLOPs de cada carga (multiplicação + soma contam 2)
+N_MATMUL = 1024
+CONV = {"lote": 8, "canais": 64, "lado": 56, "kernel": 3}
+MLP = {"lote": 256, "camadas": (1024, 1024, 1024, 10)}
+FLOPS = {
+    "matmul": 2 * N_MATMUL ** 3,
+    "conv2d": 2 * CONV["lote"] * CONV["lado"] ** 2 * CONV["canais"] ** 2 * CONV["kernel"] ** 2,
+    # backward custa ~2x o forward
+    "mlp_step": 3 * 2 * MLP["lote"] * sum(a * b for a, b in zip(MLP["camadas"], MLP["camadas"][1:])),
+}
+
+_COMUM = r"""
+import json, os, statistics, sys, time
+PARAMS = json.loads(sys.argv[1])
+MARCA = sys.argv[2]
+
+def medir(fn, flops, tempo_minimo=PARAMS["tempo_minimo"]):
+    fn(); fn()
+    tempos = []
+    inicio = time.perf_counter()
+    while len(tempos) < 3 or (time.perf_counter() - inicio < tempo_minimo and len(tempos) < 50):
+        t = time.perf_counter()
+        fn()
+        tempos.append(time.perf_counter() - t)
+    mediana = statistics.median(tempos)
+    return {"gflops": flops / mediana / 1e9, "segundos": mediana, "repeticoes": len(tempos)}
+
+def responder(dados):
+    sys.stdout.write("\n%s%s\n" % (MARCA, json.dumps(dados)))
+"""
+
+_NUMPY = r"""
+import numpy as np
+N, C, M = PARAMS["n_matmul"], PARAMS["conv"], PARAMS["mlp"]
+rng = np.random.default_rng(0)
+a = rng.standard_normal((N, N), dtype=np.float32)
+b = rng.standard_normal((N, N), dtype=np.float32)
+
+camadas = M["camadas"]
+x = rng.standard_normal((M["lote"], camadas[0]), dtype=np.float32)
+y = rng.standard_normal((M["lote"], camadas[-1]), dtype=np.float32)
+pesos = [rng.standard_normal((i, o), dtype=np.float32) * 0.01 for i, o in zip(camadas, camadas[1:])]
+
+# conv2d como im2col + GEMM (o que o numpy tem de mais próximo de uma convolução)
+entrada = rng.standard_normal((C["lote"], C["canais"], C["lado"], C["lado"]), dtype=np.float32)
+filtro = rng.standard_normal((C["canais"], C["canais"], C["kernel"], C["kernel"]), dtype=np.float32)
+borda = C["kernel"] // 2
+entrada = np.pad(entrada, ((0, 0), (0, 0), (borda, borda), (borda, borda)))
+
+def conv2d():
+    janelas = np.lib.stride_tricks.sliding_window_view(entrada, (C["kernel"], C["kernel"]), axis=(2, 3))
+    return np.tensordot(janelas, filtro, axes=([1, 4, 5], [1, 2, 3]))
+
+def mlp_step():
+    ativacoes = [x]
+    for w in pesos[:-1]:
+        ativacoes.append(np.maximum(ativacoes[-1] @ w, 0))
+    grad = (ativacoes[-1] @ pesos[-1] - y) / len(x)
+    for i in range(len(pesos) - 1, -1, -1):
+        grad_w = ativacoes[i].T @ grad
+        if i:
+            grad = (grad @ pesos[i].T) * (ativacoes[i] > 0)
+        pesos[i] -= 0.01 * grad_w
+
+try:
+    blas = np.show_config(mode="dicts")["Build Dependencies"]["blas"]
+    kernels = f"{blas.get('name')} {blas.get('version', '')}".strip()
+except Exception:
+    kernels = "?"
+try:
+    from threadpoolctl import threadpool_info
+    threads = max(i["num_threads"] for i in threadpool_info()) if threadpool_info() else None
+except ImportError:
+    threads = None
+
+responder({"versao": np.__version__, "threads": threads, "kernels": kernels, "testes": {
+    "matmul": medir(lambda: a @ b, PARAMS["flops"]["matmul"]),
+    "conv2d": medir(conv2d, PARAMS["flops"]["conv2d"]),
+    "mlp_step": medir(mlp_step, PARAMS["flops"]["mlp_step"]),
+}})
+"""
+
+_TORCH = r"""
+import torch
+N, C, M = PARAMS["n_matmul"], PARAMS["conv"], PARAMS["mlp"]
+torch.manual_seed(0)
+a, b = torch.randn(N, N), torch.randn(N, N)
+entrada = torch.randn(C["lote"], C["canais"], C["lado"], C["lado"])
+conv = torch.nn.Conv2d(C["canais"], C["canais"], C["kernel"], padding=C["kernel"] // 2, bias=False)
+
+camadas = M["camadas"]
+modulos = []
+for i, o in zip(camadas, camadas[1:]):
+    modulos += [torch.nn.Linear(i, o, bias=False), torch.nn.ReLU()]
+mlp = torch.nn.Sequential(*modulos[:-1])
+otimizador = torch.optim.SGD(mlp.parameters(), lr=0.01)
+x, y = torch.randn(M["lote"], camadas[0]), torch.randn(M["lote"], camadas[-1])
+
+def mlp_step():
+    otimizador.zero_grad()
+    torch.nn.functional.mse_loss(mlp(x), y).backward()
+    otimizador.step()
+
+kernels = []
+if torch.backends.mkldnn.is_available():
+    kernels.append("oneDNN")
+if torch.backends.mkl.is_available():
+    kernels.append("MKL")
+for linha in torch.__config__.show().splitlines():
+    if "BLAS_INFO=" in linha:
+        kernels.append("BLAS=" + linha.split("BLAS_INFO=")[1].split(",")[0])
+try:
+    kernels.append("CPU=" + torch.backends.cpu.get_cpu_capability())
+except AttributeError:
+    pass
+
+with torch.no_grad():
+    matmul = medir(lambda: a @ b, PARAMS["flops"]["matmul"])
+    conv2d = medir(lambda: conv(entrada), PARAMS["flops"]["conv2d"])
+responder({"versao": torch.__version__, "threads": torch.get_num_threads(), "kernels": ", ".join(kernels),
+           "testes": {"matmul": matmul, "conv2d": conv2d,
+                      "mlp_step": medir(mlp_step, PARAMS["flops"]["mlp_step"])}})
+"""
+
+_TENSORFLOW = r"""
+os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "2")
+import tensorflow as tf
+N, C, M = PARAMS["n_matmul"], PARAMS["conv"], PARAMS["mlp"]
+tf.random.set_seed(0)
+a, b = tf.random.normal((N, N)), tf.random.normal((N, N))
+entrada = tf.random.normal((C["lote"], C["lado"], C["lado"], C["canais"]))
+filtro = tf.random.normal((C["kernel"], C["kernel"], C["canais"], C["canais"]))
+
+camadas = M["camadas"]
+pesos = [tf.Variable(tf.random.normal((i, o)) * 0.01) for i, o in zip(camadas, camadas[1:])]
+x, y = tf.random.normal((M["lote"], camadas[0])), tf.random.normal((M["lote"], camadas[-1]))
+
+@tf.function
+def mlp_step():
+    with tf.GradientTape() as fita:
+        h = x
+        for w in pesos[:-1]:
+            h = tf.nn.relu(h @ w)
+        perda = tf.reduce_mean(tf.square(h @ pesos[-1] - y))
+    for w, g in zip(pesos, fita.gradient(perda, pesos)):
+        w.assign_sub(0.01 * g)
+
+kernels = []
+try:
+    from tensorflow.python.util import _pywrap_util_port
+    kernels.append("oneDNN" if _pywrap_util_port.IsMklEnabled() else "sem oneDNN")
+except Exception:
+    kernels.append("oneDNN=" + os.environ.get("TF_ENABLE_ONEDNN_OPTS", "padrão"))
+threads = tf.config.threading.get_intra_op_parallelism_threads() or os.cpu_count()
+
+responder({"versao": tf.__version__, "threads": threads, "kernels": ", ".join(kernels), "testes": {
+    "matmul": medir(lambda: (a @ b).numpy(), PARAMS["flops"]["matmul"]),
+    "conv2d": medir(lambda: tf.nn.conv2d(entrada, filtro, 1, "SAME").numpy(), PARAMS["flops"]["conv2d"]),
+    "mlp_step": medir(mlp_step, PARAMS["flops"]["mlp_step"]),
+}})
+"""
+
+_CODIGO = {"numpy": _NUMPY, "torch": _TORCH, "tensorflow": _TENSORFLOW}
+
+
+def caminho_baseline():
+    """Baseline padrão (PACK_ML_BASELINE ou no diretório de cache)"""
+    return os.environ.get("PACK_ML_BASELINE") or os.path.join(pack_index.diretorio_cache(), "ml_benchmark_baseline.json")
+
+
+def modelo_cpu():
+    """Nome do processador (para não comparar máquinas diferentes sem aviso)"""
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as fp:
+            for linha in fp:
+                if linha.startswith("model name"):
+                    return linha.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def medir_framework(framework, tempo_minimo=1.0, timeout=TIMEOUT):
+    """Roda as cargas de um framework em um subprocesso; retorna o dicionário de resultados"""
+    params = {"n_matmul": N_MATMUL, "conv": CONV, "mlp": MLP, "flops": FLOPS, "tempo_minimo": tempo_minimo}
+    try:
+        proc = subprocess.run([sys.executable, "-c", _COMUM + _CODIGO[framework], json.dumps(params), _MARCA],
+                              capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {"erro": f"tempo esgotado ({timeout}s)"}
+    for linha in proc.stdout.splitlines():
+        if linha.startswith(_MARCA):
+            return json.loads(linha[len(_MARCA):])
+    linhas = [l for l in proc.stderr.splitlines() if l.strip()]
+    return {"erro": linhas[-1] if linhas else f"processo terminou com código {proc.returncode}"}
+
+
+def medir_tudo(frameworks=None, tempo_minimo=1.0):
+    """{framework: resultado} para os frameworks instalados"""
+    frameworks = frameworks or [f for f in FRAMEWORKS if pack_index.indice.instalado(f)]
+    # Em sequência: rodar em paralelo faria os frameworks disputarem os núcleos
+    return {framework: medir_framework(framework, tempo_minimo) for framework in frameworks}
+
+
+def comparar(resultados, baseline, tolerancia=TOLERANCIA):
+    """Retorna [(framework, teste, gflops, gflops_baseline, regrediu)]"""
+    linhas = []
+    for framework, resultado in resultados.items():
+        for teste, medida in resultado.get("testes", {}).items():
+            referencia = baseline.get("resultados", {}).get(framework, {}).get("testes", {}).get(teste)
+            gflops_ref = referencia["gflops"] if referencia else None
+            regrediu = gflops_ref is not None and medida["gflops"] < gflops_ref * (1 - tolerancia)
+            linhas.append((framework, teste, medida["gflops"], gflops_ref, regrediu))
+    return linhas
+
+
+def ler_baseline(caminho):
+    try:
+        with open(caminho, encoding="utf-8") as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        return None
+
+
+def salvar_baseline(caminho, resultados):
+    os.makedirs(os.path.dirname(os.path.abspath(caminho)), exist_ok=True)
+    with open(caminho, "w", encoding="utf-8") as fp:
+        json.dump({"cpu": modelo_cpu(), "nucleos": os.cpu_count(), "python": platform.python_version(),
+                   "resultados": resultados}, fp, indent=1, ensure_ascii=False)
+
+
+def verificar(frameworks=None, caminho=None, salvar=False, tolerancia=TOLERANCIA, tempo_minimo=1.0):
+    """Mede, compara com a baseline e imprime a tabela; retorna True se não houve falha nem regressão"""
+    caminho = caminho or caminho_baseline()
+    print(f"🧮 BENCHMARK DE CPU - {modelo_cpu()} ({os.cpu_count()} núcleos)")
+    print("=" * 70)
+    resultados = medir_tudo(frameworks, tempo_minimo)
+    if not resultados:
+        print("❌ Nenhum framework (numpy, torch, tensorflow) instalado")
+        return False
+
+    baseline = None if salvar else ler_baseline(caminho)
+    if baseline and baseline.get("cpu") != modelo_cpu():
+        print(f"⚠️  Baseline gravada em outra CPU ({baseline.get('cpu')})")
+
+    for framework, resultado in resultados.items():
+        if "erro" in resultado:
+            print(f"❌ {framework}: {resultado['erro']}")
+        else:
+            print(f"📦 {framework} {resultado['versao']} - threads: {resultado['threads'] or '?'}"
+                  f" - kernels: {resultado['kernels']}")
+
+    print("-" * 70)
+    print(f"{'framework':12} {'teste':10} {'GFLOP/s':>10} {'baseline':>10}  status")
+    regressoes = 0
+    for framework, teste, gflops, gflops_ref, regrediu in comparar(resultados, baseline or {}, tolerancia):
+        regressoes += regrediu
+        ref = f"{gflops_ref:.1f}" if gflops_ref is not None else "-"
+        status = "❌ regressão" if regrediu else ("✅" if gflops_ref is not None else "🆕")
+        print(f"{framework:12} {teste:10} {gflops:>10.1f} {ref:>10}  {status}")
+    print("=" * 70)
+
+    falhas = sum(1 for r in resultados.values() if "erro" in r)
+    if salvar:
+        salvar_baseline(caminho, {f: r for f, r in resultados.items() if "erro" not in r})
+        print(f"💾 Baseline gravada em {caminho}")
+    elif baseline is None:
+        print(f"💡 Sem baseline em {caminho} - grave uma com pack_ml_benchmark.py --salvar-baseline")
+    return not (regressoes or falhas)
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Benchmark de aceitação em CPU do stack de ML")
+    parser.add_argument("frameworks", nargs="*", help=f"{', '.join(FRAMEWORKS)} (padrão: os instalados)")
+    parser.add_argument("--baseline", default=None, help="arquivo da baseline (padrão: no cache)")
+    parser.add_argument("--salvar-baseline", action="store_true", help="gravar o resultado como nova baseline")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA, help="queda aceita (0.30 = 30%%)")
+    parser.add_argument("--tempo-minimo", type=float, default=1.0, help="segundos medidos por carga")
+    args = parser.parse_args()
+    desconhecidos = set(args.frameworks) - set(FRAMEWORKS)
+    if desconhecidos:
+        parser.error(f"framework desconhecido: {', '.join(sorted(desconhecidos))}")
+    ok = verificar(args.frameworks, args.baseline, args.salvar_baseline, args.tolerancia, args.tempo_minimo)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+# PACK OUTDATED: plano de atualização a partir do índice de pacotes
+#
+# Descobre quais pacotes têm versão mais nova no índice configurado usando a
+# API simples em JSON (PEP 691), com uma consulta por pacote e por índice,
+# feitas em paralelo. As respostas ficam em cache com o ETag e são
+# revalidadas com If-None-Match (304 = nada mudou, nenhum byte de corpo).
+# Com PACK_INDEX_TTL=N (opcional) a resposta em cache vale por até N
+# segundos (limitados ao max-age do índice) sem ir à rede; por padrão toda
+# consulta revalida, para o plano de atualização não perder um lançamento.
+#
+# Índices que só falam HTML (PEP 503) também são aceitos: a página é
+# convertida para o mesmo formato de "files" da PEP 691.
+#
+# Funciona com índices locais para testes offline:
+#   • http://localhost:8080/simple/  (qualquer servidor que fale PEP 691)
+#   • file:///caminho/simple/        (lê <pacote>/index.json de cada projeto)
+
+import hashlib
+import json
+import os
+import platform
+import re
+import ssl
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+import pack_index
+import pack_trace
+
+try:
+    from packaging.specifiers import InvalidSpecifier, SpecifierSet
+    from packaging.version import InvalidVersion, Version
+except ImportError:
+    from pip._vendor.packaging.specifiers import InvalidSpecifier, SpecifierSet
+    from pip._vendor.packaging.version import InvalidVersion, Version
+
+INDICE_PADRAO = "https://pypi.org/simple/"
+TIPO_JSON = "application/vnd.pypi.simple.v1+json"
+# Prefere JSON, mas aceita HTML de índices antigos
+ACCEPT = f"{TIPO_JSON}, text/html;q=0.1"
+MAX_WORKERS = 8
+TIMEOUT = 15
+# Segundos em que uma página em cache vale sem revalidar (PACK_INDEX_TTL
+# sobrescreve); 0 = sempre revalidar com If-None-Match
+VALIDADE_CACHE = 0
+# Incrementar quando o formato gravado em cache mudar
+FORMATO_CACHE = 2
+
+_EXTENSOES = (".whl", ".tar.gz", ".zip", ".tar.bz2", ".tgz")
+
+
+def indice_configurado():
+    """URL do índice configurado (PIP_INDEX_URL ou PyPI)"""
+    return os.environ.get("PIP_INDEX_URL", INDICE_PADRAO)
+
+
+def versao_do_arquivo(nome_arquivo):
+    """Extrai a versão do nome de uma wheel ou sdist"""
+    if nome_arquivo.endswith(".whl"):
+        partes = nome_arquivo.split("-")
+        return partes[1] if len(partes) >= 5 else None
+    for extensao in _EXTENSOES:
+        if nome_arquivo.endswith(extensao):
+            base = nome_arquivo[:-len(extensao)]
+            return base.rsplit("-", 1)[1] if "-" in base else None
+    return None
+
+
+class _LinksParser(HTMLParser):
+    """Converte uma página simples em HTML (PEP 503) para a lista "files" da PEP 691"""
+
+    def __init__(self):
+        super().__init__()
+        self.files = []
+        self._atual = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "a":
+            attrs = dict(attrs)
+            self._atual = {"url": attrs.get("href", ""), "yanked": "data-yanked" in attrs, "filename": "",
+                           "requires-python": attrs.get("data-requires-python")}
+
+    def handle_data(self, data):
+        if self._atual is not None:
+            self._atual["filename"] += data
+
+    def handle_endtag(self, tag):
+        if tag == "a" and self._atual is not None:
+            self._atual["filename"] = self._atual["filename"].strip()
+            self.files.append(self._atual)
+            self._atual = None
+
+
+_contexto_ssl = None
+_trava_ssl = threading.Lock()
+
+
+def _contexto():
+    """Contexto TLS compartilhado: carregar os certificados a cada consulta custa ~30ms de CPU"""
+    global _contexto_ssl
+    with _trava_ssl:
+        if _contexto_ssl is None:
+            _contexto_ssl = ssl.create_default_context()
+        return _contexto_ssl
+
+
+def _ttl():
+    try:
+        return int(os.environ.get("PACK_INDEX_TTL", VALIDADE_CACHE))
+    except ValueError:
+        return VALIDADE_CACHE
+
+
+def _validade(resposta):
+    """Segundos em que a resposta vale sem revalidar: 0, a menos que PACK_INDEX_TTL peça mais"""
+    ttl = _ttl()
+    controle = resposta.headers.get("Cache-Control", "")
+    if ttl <= 0 or "no-cache" in controle or "no-store" in controle:
+        return 0
+    encontrado = re.search(r"max-age=(\d+)", controle)
+    return min(ttl, int(encontrado.group(1))) if encontrado else ttl
+
+
+def _ler_resposta(resposta, span=None):
+    """Lê uma resposta do índice (JSON ou HTML) no formato da PEP 691"""
+    tipo = resposta.headers.get("Content-Type", "")
+    bruto = resposta.read()
+    if span is not None:
+        span["bytes"] = len(bruto)
+    corpo = bruto.decode("utf-8")
+    if "json" in tipo:
+        return json.loads(corpo)
+    parser = _LinksParser()
+    parser.feed(corpo)
+    return {"files": parser.files}
+
+
+def _python_compativel(requires_python):
+    """True se o interpretador atual atende ao requires-python do arquivo"""
+    if not requires_python:
+        return True
+    try:
+        return SpecifierSet(requires_python).contains(platform.python_version(), prereleases=True)
+    except InvalidSpecifier:
+        return True
+
+
+class SimpleIndexClient:
+    def __init__(self, index_url=None, diretorio=None):
+        self.index_url = (index_url or indice_configurado()).rstrip("/") + "/"
+        chave = hashlib.sha1(self.index_url.encode("utf-8")).hexdigest()[:16]
+        self.diretorio = diretorio or os.path.join(pack_index.diretorio_cache(), "simple", chave)
+        os.makedirs(self.diretorio, exist_ok=True)
+
+    def _arquivo_cache(self, projeto):
+        return os.path.join(self.diretorio, f"{projeto}.json")
+
+    def _ler_cache(self, projeto):
+        try:
+            with open(self._arquivo_cache(projeto), encoding="utf-8") as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            return None
+
+    def _gravar_cache(self, projeto, etag, dados, validade=0):
+        temporario = f"{self._arquivo_cache(projeto)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temporario, "w", encoding="utf-8") as fp:
+                json.dump({"formato": FORMATO_CACHE, "etag": etag, "valido_ate": time.time() + validade,
+                           "dados": dados}, fp)
+            os.replace(temporario, self._arquivo_cache(projeto))
+        except OSError:
+            pass
+
+    def projeto(self, nome):
+        """Retorna a página JSON (PEP 691) de um projeto, ou None se não existir"""
+        projeto = pack_index.normalizar_nome(nome)
+        url = f"{self.index_url}{projeto}/"
+
+        if urlparse(url).scheme == "file":
+            try:
+                with open(os.path.join(url2pathname(urlparse(url).path), "index.json"), encoding="utf-8") as fp:
+                    return json.load(fp)
+            except (OSError, ValueError):
+                return None
+
+        cache = self._ler_cache(projeto)
+        if cache and cache.get("formato") != FORMATO_CACHE:
+            cache = None
+        # Sem TTL ligado nem um cache gravado com TTL é usado sem revalidar
+        if cache and _ttl() > 0 and cache.get("valido_ate", 0) > time.time():
+            return cache["dados"]
+        requisicao = urllib.request.Request(url, headers={"Accept": ACCEPT})
+        if cache and cache.get("etag"):
+            requisicao.add_header("If-None-Match", cache["etag"])
+
+        with pack_trace.span(projeto, "index") as span:
+            try:
+                with urllib.request.urlopen(requisicao, timeout=TIMEOUT, context=_contexto()) as resposta:
+                    dados = _ler_resposta(resposta, span)
+                    self._gravar_cache(projeto, resposta.headers.get("ETag"), dados, _validade(resposta))
+                    return dados
+            except urllib.error.HTTPError as e:
+                span["http"] = e.code
+                if e.code == 304 and cache:
+                    self._gravar_cache(projeto, cache.get("etag"), cache["dados"], _validade(e))
+                    return cache["dados"]
+                if e.code == 404:
+                    return None
+                raise
+
+    def versao_mais_recente(self, nome, incluir_pre=False):
+        """Maior versão não-yanked publicada para o projeto e compatível com este Python"""
+        dados = self.projeto(nome)
+        if not dados:
+            return None
+
+        candidatas = set()
+        for arquivo in dados.get("files", []):
+            if arquivo.get("yanked") or not _python_compativel(arquivo.get("requires-python")):
+                continue
+            texto = versao_do_arquivo(arquivo.get("filename", ""))
+            try:
+                versao = Version(texto) if texto else None
+            except InvalidVersion:
+                continue
+            if versao and (incluir_pre or not versao.is_prerelease):
+                candidatas.add(versao)
+        return str(max(candidatas)) if candidatas else None
+
+
+def calcular_plano(pacotes, index_url=None, max_workers=MAX_WORKERS, indices_extras=None):
+    """Retorna [(pacote, versão_atual, versão_nova)] apenas para os pacotes desatualizados
+
+    indices_extras: {pacote: [urls]} consultados além do índice configurado
+    (ex.: o --extra-index-url do PyTorch CPU); vale a maior versão entre eles.
+    """
+    indices_extras = indices_extras or {}
+    clientes = {}
+    pacotes = list(dict.fromkeys(pacotes))
+
+    def cliente(url):
+        chave = url or ""
+        if chave not in clientes:
+            clientes[chave] = SimpleIndexClient(url)
+        return clientes[chave]
+
+    # Os clientes são criados antes do pool (criar cria o diretório de cache)
+    indices = {pacote: [cliente(index_url)] + [cliente(url) for url in indices_extras.get(pacote) or [] if url]
+               for pacote in pacotes}
+
+    def consultar(pacote):
+        atual = pack_index.get_current_version(pacote)
+        try:
+            pre = atual not in (pack_index.NAO_INSTALADO, pack_index.NAO_ENCONTRADA) and Version(atual).is_prerelease
+        except InvalidVersion:
+            pre = False
+        versoes, erro = [], None
+        for indice in indices[pacote]:
+            try:
+                versao = indice.versao_mais_recente(pacote, incluir_pre=pre)
+            except (OSError, ValueError) as e:
+                erro = erro or str(e)
+                continue
+            if versao:
+                versoes.append(Version(versao))
+        if versoes:
+            return pacote, atual, str(max(versoes)), None
+        return pacote, atual, None, erro
+
+    with pack_trace.span(f"plano de atualização ({len(pacotes)} pacotes)", "resolve"):
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            resultados = list(pool.map(consultar, pacotes))
+
+    plano, erros = [], []
+    for pacote, atual, nova, erro in resultados:
+        if erro:
+            erros.append((pacote, erro))
+        elif nova is None:
+            erros.append((pacote, "não encontrado no índice"))
+        elif atual == pack_index.NAO_INSTALADO:
+            plano.append((pacote, atual, nova))
+        else:
+            try:
+                if Version(nova) > Version(atual):
+                    plano.append((pacote, atual, nova))
+            except InvalidVersion:
+                plano.append((pacote, atual, nova))
+    return plano, erros
+
+
+ATUALIZADO = "atualizado"
+RETIDO = "retido"
+FALHOU = "falhou"
+
+
+def _publica(versao):
+    """Versão sem o segmento local (2.5.1+cpu -> 2.5.1), ou None se inválida"""
+    try:
+        return Version(versao).public
+    except (InvalidVersion, TypeError):
+        return None
+
+
+def situacao_atualizacao(atual, instalada, nova, sucesso):
+    """ATUALIZADO, RETIDO ou FALHOU para um pacote do plano depois da atualização
+
+    A comparação ignora o segmento local: torch do índice CPU instala como
+    "2.x+cpu". Se a transação deu certo mas o pacote não chegou à versão
+    nova, o resolver o segurou numa versão compatível com o resto - isso é
+    RETIDO, não falha.
+    """
+    publica_instalada, publica_nova = _publica(instalada), _publica(nova)
+    if publica_instalada is not None and publica_nova is not None:
+        if Version(publica_instalada) >= Version(publica_nova):
+            return ATUALIZADO
+    elif instalada == nova:
+        return ATUALIZADO
+    return RETIDO if sucesso and instalada not in (pack_index.NAO_INSTALADO, pack_index.NAO_ENCONTRADA) else FALHOU
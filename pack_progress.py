@@ -0,0 +1,305 @@
+# PACK PROGRESS: laço de progresso orientado a eventos
+#
+# Substitui as pausas fixas (time.sleep(1), (2), (3)) entre pacotes:
+#   • executar() transmite a saída do subprocess ao vivo e retorna assim que
+#     o processo termina
+#   • aguardar_contencao() só segura o próximo pacote quando há contenção real
+#     (outro pip/uv instalando no mesmo ambiente ou disco saturado)
+#   • --no-pause (ou PACK_NO_PAUSE=1) desativa os "Pressione Enter" e as
+#     confirmações, para uso em CI
+#
+# executar() é um substituto direto de
+#   subprocess.run(command, shell=True, capture_output=True, text=True, check=True)
+# com memória constante: cada linha vai para o log da execução (arquivo
+# rotativo em <cache>/logs) e só as últimas LINHAS_CAUDA de cada pipe ficam
+# em memória - é isso que volta em stdout/stderr para mostrar erros. As
+# linhas de progresso do pip (Collecting, Downloading ... (2.5 GB), Building
+# wheel, Successfully installed) são lidas na hora e resumidas em
+# resultado.progresso.
+
+import collections
+import logging
+import logging.handlers
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+
+SEM_PAUSA = "--no-pause" in sys.argv or os.environ.get("PACK_NO_PAUSE", "") not in ("", "0")
+
+# Pressão de I/O (PSI do Linux, % do tempo com tarefas esperando disco)
+LIMITE_PRESSAO_IO = 40.0
+ESPERA_MAXIMA = 120.0
+
+# Nome exato do executável: pip, pip3, pip3.12, uv (com .exe no Windows) -
+# prefixos pegariam uvicorn, pipx, pipenv
+_INSTALADOR = re.compile(r"^(?:pip(?:3(?:\.\d+)?)?|uv)(?:\.exe)?$", re.IGNORECASE)
+
+# Linhas de cada pipe guardadas em memória para exibir erros
+LINHAS_CAUDA = 200
+# Log da execução: tamanho máximo por arquivo, cópias rotacionadas e execuções mantidas
+LOG_MAXIMO_BYTES = 5 * 1024 * 1024
+LOG_COPIAS = 3
+LOGS_MANTIDOS = 20
+
+_UNIDADES = {"bytes": 1, "B": 1, "kB": 1000, "KB": 1000, "MB": 1000 ** 2, "GB": 1000 ** 3}
+_PROGRESSO_PIP = re.compile(
+    r"^\s*(?:(?P<baixando>Downloading|Resuming download) (?P<arquivo>\S+)"
+    r"(?: \((?:[\d.]+ \w+/)?(?P<tamanho>[\d.]+) (?P<unidade>bytes|B|kB|KB|MB|GB)\))?"
+    r"|(?:Collecting|Processing) (?P<coletando>\S+)"
+    r"|Using cached (?P<cache>\S+)"
+    r"|Building wheel for (?P<construindo>\S+)"
+    r"|Installing collected packages: (?P<instalando>.+)"
+    r"|Successfully installed (?P<instalados>.+))"
+)
+
+_log = None
+_trava_log = threading.Lock()
+
+
+def pausar(mensagem="\n👆 Pressione Enter para continuar..."):
+    """Aguarda Enter, exceto no modo --no-pause"""
+    if not SEM_PAUSA:
+        input(mensagem)
+
+
+def confirmar(pergunta):
+    """Pergunta s/n; no modo --no-pause assume 's'"""
+    if SEM_PAUSA:
+        print(f"{pergunta} s (--no-pause)")
+        return True
+    return input(pergunta).strip().lower() == 's'
+
+
+class Resultado(subprocess.CompletedProcess):
+    """CompletedProcess com só a cauda da saída, o caminho do log e o progresso lido"""
+
+    def __init__(self, args, returncode, stdout, stderr, log=None, progresso=None):
+        super().__init__(args, returncode, stdout, stderr)
+        self.log = log
+        self.progresso = progresso or {}
+
+
+def _diretorio_logs():
+    import pack_index
+    diretorio = os.path.join(pack_index.diretorio_cache(), "logs")
+    os.makedirs(diretorio, exist_ok=True)
+    return diretorio
+
+
+def _limpar_logs_antigos(diretorio):
+    """Mantém só os logs das LOGS_MANTIDOS execuções mais recentes"""
+    try:
+        execucoes = sorted((e for e in os.scandir(diretorio) if e.name.endswith(".log")),
+                           key=lambda e: e.stat().st_mtime, reverse=True)
+        for entrada in execucoes[LOGS_MANTIDOS:]:
+            for sufixo in [""] + [f".{i}" for i in range(1, LOG_COPIAS + 1)]:
+                try:
+                    os.remove(entrada.path + sufixo)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+
+def log_da_execucao():
+    """Logger do arquivo rotativo desta execução (criado na primeira chamada)"""
+    global _log
+    with _trava_log:
+        if _log is None:
+            diretorio = _diretorio_logs()
+            _limpar_logs_antigos(diretorio)
+            script = os.path.splitext(os.path.basename(sys.argv[0]))[0].lstrip("-") or "python"
+            caminho = os.path.join(diretorio, f"{script}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.log")
+            handler = logging.handlers.RotatingFileHandler(caminho, maxBytes=LOG_MAXIMO_BYTES,
+                                                           backupCount=LOG_COPIAS, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            _log = logging.getLogger(f"pack.execucao.{os.getpid()}")
+            _log.propagate = False
+            _log.setLevel(logging.INFO)
+            _log.addHandler(handler)
+            _log.caminho = caminho
+        return _log
+
+
+class _Progresso:
+    """Interpreta as linhas de progresso do pip enquanto elas chegam"""
+
+    def __init__(self, mostrar_marcos):
+        self.mostrar_marcos = mostrar_marcos
+        self.trava = threading.Lock()
+        self.dados = {"bytes": 0, "downloads": 0, "em_cache": 0, "coletados": 0, "builds": 0, "instalados": []}
+
+    def linha(self, texto):
+        encontrado = _PROGRESSO_PIP.match(texto)
+        if not encontrado:
+            return
+        grupos = encontrado.groupdict()
+        with self.trava:
+            if grupos["baixando"]:
+                self.dados["downloads"] += 1
+                if grupos["tamanho"]:
+                    tamanho = float(grupos["tamanho"]) * _UNIDADES[grupos["unidade"]]
+                    self.dados["bytes"] += int(tamanho)
+                    if self.mostrar_marcos and tamanho >= 10 * 1000 ** 2:
+                        nome = grupos["arquivo"].rsplit("/", 1)[-1]
+                        print(f"   ⬇️  {nome} ({grupos['tamanho']} {grupos['unidade']})", flush=True)
+            elif grupos["coletando"]:
+                self.dados["coletados"] += 1
+            elif grupos["cache"]:
+                self.dados["em_cache"] += 1
+            elif grupos["construindo"]:
+                self.dados["builds"] += 1
+                if self.mostrar_marcos:
+                    print(f"   🔨 Construindo {grupos['construindo']}...", flush=True)
+            elif grupos["instalando"] and self.mostrar_marcos:
+                print(f"   📦 Instalando {len(grupos['instalando'].split(','))} pacotes...", flush=True)
+            elif grupos["instalados"]:
+                self.dados["instalados"] = grupos["instalados"].split()
+
+
+def _ler_pipe(pipe, cauda, prefixo, log, progresso, rotulo):
+    """Lê um pipe linha a linha: log em disco, cauda em memória, progresso e eco ao vivo"""
+    for linha in iter(pipe.readline, ""):
+        cauda.append(linha)
+        texto = linha.rstrip()
+        log.info("%s %s", rotulo, texto)
+        progresso.linha(texto)
+        if prefixo is not None and texto.strip():
+            print(f"{prefixo}{texto}", flush=True)
+    pipe.close()
+
+
+def linhas_de_erro(resultado, maximo=2):
+    """Linhas mais úteis do stderr (as "ERROR:" do pip, senão as últimas) e o log completo"""
+    linhas = [l.strip() for l in (resultado.stderr or "").splitlines() if l.strip()]
+    erros = [l for l in linhas if l.startswith("ERROR:")]
+    escolhidas = (erros or linhas[-maximo:])[:maximo]
+    log = getattr(resultado, "log", None)
+    if log:
+        escolhidas.append(f"📄 log completo: {log}")
+    return escolhidas
+
+
+def executar(command, check=False, mostrar=True):
+    """Executa um comando transmitindo stdout/stderr ao vivo; retorna um Resultado
+
+    mostrar=False não ecoa a saída, só os marcos (downloads grandes, builds).
+    """
+    aguardar_contencao()
+
+    log = log_da_execucao()
+    log.info("$ %s", command if isinstance(command, str) else subprocess.list2cmdline(command))
+    processo = subprocess.Popen(
+        command,
+        shell=isinstance(command, str),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1
+    )
+    saida = collections.deque(maxlen=LINHAS_CAUDA)
+    erro = collections.deque(maxlen=LINHAS_CAUDA)
+    progresso = _Progresso(mostrar_marcos=not mostrar)
+    leitores = [
+        threading.Thread(target=_ler_pipe, args=(processo.stdout, saida, "   │ " if mostrar else None,
+                                                 log, progresso, "out")),
+        threading.Thread(target=_ler_pipe, args=(processo.stderr, erro, "   ! " if mostrar else None,
+                                                 log, progresso, "err")),
+    ]
+    for leitor in leitores:
+        leitor.start()
+    returncode = processo.wait()
+    for leitor in leitores:
+        leitor.join()
+    log.info("código de saída %s", returncode)
+
+    stdout, stderr = "".join(saida), "".join(erro)
+    if check and returncode != 0:
+        excecao = subprocess.CalledProcessError(returncode, command, stdout, stderr)
+        excecao.log = log.caminho
+        raise excecao
+    return Resultado(command, returncode, stdout, stderr, log.caminho, progresso.dados)
+
+
+def _pid_pai(pid):
+    """Retorna o PID do processo pai (Linux) ou None"""
+    try:
+        with open(f"/proc/{pid}/stat") as fp:
+            return int(fp.read().rsplit(")", 1)[1].split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def _e_instalador(args):
+    """True para `pip install`, `pip3.X install`, `python -m pip install` e `uv pip install`"""
+    if "install" not in args:
+        return False
+    if _INSTALADOR.match(os.path.basename(args[0])):
+        return True
+    # `python /caminho/bin/pip install`
+    if os.path.basename(args[0]).lower().startswith("python") and len(args) > 1 \
+            and _INSTALADOR.match(os.path.basename(args[1])):
+        return True
+    return any(a == "-m" and b == "pip" for a, b in zip(args, args[1:]))
+
+
+def _outros_instaladores():
+    """Lista PIDs de outros pip/uv em execução (Linux, via /proc), ignorando os nossos filhos"""
+    if not os.path.isdir("/proc"):
+        return []
+    meu_pid = os.getpid()
+    pids = []
+    for entrada in os.listdir("/proc"):
+        if not entrada.isdigit() or int(entrada) == meu_pid:
+            continue
+        try:
+            with open(f"/proc/{entrada}/cmdline", "rb") as fp:
+                args = [a.decode(errors="ignore") for a in fp.read().split(b"\0") if a]
+        except OSError:
+            continue
+        if _e_instalador(args) and _pid_pai(entrada) != meu_pid:
+            pids.append(int(entrada))
+    return pids
+
+
+def _pressao_io():
+    """Retorna a pressão de I/O (avg10) do Linux ou 0.0 se indisponível"""
+    try:
+        with open("/proc/pressure/io") as fp:
+            for linha in fp:
+                if linha.startswith("some"):
+                    campos = dict(c.split("=") for c in linha.split()[1:])
+                    return float(campos["avg10"])
+    except (OSError, KeyError, ValueError):
+        pass
+    return 0.0
+
+
+def detectar_contencao():
+    """Retorna uma descrição da contenção atual ou None"""
+    pids = _outros_instaladores()
+    if pids:
+        return f"outro instalador em execução (PID {', '.join(map(str, pids))})"
+    pressao = _pressao_io()
+    if pressao >= LIMITE_PRESSAO_IO:
+        return f"disco saturado (pressão de I/O {pressao:.0f}%)"
+    return None
+
+
+def aguardar_contencao(espera_maxima=ESPERA_MAXIMA):
+    """Segura o próximo job apenas enquanto houver contenção real (backoff exponencial)"""
+    motivo = detectar_contencao()
+    if not motivo:
+        return 0.0
+
+    inicio = time.monotonic()
+    intervalo = 0.5
+    while motivo and time.monotonic() - inicio < espera_maxima:
+        print(f"⏳ Aguardando: {motivo}...")
+        time.sleep(intervalo)
+        intervalo = min(intervalo * 2, 8.0)
+        motivo = detectar_contencao()
+    return time.monotonic() - inicio
@@ -16,7 +16,11 @@
 import subprocess
 import sys
 import os
-import time
+
+import pack_backend
+import pack_falhas
+import pack_index
+import pack_progress
 
 class EnvironmentManager:
     def __init__(self):
@@ -88,23 +92,16 @@ class EnvironmentManager:
         print("-" * 50)
         
         try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            result = pack_backend.executar(command, check=True)
+            pack_index.invalidar()
             print(f"✅ {package_name} executado com sucesso!")
             return True
             
         except subprocess.CalledProcessError as e:
             print(f"❌ Erro em {package_name}:")
-            if e.stderr:
-                error_lines = e.stderr.strip().split('\n')
-                for line in error_lines[:2]:
-                    if line.strip():
-                        print(f"   {line.strip()}")
+            for line in pack_progress.linhas_de_erro(e):
+                print(f"   {line}")
+            print(f"   💡 {pack_falhas.dica(getattr(e, 'falha', None))}")
             return False
             
         except Exception as e:
@@ -141,20 +138,14 @@ class EnvironmentManager:
                 else:
                     return "❌ Não disponível neste Python"
             
-            # Para outros pacotes
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "show", package_name],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            for line in result.stdout.split('\n'):
-                if line.startswith('Version:'):
-                    return f"✅ v{line.split(': ')[1].strip()}"
-            return "✅ Instalado (versão não detectada)"
+            # Para outros pacotes (índice em memória, sem subprocess)
+            versao = pack_index.get_current_version(package_name)
+            if versao == pack_index.NAO_INSTALADO:
+                return "❌ Não instalado"
+            if versao == pack_index.NAO_ENCONTRADA:
+                return "✅ Instalado (versão não detectada)"
+            return f"✅ v{versao}"
             
-        except subprocess.CalledProcessError:
-            return "❌ Não instalado"
         except Exception as e:
             return f"❌ Erro: {str(e)}"
 
@@ -253,7 +244,6 @@ class EnvironmentManager:
             if self.install_package(package_name):
                 success_count += 1
             print()
-            time.sleep(1)
         
         print("=" * 60)
         print(f"📊 {success_count}/{total} pacotes instalados com sucesso")
@@ -274,7 +264,6 @@ class EnvironmentManager:
                 if self.update_package(package_name):
                     success_count += 1
                 print()
-                time.sleep(1)
         
         # Verificar pacotes úteis
         for package_name in self.useful_tools.keys():
@@ -284,7 +273,6 @@ class EnvironmentManager:
                 if self.update_package(package_name):
                     success_count += 1
                 print()
-                time.sleep(1)
         
         print("=" * 60)
         if total_to_update > 0:
@@ -357,7 +345,7 @@ def main():
         else:
             print("❌ Opção inválida!")
         
-        input("\n👆 Pressione Enter para continuar...")
+        pack_progress.pausar("\n👆 Pressione Enter para continuar...")
 
 if __name__ == "__main__":
     main()
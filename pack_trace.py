@@ -0,0 +1,149 @@
+# PACK TRACE: spans cronometrados de cada etapa, em formato Chrome trace
+#
+# Com PACK_TRACE=1 (ou --trace) cada etapa de instalação/atualização vira um
+# span: resolve, download, build, install, verify, status e consultas ao
+# índice. Cada span guarda o tempo de parede, o tempo de CPU dos
+# subprocessos (pip/uv) que terminaram dentro dele e os bytes baixados.
+#
+# Ao fim da execução:
+#   • grava um JSON no formato Chrome trace (abre em chrome://tracing ou
+#     https://ui.perfetto.dev) - PACK_TRACE=<arquivo> escolhe o caminho,
+#     senão vai para <cache>/traces/
+#   • imprime no stderr um resumo por categoria, para saber se o
+#     provisionamento está preso na rede, no build ou no resolver
+#
+# A CPU dos subprocessos vem de getrusage(RUSAGE_CHILDREN), medida só nos
+# spans que envolvem um subprocesso (mede_cpu=True). Cada span leva o que
+# foi consumido desde a última medição - com spans em paralelo (downloads do
+# pack_batch) nada é contado duas vezes, mas a divisão entre eles é
+# aproximada.
+
+import atexit
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+_VALOR = os.environ.get("PACK_TRACE", "")
+ATIVO = "--trace" in sys.argv or _VALOR not in ("", "0")
+
+
+def _cpu_filhos():
+    if resource is None:
+        return None
+    uso = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return uso.ru_utime + uso.ru_stime
+
+
+class Rastreador:
+    def __init__(self):
+        self.eventos = []
+        self.trava = threading.Lock()
+        self.origem = time.perf_counter()
+        self.gravado = None
+        self._cpu_atribuida = 0.0
+
+    def _us(self, instante):
+        return round((instante - self.origem) * 1e6)
+
+    @contextlib.contextmanager
+    def span(self, nome, categoria, mede_cpu=False, **args):
+        """Cronometra um bloco; o dicionário devolvido aceita campos extras (ex.: bytes)"""
+        dados = dict(args)
+        if not ATIVO:
+            yield dados
+            return
+        cpu_inicio = _cpu_filhos() if mede_cpu else None
+        inicio = time.perf_counter()
+        try:
+            yield dados
+        except BaseException as e:
+            dados["erro"] = type(e).__name__
+            raise
+        finally:
+            fim = time.perf_counter()
+            evento = {"name": nome, "cat": categoria, "ph": "X", "ts": self._us(inicio),
+                      "dur": self._us(fim) - self._us(inicio), "pid": os.getpid(),
+                      "tid": threading.get_ident(), "args": dados}
+            with self.trava:
+                if cpu_inicio is not None:
+                    agora = _cpu_filhos()
+                    dados["cpu_filhos_s"] = round(agora - max(cpu_inicio, self._cpu_atribuida), 3)
+                    self._cpu_atribuida = agora
+                self.eventos.append(evento)
+
+    def resumo(self):
+        """{categoria: (spans, segundos, cpu_filhos, bytes)}"""
+        por_categoria = {}
+        for evento in self.eventos:
+            spans, segundos, cpu, baixados = por_categoria.get(evento["cat"], (0, 0.0, 0.0, 0))
+            args = evento["args"]
+            por_categoria[evento["cat"]] = (spans + 1, segundos + evento["dur"] / 1e6,
+                                            cpu + (args.get("cpu_filhos_s") or 0), baixados + (args.get("bytes") or 0))
+        return por_categoria
+
+    def _caminho(self):
+        if _VALOR not in ("", "0", "1"):
+            return _VALOR
+        import pack_index
+        diretorio = os.path.join(pack_index.diretorio_cache(), "traces")
+        os.makedirs(diretorio, exist_ok=True)
+        script = os.path.splitext(os.path.basename(sys.argv[0] or "python"))[0] or "python"
+        return os.path.join(diretorio, f"{script}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.json")
+
+    def gravar(self, caminho=None):
+        """Grava o trace no formato Chrome (traceEvents); retorna o caminho"""
+        caminho = caminho or self._caminho()
+        metadados = [{"name": "process_name", "ph": "M", "pid": os.getpid(),
+                      "args": {"name": " ".join(os.path.basename(a) for a in sys.argv[:2])}}]
+        with open(caminho, "w", encoding="utf-8") as fp:
+            json.dump({"traceEvents": metadados + self.eventos, "displayTimeUnit": "ms"}, fp, ensure_ascii=False)
+        self.gravado = caminho
+        return caminho
+
+    def imprimir_resumo(self, arquivo=None):
+        arquivo = arquivo or sys.stderr
+        total = time.perf_counter() - self.origem
+        print("\n📈 TEMPOS POR ETAPA", file=arquivo)
+        print("=" * 64, file=arquivo)
+        print(f"{'etapa':10} {'spans':>6} {'parede':>10} {'CPU filhos':>11} {'baixado':>10} {'%':>6}", file=arquivo)
+        print("-" * 64, file=arquivo)
+        for categoria, (spans, segundos, cpu, baixados) in sorted(self.resumo().items(), key=lambda i: -i[1][1]):
+            mb = f"{baixados / 1e6:.1f}MB" if baixados else "-"
+            print(f"{categoria:10} {spans:>6} {segundos:>9.1f}s {cpu:>10.1f}s {mb:>10} {100 * segundos / total:>5.0f}%",
+                  file=arquivo)
+        print("-" * 64, file=arquivo)
+        print(f"Execução: {total:.1f}s (spans paralelos podem somar mais que isso)", file=arquivo)
+        lentos = sorted(self.eventos, key=lambda e: -e["dur"])[:5]
+        if lentos:
+            print("Mais lentos: " + ", ".join(f"{e['name']} {e['dur'] / 1e6:.1f}s" for e in lentos), file=arquivo)
+        if self.gravado:
+            print(f"💾 Trace: {self.gravado}", file=arquivo)
+
+
+# Rastreador compartilhado pelos scripts pack_* durante a execução
+rastreador = Rastreador()
+
+
+def span(nome, categoria, **args):
+    """Atalho para rastreador.span"""
+    return rastreador.span(nome, categoria, **args)
+
+
+def _finalizar():
+    if ATIVO and rastreador.eventos:
+        try:
+            rastreador.gravar()
+        except OSError as e:
+            print(f"⚠️  Não foi possível gravar o trace: {e}", file=sys.stderr)
+        rastreador.imprimir_resumo()
+
+
+atexit.register(_finalizar)
@@ -0,0 +1,334 @@
+# PACK WHEELHOUSE: cache local de wheels compartilhado por todos os pack_*
+#
+# Estrutura (em ~/.cache/python_tool_kit/wheelhouse ou PACK_WHEELHOUSE):
+#   objects/ab/abcdef...   conteúdo endereçado pelo sha256
+#   wheels/<arquivo>.whl   hardlink para o objeto - usado em --find-links
+#   index.json             {arquivo: sha256}
+#   index.lock             trava entre processos das escritas no índice
+#
+# • Os instaladores consultam o wheelhouse primeiro (--find-links)
+# • --offline (ou PACK_OFFLINE=1) instala só a partir dele
+#   (--no-index --find-links)
+# • `python pack_wheelhouse.py prefetch --fase 2` enche o wheelhouse com uma
+#   Fase inteira, baixando os pacotes em paralelo
+
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pack_index
+
+OFFLINE = "--offline" in sys.argv or os.environ.get("PACK_OFFLINE", "") not in ("", "0")
+MAX_WORKERS = 4
+# Espera máxima por uma trava entre processos e intervalo entre tentativas
+TIMEOUT_TRAVA = 300
+INTERVALO_TRAVA = 0.05
+
+# Opções de índice removidas no modo offline
+_OPCOES_INDICE = ("--index-url", "-i", "--extra-index-url")
+
+_trava = threading.Lock()
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+
+def diretorio():
+    """Raiz do wheelhouse"""
+    raiz = os.environ.get("PACK_WHEELHOUSE") or os.path.join(pack_index.diretorio_cache(), "wheelhouse")
+    os.makedirs(os.path.join(raiz, "wheels"), exist_ok=True)
+    os.makedirs(os.path.join(raiz, "objects"), exist_ok=True)
+    return raiz
+
+
+def diretorio_wheels():
+    """Diretório plano de wheels usado em --find-links"""
+    return os.path.join(diretorio(), "wheels")
+
+
+def sha256_arquivo(caminho):
+    """Calcula o sha256 de um arquivo em blocos"""
+    h = hashlib.sha256()
+    with open(caminho, "rb") as fp:
+        for bloco in iter(lambda: fp.read(1024 * 1024), b""):
+            h.update(bloco)
+    return h.hexdigest()
+
+
+def _ler_indice():
+    try:
+        with open(os.path.join(diretorio(), "index.json"), encoding="utf-8") as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        return {}
+
+
+def _gravar_indice(indice):
+    caminho = os.path.join(diretorio(), "index.json")
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    with open(temporario, "w", encoding="utf-8") as fp:
+        json.dump(indice, fp, indent=1, sort_keys=True)
+    os.replace(temporario, caminho)
+
+
+def _tentar_travar(fp):
+    """Trava exclusiva sem esperar; True se conseguiu"""
+    if os.name == 'nt':
+        fp.seek(0)
+        try:
+            msvcrt.locking(fp.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+    try:
+        fcntl.flock(fp.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except BlockingIOError:
+        return False
+
+
+def _destravar(fp):
+    if os.name == 'nt':
+        fp.seek(0)
+        msvcrt.locking(fp.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(fp.fileno(), fcntl.LOCK_UN)
+
+
+@contextlib.contextmanager
+def travar_arquivo(caminho, timeout=TIMEOUT_TRAVA, ao_esperar=None):
+    """Trava exclusiva entre processos num arquivo .lock
+
+    timeout=None espera o quanto for preciso; ao_esperar() é chamado uma
+    vez se a trava estiver com outro processo.
+    """
+    with open(caminho, "a+b") as fp:
+        if not _tentar_travar(fp):
+            if ao_esperar:
+                ao_esperar()
+            limite = None if timeout is None else time.monotonic() + timeout
+            while not _tentar_travar(fp):
+                if limite is not None and time.monotonic() > limite:
+                    raise TimeoutError(f"{os.path.basename(caminho)} ocupado há mais de {timeout}s")
+                time.sleep(INTERVALO_TRAVA)
+        try:
+            yield
+        finally:
+            _destravar(fp)
+
+
+@contextlib.contextmanager
+def _travado():
+    """Exclusão mútua entre threads e entre processos pack_* (CLI + menu, prefetch...)"""
+    with _trava, travar_arquivo(os.path.join(diretorio(), "index.lock")):
+        yield
+
+
+def _ligar(objeto, destino):
+    """Aponta wheels/<arquivo> para o objeto, trocando atomicamente o que houver lá"""
+    temporario = f"{destino}.{os.getpid()}.tmp"
+    try:
+        os.link(objeto, temporario)
+    except OSError:
+        shutil.copyfile(objeto, temporario)
+    os.replace(temporario, destino)
+
+
+def contem(nome_arquivo):
+    """Retorna True se a wheel já estiver no wheelhouse"""
+    return os.path.exists(os.path.join(diretorio_wheels(), nome_arquivo))
+
+
+def adicionar(caminho):
+    """Adiciona uma wheel ao wheelhouse (deduplicada pelo sha256); retorna o sha256"""
+    digest = sha256_arquivo(caminho)
+    nome = os.path.basename(caminho)
+    objeto = os.path.join(diretorio(), "objects", digest[:2], digest)
+    destino = os.path.join(diretorio_wheels(), nome)
+
+    with _travado():
+        if not os.path.exists(objeto):
+            os.makedirs(os.path.dirname(objeto), exist_ok=True)
+            temporario = f"{objeto}.{os.getpid()}.tmp"
+            shutil.copyfile(caminho, temporario)
+            os.replace(temporario, objeto)
+        indice = _ler_indice()
+        # Mesmo nome com outro conteúdo (wheel reconstruída, espelho diferente): o novo vale
+        if not os.path.exists(destino) or (indice.get(nome) != digest
+                                           and not os.path.samefile(destino, objeto)):
+            _ligar(objeto, destino)
+        indice[nome] = digest
+        _gravar_indice(indice)
+    return digest
+
+
+def importar_diretorio(origem):
+    """Adiciona todas as wheels de um diretório; retorna quantas eram novas"""
+    novas = 0
+    for nome in os.listdir(origem):
+        if nome.endswith(".whl"):
+            novas += 0 if contem(nome) else 1
+            adicionar(os.path.join(origem, nome))
+    return novas
+
+
+def argumentos_pip(offline=None):
+    """Argumentos do pip para consultar o wheelhouse (e só ele, se offline)"""
+    offline = OFFLINE if offline is None else offline
+    args = ["--find-links", diretorio_wheels()]
+    return ["--no-index", *args] if offline else args
+
+
+def ajustar_comando(command):
+    """Acrescenta o wheelhouse a um comando `pip install` (string ou lista)"""
+    lista = shlex.split(command, posix=os.name != 'nt') if isinstance(command, str) else list(command)
+    if "pip" not in lista or "install" not in lista:
+        return command
+
+    if OFFLINE:
+        filtrada = []
+        pular = False
+        for arg in lista:
+            if pular:
+                pular = False
+                continue
+            if arg in _OPCOES_INDICE:
+                pular = True
+                continue
+            if arg.startswith(tuple(f"{opcao}=" for opcao in _OPCOES_INDICE)):
+                continue
+            filtrada.append(arg)
+        lista = filtrada
+
+    posicao = lista.index("install") + 1
+    lista[posicao:posicao] = argumentos_pip()
+    if isinstance(command, str):
+        return subprocess.list2cmdline(lista) if os.name == 'nt' else shlex.join(lista)
+    return lista
+
+
+def _baixar(pacote, destino, extra_args):
+    """Baixa/constrói as wheels de um pacote (com dependências) em um diretório"""
+    result = subprocess.run(
+        [sys.executable, "-m", "pip", "wheel", "--quiet", "--wheel-dir", destino,
+         "--find-links", diretorio_wheels(), *extra_args, pacote],
+        capture_output=True,
+        text=True
+    )
+    erro = result.stderr.strip().split('\n')[-1] if result.returncode != 0 else ""
+    return result.returncode == 0, erro
+
+
+def prefetch(pacotes, extra_args=None, max_workers=MAX_WORKERS):
+    """Enche o wheelhouse com os pacotes (e dependências) em paralelo; retorna {pacote: (ok, erro)}"""
+    extra_args = list(extra_args or [])
+    with tempfile.TemporaryDirectory(prefix="pack_wheelhouse_") as staging:
+        def tarefa(pacote):
+            destino = os.path.join(staging, pack_index.normalizar_nome(pacote))
+            os.makedirs(destino, exist_ok=True)
+            ok, erro = _baixar(pacote, destino, extra_args)
+            if ok:
+                importar_diretorio(destino)
+            return ok, erro
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return dict(zip(pacotes, pool.map(tarefa, pacotes)))
+
+
+def verificar():
+    """Confere o sha256 de cada wheel; retorna a lista de arquivos corrompidos"""
+    corrompidos = []
+    for nome, digest in _ler_indice().items():
+        caminho = os.path.join(diretorio_wheels(), nome)
+        if not os.path.exists(caminho) or sha256_arquivo(caminho) != digest:
+            corrompidos.append(nome)
+    return corrompidos
+
+
+def pacotes_da_fase(fase):
+    """Lista os pacotes de uma Fase (1-4) a partir do catálogo"""
+    import pack_catalog
+
+    return pack_catalog.pacotes_do_menu(f"fase{fase}")
+
+
+def lote_da_fase(fase):
+    """(pacotes com acompanhantes, --extra-index-url) de uma Fase, como o instalador do catálogo os usa
+
+    Sem o índice do catálogo o prefetch baixaria do PyPI o torch com CUDA,
+    não o da CPU que a instalação escolhe.
+    """
+    import pack_catalog
+
+    return pack_catalog.CatalogInstaller(f"fase{fase}").lote_de_instalacao(pacotes_da_fase(fase))
+
+
+def mostrar_status():
+    """Mostra o conteúdo do wheelhouse"""
+    indice = _ler_indice()
+    tamanho = sum(os.path.getsize(os.path.join(diretorio_wheels(), n))
+                  for n in indice if os.path.exists(os.path.join(diretorio_wheels(), n)))
+    print("📦 WHEELHOUSE LOCAL")
+    print("=" * 60)
+    print(f"📂 {diretorio()}")
+    print(f"• Wheels: {len(indice)}")
+    print(f"• Tamanho: {tamanho / 1024 / 1024:.1f} MB")
+    print(f"• Modo offline: {'Sim' if OFFLINE else 'Não'}")
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Wheelhouse local compartilhado pelos scripts pack_*")
+    parser.add_argument("--offline", action="store_true", help="instalar apenas a partir do wheelhouse")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p_prefetch = sub.add_parser("prefetch", help="baixar uma Fase inteira (ou pacotes) para o wheelhouse")
+    p_prefetch.add_argument("--fase", type=int, choices=[1, 2, 3, 4])
+    p_prefetch.add_argument("--workers", type=int, default=MAX_WORKERS)
+    p_prefetch.add_argument("--extra-index-url", action="append", default=[])
+    p_prefetch.add_argument("pacotes", nargs="*")
+    sub.add_parser("status", help="mostrar o conteúdo do wheelhouse")
+    sub.add_parser("verificar", help="conferir o sha256 de todas as wheels")
+
+    args = parser.parse_args()
+
+    if args.comando == "prefetch":
+        pacotes = list(args.pacotes)
+        extra = [a for url in args.extra_index_url for a in ("--extra-index-url", url)]
+        if args.fase:
+            lote, indices = lote_da_fase(args.fase)
+            pacotes = list(dict.fromkeys(pacotes + lote))
+            extra += indices
+        if not pacotes:
+            parser.error("informe --fase ou uma lista de pacotes")
+
+        print(f"🚀 Prefetch de {len(pacotes)} pacotes com {args.workers} workers...")
+        resultados = prefetch(pacotes, extra, args.workers)
+        for pacote, (ok, erro) in resultados.items():
+            print(f"✅ {pacote}" if ok else f"❌ {pacote}: {erro}")
+        mostrar_status()
+        sys.exit(0 if all(ok for ok, _ in resultados.values()) else 1)
+    elif args.comando == "status":
+        mostrar_status()
+    elif args.comando == "verificar":
+        corrompidos = verificar()
+        for nome in corrompidos:
+            print(f"❌ {nome}: sha256 não confere")
+        print("✅ Todas as wheels conferem" if not corrompidos else f"📊 {len(corrompidos)} corrompidas")
+        sys.exit(1 if corrompidos else 0)
+
+
+if __name__ == "__main__":
+    main()
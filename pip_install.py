@@ -39,8 +39,14 @@ import pkgutil
 import shutil
 import tempfile
 import argparse
+import hashlib
 import importlib
-from base64 import b85decode
+import compileall
+import subprocess
+import time
+import zipfile
+from base64 import b85decode, urlsafe_b64encode
+from concurrent.futures import ThreadPoolExecutor
 
 
 def include_setuptools(args):
@@ -65,11 +71,27 @@ def include_wheel(args):
     return cli and env and absent and python_lt_3_12
 
 
-def determine_pip_install_arguments():
+def parse_bootstrap_options():
+    """
+    Split our own options from the ones that are forwarded to `pip install`.
+    """
     pre_parser = argparse.ArgumentParser()
     pre_parser.add_argument("--no-setuptools", action="store_true")
     pre_parser.add_argument("--no-wheel", action="store_true")
-    pre, args = pre_parser.parse_known_args()
+    pre_parser.add_argument("--no-bootstrap-cache", action="store_true")
+    pre_parser.add_argument("--zip-bootstrap", action="store_true")
+    pre_parser.add_argument("--offline-bootstrap", action="store_true")
+    pre_parser.add_argument("--bootstrap-into", action="append", default=[], metavar="PYTHON_OR_VENV")
+    pre_parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    return pre_parser.parse_known_args()
+
+
+def determine_pip_install_arguments(offline_wheel=None):
+    pre, args = parse_bootstrap_options()
+
+    if offline_wheel:
+        # Install the embedded pip itself; nothing else is available offline.
+        return ["install", "--upgrade", "--force-reinstall", "--no-index"] + args + [offline_wheel]
 
     args.append("pip")
 
@@ -109,13 +131,273 @@ def monkeypatch_for_cert(tmpdir):
     InstallCommand.parse_args = cert_parse_args
 
 
-def bootstrap(tmpdir):
+def bootstrap_cache_dir():
+    """
+    Persistent cache for the decoded pip archive.
+
+    PIP_BOOTSTRAP_CACHE overrides the location; otherwise it sits next to the
+    other python_tool_kit caches (PACK_CACHE_DIR or the platform cache dir).
+    """
+    root = os.environ.get("PIP_BOOTSTRAP_CACHE")
+    if root:
+        return root
+    base = os.environ.get("PACK_CACHE_DIR")
+    if not base:
+        if os.name == "nt":
+            base = os.path.join(os.environ.get("LOCALAPPDATA", os.path.expanduser("~")), "python_tool_kit")
+        else:
+            base = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "python_tool_kit")
+    return os.path.join(base, "pip-bootstrap")
+
+
+def payload_key():
+    """Content hash of the embedded payload, used to name the cache entry."""
+    return hashlib.sha256(DATA).hexdigest()[:32]
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as fp:
+        for block in iter(lambda: fp.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def iter_payload(data=None, chunk_size=64 * 1024):
+    """
+    Decode the base85 payload incrementally, yielding bytes chunks.
+
+    DATA is walked line by line without building the newline-stripped copy or
+    the fully decoded archive: only about `chunk_size` characters are pending
+    at a time. base85 works in groups of 5 characters (4 bytes), so anything
+    past the last full group is carried over to the next chunk.
+    """
+    data = DATA if data is None else data
+    pending = []
+    pending_size = 0
+    start = 0
+    end = len(data)
+    while start < end:
+        newline = data.find(b"\n", start)
+        if newline == -1:
+            newline = end
+        if newline > start:
+            pending.append(data[start:newline])
+            pending_size += newline - start
+        start = newline + 1
+        if pending_size >= chunk_size:
+            buffer = b"".join(pending)
+            usable = len(buffer) - len(buffer) % 5
+            yield b85decode(buffer[:usable])
+            pending = [buffer[usable:]]
+            pending_size = len(pending[0])
+    if pending_size:
+        yield b85decode(b"".join(pending))
+
+
+def write_payload(path):
+    """Stream the decoded archive into `path` with constant extra memory."""
+    with open(path, "wb") as fp:
+        for chunk in iter_payload():
+            fp.write(chunk)
+
+
+def read_text(path):
+    try:
+        with open(path) as fp:
+            return fp.read().strip()
+    except OSError:
+        return None
+
+
+def cached_pip_path(unpacked=False):
+    """
+    Return a sys.path entry for pip from the persistent cache, filling it on a miss.
+
+    Entries are keyed by the hash of DATA, so a new get-pip payload never reuses
+    an old entry. pip.zip is checked against its recorded sha256 on every use and
+    rebuilt if it does not match. With `unpacked`, the archive is also extracted
+    and byte-compiled once, so later runs import pip from .pyc files instead of
+    going through zipimport.
+    """
+    entry = os.path.join(bootstrap_cache_dir(), payload_key())
+    os.makedirs(entry, exist_ok=True)
+    pip_zip = os.path.join(entry, "pip.zip")
+    digest_path = pip_zip + ".sha256"
+
+    digest = read_text(digest_path)
+    if not (digest and os.path.exists(pip_zip) and file_sha256(pip_zip) == digest):
+        # Write under a private name and rename, so concurrent bootstraps never
+        # see a half-written archive.
+        partial = "{}.{}.tmp".format(pip_zip, os.getpid())
+        write_payload(partial)
+        digest = file_sha256(partial)
+        os.replace(partial, pip_zip)
+        with open(digest_path + ".{}.tmp".format(os.getpid()), "w") as fp:
+            fp.write(digest)
+        os.replace(digest_path + ".{}.tmp".format(os.getpid()), digest_path)
+
+    if not unpacked:
+        return pip_zip
+
+    unpacked_dir = os.path.join(entry, "unpacked")
+    marker = os.path.join(unpacked_dir, ".complete")
+    if read_text(marker) != digest:
+        staging = tempfile.mkdtemp(dir=entry, prefix="unpacked-")
+        with zipfile.ZipFile(pip_zip) as archive:
+            archive.extractall(staging)
+        compileall.compile_dir(staging, ddir=unpacked_dir, quiet=1)
+        with open(os.path.join(staging, ".complete"), "w") as fp:
+            fp.write(digest)
+        try:
+            os.rename(staging, unpacked_dir)
+        except OSError:
+            if read_text(marker) != digest:
+                # Leftover from an interrupted run: replace it.
+                shutil.rmtree(unpacked_dir, ignore_errors=True)
+                os.rename(staging, unpacked_dir)
+            else:
+                # Another bootstrap finished first; use its copy.
+                shutil.rmtree(staging, ignore_errors=True)
+    return unpacked_dir
+
+
+def offline_wheel_path():
+    """
+    Build (once per payload) a pip wheel from the embedded archive.
+
+    The payload only holds the `pip` package, so the dist-info (METADATA,
+    WHEEL, entry points and RECORD) is generated here. The wheel sits next to
+    the cached pip.zip and lets the bootstrap run with `--no-index`.
+    """
+    pip_zip = cached_pip_path(unpacked=False)
+    entry = os.path.dirname(pip_zip)
+    with zipfile.ZipFile(pip_zip) as archive:
+        init = archive.read("pip/__init__.py").decode("utf-8")
+    version = init.split('__version__ = "', 1)[1].split('"', 1)[0]
+    wheel = os.path.join(entry, "pip-{}-py3-none-any.whl".format(version))
+    if os.path.exists(wheel):
+        return wheel
+
+    dist_info = "pip-{}.dist-info".format(version)
+    generated = {
+        dist_info + "/METADATA": (
+            "Metadata-Version: 2.1\nName: pip\nVersion: {}\nRequires-Python: >={}.{}\n"
+            "Summary: The PyPA recommended tool for installing Python packages.\n"
+        ).format(version, *min_version),
+        dist_info + "/WHEEL": (
+            "Wheel-Version: 1.0\nGenerator: pip_install.py\nRoot-Is-Purelib: true\nTag: py3-none-any\n"
+        ),
+        dist_info + "/entry_points.txt": (
+            "[console_scripts]\npip = pip._internal.cli.main:main\npip3 = pip._internal.cli.main:main\n"
+        ),
+    }
+
+    def record_line(name, content):
+        digest = urlsafe_b64encode(hashlib.sha256(content).digest()).rstrip(b"=").decode("ascii")
+        return "{},sha256={},{}".format(name, digest, len(content))
+
+    partial = "{}.{}.tmp".format(wheel, os.getpid())
+    records = []
+    with zipfile.ZipFile(pip_zip) as source, zipfile.ZipFile(partial, "w", zipfile.ZIP_DEFLATED) as target:
+        for info in source.infolist():
+            if info.is_dir():
+                continue
+            content = source.read(info)
+            target.writestr(info.filename, content)
+            records.append(record_line(info.filename, content))
+        for name, text in generated.items():
+            content = text.encode("utf-8")
+            target.writestr(name, content)
+            records.append(record_line(name, content))
+        records.append(dist_info + "/RECORD,,")
+        target.writestr(dist_info + "/RECORD", "\n".join(records) + "\n")
+    os.replace(partial, wheel)
+    return wheel
+
+
+def resolve_target(target):
+    """Interpreter for a target given as an executable, a command name or a venv directory."""
+    if os.path.isdir(target):
+        for candidate in (os.path.join(target, "Scripts", "python.exe"), os.path.join(target, "bin", "python")):
+            if os.path.exists(candidate):
+                return candidate
+        return None
+    if os.path.exists(target):
+        return target
+    return shutil.which(target)
+
+
+def bootstrap_target(target, child_args, env):
+    """Run this script under another interpreter; returns a result row."""
+    started = time.perf_counter()
+    python = resolve_target(target)
+    if python is None:
+        return {"target": target, "ok": False, "python": "-", "pip": "-",
+                "seconds": 0.0, "detail": "interpreter not found"}
+
+    result = subprocess.run([python, os.path.abspath(__file__)] + child_args,
+                            capture_output=True, text=True, env=env)
+    version = subprocess.run([python, "-c", "import sys; print('%d.%d.%d' % sys.version_info[:3])"],
+                             capture_output=True, text=True).stdout.strip() or "?"
+    pip_version = "-"
+    detail = ""
+    if result.returncode == 0:
+        shown = subprocess.run([python, "-m", "pip", "--version"], capture_output=True, text=True)
+        pip_version = shown.stdout.split()[1] if shown.returncode == 0 else "?"
+    else:
+        lines = [line for line in (result.stderr or result.stdout).splitlines() if line.strip()]
+        detail = lines[-1].strip() if lines else "exit code {}".format(result.returncode)
+    return {"target": target, "ok": result.returncode == 0, "python": version, "pip": pip_version,
+            "seconds": time.perf_counter() - started, "detail": detail}
+
+
+def fan_out(pre, pip_args):
+    """
+    Bootstrap pip into several interpreters/venvs at once.
+
+    The payload is decoded (and, offline, turned into a wheel) once here; every
+    child bootstrap then reuses the same cache entry via PIP_BOOTSTRAP_CACHE.
+    Each target is its own interpreter, so the pool runs one child process per
+    target, at most `--jobs` at a time.
+    """
+    cache = bootstrap_cache_dir()
+    cached_pip_path(unpacked=not pre.zip_bootstrap)
+    if pre.offline_bootstrap:
+        offline_wheel_path()
+
+    child_args = list(pip_args)
+    for flag, enabled in (("--no-setuptools", pre.no_setuptools), ("--no-wheel", pre.no_wheel),
+                          ("--zip-bootstrap", pre.zip_bootstrap),
+                          ("--offline-bootstrap", pre.offline_bootstrap)):
+        if enabled:
+            child_args.append(flag)
+    env = dict(os.environ, PIP_BOOTSTRAP_CACHE=cache)
+    env.pop("PIP_BOOTSTRAP_NO_CACHE", None)
+
+    targets = list(dict.fromkeys(pre.bootstrap_into))
+    with ThreadPoolExecutor(max_workers=max(1, pre.jobs)) as pool:
+        rows = list(pool.map(lambda target: bootstrap_target(target, child_args, env), targets))
+
+    width = max(len("TARGET"), max(len(row["target"]) for row in rows))
+    print("{:<{w}}  {:<8}  {:<8}  {:<6}  {:>8}  {}".format(
+        "TARGET", "PYTHON", "PIP", "STATUS", "SECONDS", "DETAIL", w=width))
+    for row in rows:
+        print("{:<{w}}  {:<8}  {:<8}  {:<6}  {:>8.1f}  {}".format(
+            row["target"], row["python"], row["pip"], "ok" if row["ok"] else "FAILED",
+            row["seconds"], row["detail"], w=width))
+    failed = sum(1 for row in rows if not row["ok"])
+    print("{} of {} targets bootstrapped".format(len(rows) - failed, len(rows)))
+    return 1 if failed else 0
+
+
+def bootstrap(tmpdir, offline_wheel=None):
     monkeypatch_for_cert(tmpdir)
 
     # Execute the included pip and use it to install the latest pip and
-    # any user-requested packages from PyPI.
+    # any user-requested packages from PyPI (or, offline, the embedded pip).
     from pip._internal.cli.main import main as pip_entry_point
-    args = determine_pip_install_arguments()
+    args = determine_pip_install_arguments(offline_wheel)
     sys.exit(pip_entry_point(args))
 
 
@@ -125,16 +407,26 @@ def main():
         # Create a temporary working directory
         tmpdir = tempfile.mkdtemp()
 
-        # Unpack the zipfile into the temporary directory
-        pip_zip = os.path.join(tmpdir, "pip.zip")
-        with open(pip_zip, "wb") as fp:
-            fp.write(b85decode(DATA.replace(b"\n", b"")))
+        options, pip_args = parse_bootstrap_options()
+        if options.bootstrap_into:
+            sys.exit(fan_out(options, pip_args))
+
+        offline = options.offline_bootstrap or bool(os.environ.get("PIP_BOOTSTRAP_OFFLINE"))
+        if options.no_bootstrap_cache or os.environ.get("PIP_BOOTSTRAP_NO_CACHE"):
+            # Unpack the zipfile into the temporary directory
+            pip_path = os.path.join(tmpdir, "pip.zip")
+            write_payload(pip_path)
+        else:
+            # Reuse (or fill) the persistent cache keyed by the payload hash;
+            # the unpacked, byte-compiled copy is the fast path
+            zipped = options.zip_bootstrap or bool(os.environ.get("PIP_BOOTSTRAP_ZIP"))
+            pip_path = cached_pip_path(unpacked=not zipped)
 
-        # Add the zipfile to sys.path so that we can import it
-        sys.path.insert(0, pip_zip)
+        # Add pip to sys.path so that we can import it
+        sys.path.insert(0, pip_path)
 
         # Run the bootstrap
-        bootstrap(tmpdir=tmpdir)
+        bootstrap(tmpdir=tmpdir, offline_wheel=offline_wheel_path() if offline else None)
     finally:
         # Clean up our temporary working directory
         if tmpdir:
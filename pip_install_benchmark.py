@@ -0,0 +1,85 @@
+# PIP INSTALL BENCHMARK: memória de pico e tempo da decodificação do pip embutido
+#
+# Compara os dois caminhos de pip_install.py para gerar o pip.zip:
+#   • atual     - b85decode(DATA.replace(b"\n", b"")) e um único write
+#   • streaming - pip_install.write_payload(), linha a linha em blocos
+#
+# Cada medição roda em um processo novo. O RSS de base é lido depois do
+# import (o literal DATA já está carregado), então o "pico extra" é só o que
+# a decodificação adiciona.
+#
+#   python pip_install_benchmark.py [--repeticoes 5]
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+MODOS = ("atual", "streaming")
+
+_FILHO = r"""
+import gc, json, os, resource, sys, tempfile, time
+from base64 import b85decode
+sys.path.insert(0, sys.argv[2])
+import pip_install
+
+def rss_atual():
+    with open("/proc/self/statm") as fp:
+        return int(fp.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+def rss_pico():
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico if sys.platform == "darwin" else pico * 1024
+
+gc.collect()
+base = rss_atual()
+destino = os.path.join(tempfile.mkdtemp(), "pip.zip")
+inicio = time.perf_counter()
+if sys.argv[1] == "atual":
+    with open(destino, "wb") as fp:
+        fp.write(b85decode(pip_install.DATA.replace(b"\n", b"")))
+else:
+    pip_install.write_payload(destino)
+duracao = time.perf_counter() - inicio
+tamanho = os.path.getsize(destino)
+os.remove(destino)
+print(json.dumps({"segundos": duracao, "pico_extra": rss_pico() - base, "tamanho": tamanho}))
+"""
+
+
+def medir(modo):
+    """Roda uma decodificação em um processo novo; retorna {segundos, pico_extra, tamanho}"""
+    diretorio = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run([sys.executable, "-S", "-c", _FILHO, modo, diretorio],
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Benchmark da decodificação do pip embutido em pip_install.py")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+
+    if not os.path.exists("/proc/self/statm"):
+        print("❌ Este benchmark lê o RSS em /proc (Linux)")
+        sys.exit(1)
+
+    print(f"⏱️  Decodificando o pip embutido ({args.repeticoes} execuções por modo)")
+    print("=" * 60)
+    print(f"{'modo':10} {'tempo (mediana)':>16} {'pico extra (máx)':>18}")
+    print("-" * 60)
+    for modo in MODOS:
+        medidas = [medir(modo) for _ in range(args.repeticoes)]
+        tempo = statistics.median(m["segundos"] for m in medidas)
+        pico = max(m["pico_extra"] for m in medidas)
+        print(f"{modo:10} {tempo:>15.3f}s {pico / 1024 / 1024:>16.1f}MB")
+    print("=" * 60)
+    print(f"📦 pip.zip: {medidas[0]['tamanho'] / 1024 / 1024:.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# Testes dos módulos pack_*: só funções puras e caminhos locais (sem rede,
+# sem instalar nada). Os módulos ficam na raiz do repositório.
+#
+#   python -m pytest -q
+
+import http.server
+import os
+import re
+import sys
+import threading
+
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
+
+
+@pytest.fixture(autouse=True)
+def cache_isolado(tmp_path, monkeypatch):
+    """Cada teste com o próprio diretório de cache (pack_index.diretorio_cache)"""
+    monkeypatch.setenv("PACK_CACHE_DIR", str(tmp_path / "cache"))
+
+
+class _Arquivos(http.server.BaseHTTPRequestHandler):
+    """Serve self.server.arquivos[nome] com suporte a Range e ETag; guarda as faixas pedidas"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        nome = self.path.lstrip("/")
+        self.server.pedidos.append(nome)
+        dados = self.server.arquivos.get(nome)
+        cabecalhos = self.server.cabecalhos.get(nome, {})
+        if dados is not None and "ETag" in cabecalhos and self.headers.get("If-None-Match") == cabecalhos["ETag"]:
+            self.send_response(304)
+            for chave, valor in cabecalhos.items():
+                self.send_header(chave, valor)
+            self.end_headers()
+            return
+        if dados is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        faixa = re.match(r"bytes=(\d+)-(\d*)$", self.headers.get("Range", ""))
+        if faixa and self.server.aceita_faixas:
+            inicio = int(faixa.group(1))
+            fim = int(faixa.group(2)) if faixa.group(2) else len(dados) - 1
+            self.server.faixas.append((inicio, fim))
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {inicio}-{fim}/{len(dados)}")
+        else:
+            inicio, fim = 0, len(dados) - 1
+            self.send_response(200)
+        corpo = dados[inicio:fim + 1]
+        for chave, valor in cabecalhos.items():
+            self.send_header(chave, valor)
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        if self.server.corte and len(corpo) > self.server.corte:
+            # Queda no meio da resposta: só os primeiros `corte` bytes chegam
+            self.wfile.write(corpo[:self.server.corte])
+            self.close_connection = True
+            return
+        self.wfile.write(corpo)
+
+
+@pytest.fixture
+def servidor():
+    """Servidor HTTP local: servidor.arquivos = {nome: bytes}, servidor.cabecalhos = {nome: {...}}
+
+    servidor.corte = N derruba a conexão depois de N bytes de cada resposta.
+    """
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Arquivos)
+    httpd.arquivos = {}
+    httpd.cabecalhos = {}
+    httpd.pedidos = []
+    httpd.faixas = []
+    httpd.aceita_faixas = True
+    httpd.corte = None
+    httpd.url = lambda nome: f"http://127.0.0.1:{httpd.server_address[1]}/{nome}"
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
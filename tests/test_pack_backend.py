@@ -0,0 +1,37 @@
+import pytest
+
+import jupyter_lab_update
+import pack_backend
+import pack_catalog
+
+
+@pytest.fixture(params=["pip", "uv"])
+def backend(request, monkeypatch):
+    if request.param == "uv":
+        monkeypatch.setattr(pack_backend.shutil, "which", lambda nome: "/opt/bin/uv")
+    else:
+        monkeypatch.setattr(pack_backend.shutil, "which", lambda nome: None)
+    monkeypatch.setattr(pack_backend, "backend", pack_backend.selecionar(request.param))
+    return request.param
+
+
+def test_comando_atualizacao_do_catalogo_usa_o_backend(backend):
+    instalador = pack_catalog.CatalogInstaller("fase2")
+    comando = instalador.comando_atualizacao([("torch", "2.4.0", "2.5.1"), ("numpy", "1.26.4", "2.1.0")])
+    assert comando == pack_backend.comando_install(
+        ["--upgrade", "--extra-index-url", "https://download.pytorch.org/whl/cpu", "torch", "numpy"])
+    assert (comando[0] == "/opt/bin/uv") == (backend == "uv")
+    # Já no formato do backend: converter_comando não precisa reescrever
+    assert pack_backend.converter_comando(comando) == comando
+
+
+def test_comando_atualizacao_do_jupyter_usa_o_backend(backend):
+    comando = jupyter_lab_update.comando_atualizacao(["jupyterlab", "tornado"])
+    assert comando == pack_backend.comando_install(["--upgrade", *jupyter_lab_update.FAMILIA, "tornado"])
+
+
+def test_converter_comando_pip_para_uv(monkeypatch):
+    monkeypatch.setattr(pack_backend.shutil, "which", lambda nome: "/opt/bin/uv")
+    monkeypatch.setattr(pack_backend, "backend", pack_backend.selecionar("uv"))
+    assert pack_backend.converter_comando("python -m pip install -U numpy") == \
+        "/opt/bin/uv pip install --python " + pack_backend.sys.executable + " -U numpy"
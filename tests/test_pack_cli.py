@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+import pack_backend
+import pack_cli
+
+
+def _executar(capsys, argv):
+    with pytest.raises(SystemExit) as saida:
+        pack_cli.main(argv)
+    capturado = capsys.readouterr()
+    # Contrato: o stdout tem só JSON lines
+    registros = [json.loads(linha) for linha in capturado.out.splitlines()]
+    return saida.value.code, registros, capturado.err
+
+
+@pytest.fixture
+def sem_uv(monkeypatch):
+    monkeypatch.setattr(pack_backend.shutil, "which", lambda nome: None)
+    monkeypatch.setattr(pack_backend, "backend", None)
+
+
+def test_status_com_uv_ausente_so_emite_json(capsys, sem_uv):
+    codigo, registros, log = _executar(capsys, ["--backend", "uv", "status", "fase1"])
+    assert codigo == 0
+    assert "uv não encontrado" in log
+    assert [r["evento"] for r in registros[:-1]] == ["status"] * (len(registros) - 1)
+    assert registros[-1]["evento"] == "resumo" and registros[-1]["total"] == len(registros) - 1
+    assert pack_backend.atual().nome == "pip"
+
+
+def test_install_de_pacotes_ja_instalados(capsys, sem_uv, monkeypatch):
+    monkeypatch.setattr(pack_cli, "_versao", lambda pacote: "1.0")
+    codigo, registros, _ = _executar(capsys, ["--quiet", "--backend", "uv", "install", "fase1"])
+    assert codigo == 0
+    assert all(r["ja_instalado"] and r["ok"] for r in registros[:-1])
+    resumo = registros[-1]
+    assert resumo["evento"] == "resumo" and resumo["backend"] == "pip" and resumo["falhas"] == 0
+
+
+def test_alvo_desconhecido_e_erro_de_uso(capsys):
+    with pytest.raises(SystemExit) as saida:
+        pack_cli.main(["status", "nao-existe"])
+    assert saida.value.code == 2 and capsys.readouterr().out == ""
@@ -0,0 +1,128 @@
+import hashlib
+import json
+import os
+import threading
+
+import pytest
+
+import pack_download
+import pack_falhas
+
+
+@pytest.mark.parametrize("tamanho, partes", [
+    (1, 4), (100, 4), (pack_download.BLOCO, 4), (10 * pack_download.BLOCO + 3, 4),
+    (3 * pack_download.BLOCO, 8), (7 * pack_download.BLOCO, 1),
+])
+def test_dividir_cobre_o_arquivo_sem_buracos(tamanho, partes):
+    faixas = pack_download._dividir(tamanho, partes)
+    assert faixas[0][0] == 0 and faixas[-1][1] == tamanho - 1
+    for anterior, seguinte in zip(faixas, faixas[1:]):
+        assert seguinte[0] == anterior[1] + 1
+    assert all(faixa[2] == 0 for faixa in faixas)
+    # Nunca mais faixas que blocos inteiros, nem mais que o pedido
+    assert len(faixas) <= max(1, min(partes, tamanho // pack_download.BLOCO))
+
+
+@pytest.fixture
+def arquivo(servidor):
+    dados = os.urandom(3 * pack_download.BLOCO + 12345)
+    servidor.arquivos["pacote-1.0-py3-none-any.whl"] = dados
+    return dados, servidor.url("pacote-1.0-py3-none-any.whl"), hashlib.sha256(dados).hexdigest()
+
+
+def test_baixar_em_faixas_confere_sha256(servidor, arquivo, tmp_path):
+    dados, url, sha256 = arquivo
+    destino = pack_download.baixar(url, str(tmp_path / "p.whl"), sha256, partes=3, mostrar=False)
+    with open(destino, "rb") as fp:
+        assert fp.read() == dados
+    assert not os.path.exists(destino + ".part") and not os.path.exists(destino + ".part.json")
+    # Sondagem (0-0) e uma requisição por faixa
+    assert len(servidor.faixas) == 1 + 3
+
+
+def test_baixar_retoma_o_parcial(servidor, arquivo, tmp_path):
+    dados, url, sha256 = arquivo
+    destino = str(tmp_path / "p.whl")
+    faixas = pack_download._dividir(len(dados), 2)
+    # Metade de cada faixa já recebida numa execução anterior
+    with open(destino + ".part", "wb") as fp:
+        fp.truncate(len(dados))
+        for faixa in faixas:
+            faixa[2] = (faixa[1] + 1 - faixa[0]) // 2
+            fp.seek(faixa[0])
+            fp.write(dados[faixa[0]:faixa[0] + faixa[2]])
+    with open(destino + ".part.json", "w", encoding="utf-8") as fp:
+        json.dump({"url": url, "tamanho": len(dados), "sha256": sha256, "faixas": faixas}, fp)
+
+    pack_download.baixar(url, destino, sha256, partes=2, mostrar=False)
+    with open(destino, "rb") as fp:
+        assert fp.read() == dados
+    assert sorted(servidor.faixas[1:]) == [(f[0] + f[2], f[1]) for f in faixas]
+
+
+def test_estado_de_outro_arquivo_recomeca(servidor, arquivo, tmp_path):
+    dados, url, sha256 = arquivo
+    destino = str(tmp_path / "p.whl")
+    with open(destino + ".part", "wb") as fp:
+        fp.write(b"\0" * len(dados))
+    with open(destino + ".part.json", "w", encoding="utf-8") as fp:
+        json.dump({"url": url, "tamanho": len(dados), "sha256": "0" * 64,
+                   "faixas": [[0, len(dados) - 1, len(dados)]]}, fp)
+
+    pack_download.baixar(url, destino, sha256, partes=2, mostrar=False)
+    with open(destino, "rb") as fp:
+        assert fp.read() == dados
+    # Sondagem e as duas faixas novas, do zero
+    assert sorted(servidor.faixas[1:]) == [(f[0], f[1]) for f in pack_download._dividir(len(dados), 2)]
+
+
+def test_sha256_diferente_descarta_o_parcial(servidor, arquivo, tmp_path):
+    _, url, _ = arquivo
+    destino = str(tmp_path / "p.whl")
+    with pytest.raises(pack_download.DownloadErro) as erro:
+        pack_download.baixar(url, destino, "f" * 64, partes=2, mostrar=False)
+    assert erro.value.classe == pack_falhas.HASH
+    assert not any(os.path.exists(destino + sufixo) for sufixo in ("", ".part", ".part.json"))
+
+
+def test_servidor_sem_range(servidor, arquivo, tmp_path):
+    dados, url, sha256 = arquivo
+    servidor.aceita_faixas = False
+    destino = pack_download.baixar(url, str(tmp_path / "p.whl"), sha256, mostrar=False)
+    with open(destino, "rb") as fp:
+        assert fp.read() == dados
+    with pytest.raises(pack_download.DownloadErro):
+        pack_download.ler_faixa(url, 0, 9)
+
+
+def test_quedas_com_avanco_nao_esgotam_as_tentativas(servidor, arquivo, tmp_path, monkeypatch):
+    dados, url, sha256 = arquivo
+    monkeypatch.setattr(pack_falhas, "TENTATIVAS_REDE", 2)
+    monkeypatch.setattr(pack_falhas, "espera", lambda tentativa: 0)
+    # Cada resposta cai depois de 256 KB: muito mais quedas do que TENTATIVAS_REDE
+    servidor.corte = 256 * 1024
+    destino = pack_download.baixar(url, str(tmp_path / "p.whl"), sha256, partes=2, mostrar=False)
+    with open(destino, "rb") as fp:
+        assert fp.read() == dados
+    assert len(servidor.faixas) > 2 * (pack_falhas.TENTATIVAS_REDE + 1)
+
+
+def test_dois_processos_no_mesmo_parcial(servidor, arquivo, tmp_path):
+    dados, url, sha256 = arquivo
+    destino = str(tmp_path / "p.whl")
+    resultados = []
+
+    def baixar():
+        resultados.append(pack_download.baixar(url, destino, sha256, partes=3, mostrar=False))
+
+    # flock trava por descrição de arquivo aberta: duas threads disputam como dois processos
+    threads = [threading.Thread(target=baixar) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert resultados == [destino, destino]
+    with open(destino, "rb") as fp:
+        assert fp.read() == dados
+    # Um único download: sondagem + 3 faixas; o segundo encontrou o arquivo pronto
+    assert len(servidor.faixas) == 1 + 3
@@ -0,0 +1,57 @@
+import pack_download
+import pack_escalonador
+
+MB = 1_000_000
+
+
+def _item(nome, tamanho, requires=()):
+    return {"name": nome, "version": "1.0", "url": f"https://exemplo/{nome}-1.0-py3-none-any.whl",
+            "tamanho": tamanho, "requires": list(requires)}
+
+
+def _por_nome(itens):
+    return {item["name"]: item for item in itens}
+
+
+def test_fechamento_segue_extras_e_marcadores():
+    itens = _por_nome([
+        _item("pacote", 1, ["base", "opcional; extra == 'gpu'", "windows; sys_platform == 'never'"]),
+        _item("base", 1, ["folha"]),
+        _item("folha", 1),
+        _item("opcional", 1),
+        _item("windows", 1),
+    ])
+    assert sorted(pack_escalonador.fechamento("pacote", itens)) == ["base", "folha", "pacote"]
+    assert sorted(pack_escalonador.fechamento("pacote[gpu]>=1", itens)) == ["base", "folha", "opcional", "pacote"]
+
+
+def test_fechamento_ignora_ja_instalados_e_ciclos():
+    itens = _por_nome([_item("a", 1, ["b", "instalado"]), _item("b", 1, ["a"])])
+    assert sorted(pack_escalonador.fechamento("a", itens)) == ["a", "b"]
+
+
+def test_montar_unidades_menor_primeiro_e_sem_repetir():
+    itens = [
+        _item("grande", 500 * MB, ["comum", "so-do-grande"]),
+        _item("pequeno", 1 * MB, ["comum"]),
+        _item("comum", 2 * MB),
+        _item("so-do-grande", 3 * MB),
+        _item("sobra", 1 * MB),
+    ]
+    unidades = pack_escalonador.montar_unidades(["grande", "pequeno"], itens)
+    assert [u.pacote for u in unidades] == ["pequeno", "grande", "(dependências)"]
+    assert unidades[0].nomes == {"pequeno", "comum"}
+    assert unidades[1].nomes == {"grande", "so-do-grande"}
+    assert unidades[2].nomes == {"sobra"}
+    assert unidades[1].bytes == 503 * MB
+    assert unidades[1].pesada and not unidades[0].pesada
+    # Cada distribuição em exatamente uma unidade
+    todos = [nome for u in unidades for nome in u.nomes]
+    assert sorted(todos) == sorted(item["name"] for item in itens)
+
+
+def test_pesado_usa_o_limiar_de_download(monkeypatch):
+    monkeypatch.setattr(pack_download, "LIMIAR_MB", 10)
+    assert pack_escalonador.pesado(_item("x", 10 * MB))
+    assert not pack_escalonador.pesado(_item("x", 10 * MB - 1))
+    assert not pack_escalonador.pesado(_item("x", None))
@@ -0,0 +1,96 @@
+import io
+import struct
+import zipfile
+
+import pytest
+
+import pack_download
+import pack_escalonador
+import pack_espaco
+
+
+def _zip(membros):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        for nome, conteudo in membros:
+            zf.writestr(nome, conteudo)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def remoto(monkeypatch):
+    """Troca pack_download.ler_faixa por fatias de `remoto.dados`; guarda as faixas lidas"""
+    class Remoto:
+        dados = b""
+        faixas = []
+
+    def ler_faixa(url, inicio, fim):
+        Remoto.faixas.append((inicio, fim))
+        return Remoto.dados[inicio:fim + 1]
+
+    monkeypatch.setattr(pack_download, "ler_faixa", ler_faixa)
+    return Remoto
+
+
+def test_diretorio_central_na_cauda(remoto):
+    remoto.dados = _zip([("pacote/__init__.py", b"x" * 1000), ("pacote/dados.bin", b"\0" * 200000)])
+    central = pack_espaco._diretorio_central_remoto("u", len(remoto.dados))
+    assert pack_espaco._soma_descompactada(io.BytesIO(central)) == 201000
+    assert len(remoto.faixas) == 1
+
+
+def test_diretorio_central_maior_que_a_cauda(remoto):
+    membros = [(f"pacote/modulo_com_nome_comprido_{i:05}.py", b"") for i in range(3000)]
+    remoto.dados = _zip(membros + [("pacote/grande.bin", b"\0" * 500000)])
+    central = pack_espaco._diretorio_central_remoto("u", len(remoto.dados))
+    assert pack_espaco._soma_descompactada(io.BytesIO(central)) == 500000
+    assert len(remoto.faixas) == 2 and remoto.faixas[1][1] == remoto.faixas[0][0] - 1
+
+
+def _zip64():
+    """Zip com registros zip64 e o deslocamento do registro final em 0xFFFFFFFF"""
+    dados = bytearray(_zip([(f"m{i}", b"") for i in range(0x10000)] + [("grande.bin", b"\0" * 4096)]))
+    fim = dados.rfind(b"PK\x05\x06")
+    assert dados[fim - 20:fim - 16] == b"PK\x06\x07"
+    struct.pack_into("<L", dados, fim + 16, 0xFFFFFFFF)
+    return dados, fim
+
+
+def test_diretorio_central_zip64(remoto):
+    remoto.dados, _ = _zip64()
+    central = pack_espaco._diretorio_central_remoto("u", len(remoto.dados))
+    assert pack_espaco._soma_descompactada(io.BytesIO(central)) == 4096
+
+
+def test_registro_zip64_fora_da_cauda(remoto):
+    dados, fim = _zip64()
+    # Localizador apontando para antes da cauda lida
+    struct.pack_into("<Q", dados, fim - 12, 0)
+    remoto.dados = bytes(dados)
+    with pytest.raises(zipfile.BadZipFile):
+        pack_espaco._diretorio_central_remoto("u", len(remoto.dados))
+    item = {"name": "x", "url": "https://exemplo/x-1.0-py3-none-any.whl", "tamanho": len(remoto.dados)}
+    assert pack_espaco._medir_instalado(item) is None
+
+
+def test_sem_registro_final(remoto):
+    remoto.dados = b"\0" * 1000
+    with pytest.raises(zipfile.BadZipFile):
+        pack_espaco._diretorio_central_remoto("u", len(remoto.dados))
+
+
+def test_medir_instalados_local_e_estimado(tmp_path):
+    wheel = tmp_path / "local-1.0-py3-none-any.whl"
+    wheel.write_bytes(_zip([("local/a.py", b"a" * 300), ("local/b.py", b"b" * 700)]))
+    itens = [
+        {"name": "local", "url": wheel.as_uri(), "tamanho": wheel.stat().st_size, "sha256": "abc"},
+        {"name": "sdist", "url": "https://exemplo/sdist-1.0.tar.gz", "tamanho": 1000},
+    ]
+    assert pack_espaco.medir_instalados(itens) == 1
+    assert itens[0]["instalado"] == 1000 and not itens[0]["estimado"]
+    assert itens[1]["instalado"] == 1000 * pack_escalonador.FATOR_DESCOMPACTACAO and itens[1]["estimado"]
+    # Medido uma vez, lido do cache pelo sha256 na próxima
+    wheel.unlink()
+    itens[0].pop("instalado")
+    pack_espaco.medir_instalados(itens[:1])
+    assert itens[0]["instalado"] == 1000 and not itens[0]["estimado"]
@@ -0,0 +1,89 @@
+import subprocess
+
+import pytest
+
+import pack_falhas
+
+# Trechos reais de stderr do pip e do uv
+AMOSTRAS = [
+    # pip: timeout que termina em "No matching distribution" - é rede, não conflito
+    ("WARNING: Retrying (Retry(total=4, connect=None, read=None, redirect=None, status=None)) after "
+     "connection broken by 'ReadTimeoutError(\"HTTPSConnectionPool(host='pypi.org', port=443): Read timed "
+     "out. (read timeout=15)\")': /simple/numpy/\n"
+     "ERROR: Could not find a version that satisfies the requirement numpy (from versions: none)\n"
+     "ERROR: No matching distribution found for numpy", pack_falhas.REDE),
+    ("ERROR: THESE PACKAGES DO NOT MATCH THE HASHES FROM THE REQUIREMENTS FILE. If you have updated the "
+     "package versions, please update the hashes. Otherwise, examine the package contents carefully; "
+     "someone may have tampered with them.\n    numpy from https://files.pythonhosted.org/...", pack_falhas.HASH),
+    ("  error: subprocess-exited-with-error\n\n  × Building wheel for pyyaml (pyproject.toml) did not run "
+     "successfully.\n  │ exit code: 1\n  ERROR: Failed building wheel for pyyaml", pack_falhas.BUILD),
+    ("ERROR: Cannot install tensorflow==2.16.1 and numpy==2.1.0 because these package versions have "
+     "conflicting dependencies.\nERROR: ResolutionImpossible: for help visit "
+     "https://pip.pypa.io/en/latest/topics/dependency-resolution/", pack_falhas.CONFLITO),
+    ("ERROR: Could not install packages due to an OSError: [Errno 28] No space left on device",
+     pack_falhas.DISCO),
+    ("ERROR: Could not install packages due to an OSError: [Errno 13] Permission denied: "
+     "'/usr/lib/python3/dist-packages/six.py'\nConsider using the `--user` option or check the permissions.",
+     pack_falhas.PERMISSAO),
+    # uv
+    ("error: Failed to fetch: `https://pypi.org/simple/numpy/`\n  Caused by: Request failed after 3 retries\n"
+     "  Caused by: error sending request for url (https://pypi.org/simple/numpy/)", pack_falhas.REDE),
+    ("error: Failed to download and build `pyyaml==5.4.1`\n  Caused by: Build backend failed to determine "
+     "requirements with `build_wheel()` (exit status: 1)", pack_falhas.BUILD),
+    ("  × No solution found when resolving dependencies:\n  ╰─▶ Because foo==1.0 depends on bar<2 and you "
+     "require bar>=2, we can conclude that your requirements and foo==1.0 are incompatible.",
+     pack_falhas.CONFLITO),
+    ("error: Failed to install: torch-2.5.1-cp311-cp311-manylinux1_x86_64.whl (torch==2.5.1)\n  Caused by: "
+     "failed to write to file `/venv/lib/python3.11/site-packages/torch/lib/libtorch_cpu.so`: No space left "
+     "on device (os error 28)", pack_falhas.DISCO),
+    ("", pack_falhas.DESCONHECIDA),
+    ("Traceback (most recent call last):\nKeyError: 'x'", pack_falhas.DESCONHECIDA),
+]
+
+
+@pytest.mark.parametrize("stderr, classe", AMOSTRAS)
+def test_classificar(stderr, classe):
+    assert pack_falhas.classificar(stderr) == classe
+
+
+def test_espera_cresce_e_tem_teto():
+    for tentativa in range(1, 12):
+        base = min(pack_falhas.ESPERA_MAXIMA, pack_falhas.ESPERA_INICIAL * 2 ** (tentativa - 1))
+        assert 0.75 * base <= pack_falhas.espera(tentativa) <= 1.25 * base
+
+
+def test_ajustar_comando_rede_pip(monkeypatch):
+    monkeypatch.setattr(pack_falhas, "_pip_retoma_downloads", lambda: True)
+    comando = ["python", "-m", "pip", "install", "--timeout", "5", "numpy"]
+    novo = pack_falhas.ajustar_comando(comando, pack_falhas.REDE, 2)
+    assert novo[:8] == ["python", "-m", "pip", "install", "--resume-retries", "15", "--timeout", "60"]
+    assert novo.count("--timeout") == 1 and novo[-1] == "numpy"
+
+
+def test_ajustar_comando_hash_em_string():
+    novo = pack_falhas.ajustar_comando("python -m pip install numpy", pack_falhas.HASH, 1)
+    assert isinstance(novo, str) and "--no-cache-dir" in novo.split()
+
+
+def test_ajustar_comando_nao_mexe_no_uv():
+    comando = ["/usr/bin/uv", "pip", "install", "numpy"]
+    assert pack_falhas.ajustar_comando(comando, pack_falhas.REDE, 1) == comando
+
+
+def _processo(codigo, stderr=""):
+    return subprocess.CompletedProcess([], codigo, "", stderr)
+
+
+def test_repetir_falha_de_rede_e_depois_sucesso(monkeypatch):
+    monkeypatch.setattr(pack_falhas.time, "sleep", lambda s: None)
+    monkeypatch.setattr(pack_falhas, "TENTATIVAS", {pack_falhas.REDE: 3, pack_falhas.HASH: 1})
+    respostas = iter([_processo(1, "ReadTimeoutError: timed out"), _processo(0)])
+    result = pack_falhas.repetir(lambda c: next(respostas), ["uv", "pip", "install", "x"], "teste")
+    assert result.returncode == 0 and result.falha is None and result.tentativas == 1
+
+
+def test_repetir_nao_repete_conflito(monkeypatch):
+    chamadas = []
+    result = pack_falhas.repetir(lambda c: chamadas.append(c) or _processo(1, "ResolutionImpossible"),
+                                 ["pip", "install", "x"], "teste")
+    assert len(chamadas) == 1 and result.falha == pack_falhas.CONFLITO and result.tentativas == 0
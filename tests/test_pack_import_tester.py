@@ -0,0 +1,41 @@
+import pytest
+
+import pack_import_tester
+
+
+@pytest.fixture
+def modulos(tmp_path, monkeypatch):
+    """Módulos falsos no diretório atual (o filho roda com -c, então '' está no sys.path)"""
+    (tmp_path / "mod_ok.py").write_text("__version__ = '1.2'\n", encoding="utf-8")
+    (tmp_path / "mod_aviso.py").write_text("raise RuntimeError('sem GPU configurada')\n", encoding="utf-8")
+    (tmp_path / "mod_dep.py").write_text("import modulo_que_nao_existe\n", encoding="utf-8")
+    (tmp_path / "mod_morre.py").write_text("import os\nos._exit(3)\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+
+def test_ok_com_versao_e_tempo(modulos):
+    r = pack_import_tester.testar("ok", "mod_ok")
+    assert r["ok"] and r["versao"] == "1.2" and r["aviso"] is None and r["segundos"] > 0
+
+
+def test_excecao_que_nao_e_import_error_e_aviso(modulos):
+    r = pack_import_tester.testar("aviso", "mod_aviso")
+    assert r["ok"] and r["erro"] is None and "sem GPU configurada" in r["aviso"]
+
+
+@pytest.mark.parametrize("modulo, trecho", [
+    ("mod_dep", "modulo_que_nao_existe"),
+    ("mod_inexistente", "mod_inexistente"),
+    ("mod_morre", "código 3"),
+])
+def test_falhas(modulos, modulo, trecho):
+    r = pack_import_tester.testar(modulo, modulo)
+    assert not r["ok"] and trecho in r["erro"]
+
+
+def test_relatorio_conta_avisos_como_ok(modulos, capsys):
+    resultados = pack_import_tester.testar_varios(["ok", "aviso", "dep"], max_workers=3,
+                                                  modulos={"ok": "mod_ok", "aviso": "mod_aviso", "dep": "mod_dep"})
+    pack_import_tester.imprimir_relatorio(resultados)
+    saida = capsys.readouterr().out
+    assert "📊 2/3 importaram (1 com aviso)" in saida
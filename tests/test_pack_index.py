@@ -0,0 +1,87 @@
+import os
+import shutil
+
+import pytest
+
+import pack_index
+
+
+def _distribuicao(diretorio, nome, versao):
+    info = diretorio / f"{nome}-{versao}.dist-info"
+    info.mkdir()
+    (info / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {nome}\nVersion: {versao}\n", encoding="utf-8")
+    # Garante um mtime novo mesmo em sistemas de arquivos com resolução grossa
+    estado = os.stat(diretorio)
+    os.utime(diretorio, ns=(estado.st_atime_ns, estado.st_mtime_ns + 1_000_000_000))
+    return info
+
+
+@pytest.fixture
+def site(tmp_path):
+    diretorio = tmp_path / "site-packages"
+    diretorio.mkdir()
+    _distribuicao(diretorio, "Pacote_A", "1.0")
+    return diretorio
+
+
+def _indice(site, tmp_path):
+    return pack_index.InstalledIndex([str(site)], str(tmp_path / "status.json"))
+
+
+def _contar_leituras(monkeypatch):
+    lidas = []
+    original = pack_index.InstalledIndex._ler_entrada
+
+    def ler(diretorio, entrada):
+        lidas.append(entrada)
+        return original(diretorio, entrada)
+
+    monkeypatch.setattr(pack_index.InstalledIndex, "_ler_entrada", staticmethod(ler))
+    return lidas
+
+
+def test_versao_normalizada_e_ausente(site, tmp_path):
+    indice = _indice(site, tmp_path)
+    assert indice.versao("pacote-a") == "1.0" and indice.versao("PACOTE.A") == "1.0"
+    assert indice.versao("outro") == pack_index.NAO_INSTALADO and not indice.instalado("outro")
+
+
+def test_cache_quente_nao_rele_metadados(site, tmp_path, monkeypatch):
+    _indice(site, tmp_path).construir()
+    lidas = _contar_leituras(monkeypatch)
+    assert _indice(site, tmp_path).versao("pacote-a") == "1.0"
+    assert lidas == []
+
+
+def test_mtime_alterado_rele_so_as_entradas_novas(site, tmp_path, monkeypatch):
+    indice = _indice(site, tmp_path)
+    indice.construir()
+    lidas = _contar_leituras(monkeypatch)
+    _distribuicao(site, "pacote_b", "2.0")
+    indice.invalidar()
+    assert indice.versao("pacote-b") == "2.0"
+    assert lidas == ["pacote_b-2.0.dist-info"]
+    # Outro processo enxerga a mudança pelo cache em disco
+    assert _indice(site, tmp_path).versao("pacote-b") == "2.0"
+
+
+def test_atualizacao_e_remocao(site, tmp_path):
+    indice = _indice(site, tmp_path)
+    indice.construir()
+    shutil.rmtree(site / "Pacote_A-1.0.dist-info")
+    _distribuicao(site, "Pacote_A", "1.1")
+    indice.invalidar()
+    assert indice.versao("pacote-a") == "1.1"
+    shutil.rmtree(site / "Pacote_A-1.1.dist-info")
+    estado = os.stat(site)
+    os.utime(site, ns=(estado.st_atime_ns, estado.st_mtime_ns + 1_000_000_000))
+    indice.invalidar()
+    assert indice.versao("pacote-a") == pack_index.NAO_INSTALADO
+
+
+def test_cache_de_outro_interpretador_e_ignorado(site, tmp_path, monkeypatch):
+    _indice(site, tmp_path).construir()
+    monkeypatch.setattr(pack_index.sys, "executable", "/outro/python")
+    lidas = _contar_leituras(monkeypatch)
+    assert _indice(site, tmp_path).versao("pacote-a") == "1.0"
+    assert lidas == ["Pacote_A-1.0.dist-info"]
@@ -0,0 +1,49 @@
+import json
+import os
+import stat
+
+import pytest
+
+import pack_jupyter
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="permissões POSIX")
+
+
+def _modo(caminho):
+    return stat.S_IMODE(os.stat(caminho).st_mode)
+
+
+def test_registro_so_do_dono():
+    antigo = os.umask(0o022)
+    try:
+        pack_jupyter._gravar_registro([{"porta": 8888, "token": "segredo"}])
+    finally:
+        os.umask(antigo)
+    arquivo = pack_jupyter._arquivo_registro()
+    assert _modo(arquivo) == 0o600
+    assert _modo(os.path.dirname(arquivo)) == 0o700
+    assert pack_jupyter._ler_registro() == [{"porta": 8888, "token": "segredo"}]
+
+
+def test_diretorio_e_log_existentes_sao_fechados():
+    diretorio = os.path.dirname(pack_jupyter._arquivo_registro())
+    os.makedirs(diretorio, mode=0o755)
+    log = os.path.join(diretorio, "lab-8888.log")
+    with open(log, "w") as fp:
+        fp.write("antigo")
+    os.chmod(log, 0o644)
+    assert pack_jupyter._diretorio_privado() == diretorio and _modo(diretorio) == 0o700
+    with pack_jupyter._abrir_privado(log) as fp:
+        fp.write("http://127.0.0.1:8888/lab?token=segredo")
+    assert _modo(log) == 0o600
+
+
+def test_registro_antigo_e_migrado():
+    antigo = pack_jupyter._registro_antigo()
+    os.makedirs(os.path.dirname(antigo), exist_ok=True)
+    with open(antigo, "w", encoding="utf-8") as fp:
+        json.dump([{"porta": 9999, "token": "t"}], fp)
+    registro = pack_jupyter._ler_registro()
+    assert registro == [{"porta": 9999, "token": "t"}]
+    pack_jupyter._gravar_registro(registro)
+    assert not os.path.exists(antigo) and _modo(pack_jupyter._arquivo_registro()) == 0o600
@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("jupyter_server")
+
+import pack_kernel_pool  # noqa: E402
+from jupyter_server.services.kernels.kernelmanager import AsyncMappingKernelManager  # noqa: E402
+
+
+@pytest.fixture
+def gerenciador(monkeypatch):
+    """PooledKernelManager com start/shutdown falsos; aquecimento controlado pelo teste"""
+    async def iniciar(self, *, kernel_id=None, path=None, **kwargs):
+        kernel_id = f"k{len(self.iniciados)}"
+        self.iniciados.append(kernel_id)
+        self._kernels[kernel_id] = object()
+        return kernel_id
+
+    async def encerrar(self, kernel_id, now=False, restart=False):
+        self.encerrados.append(kernel_id)
+        self._kernels.pop(kernel_id, None)
+
+    async def executar(self, kernel_id, codigo):
+        await self.liberar.wait()
+        if self.falhar:
+            raise RuntimeError("kernel morreu importando")
+
+    monkeypatch.setattr(AsyncMappingKernelManager, "_async_start_kernel", iniciar)
+    monkeypatch.setattr(pack_kernel_pool.PooledKernelManager, "shutdown_kernel", encerrar)
+    monkeypatch.setattr(pack_kernel_pool.PooledKernelManager, "_executar", executar)
+    km = pack_kernel_pool.PooledKernelManager(tamanho_pool=1, memoria_livre_minima_mb=0, pre_importar=["numpy"])
+    km.iniciados, km.encerrados, km.falhar = [], [], False
+    # Reposição conduzida pelo teste (_repor), como se _agendar_reposicao a tivesse iniciado
+    km._pool_iniciado = km._repondo = True
+    return km
+
+
+def test_kernel_aquecendo_nao_e_entregue(gerenciador):
+    async def cenario():
+        gerenciador.liberar = asyncio.Event()
+        reposicao = asyncio.ensure_future(gerenciador._repor())
+        await asyncio.sleep(0)
+        assert gerenciador._aquecendo == {"k0"} and gerenciador._pool == []
+        # Pedido durante o aquecimento: kernel novo, não o que ainda importa
+        assert await gerenciador.start_kernel(kernel_name=gerenciador._nome_pool) == "k1"
+        gerenciador.liberar.set()
+        await reposicao
+        assert gerenciador._pool == ["k0"] and not gerenciador._aquecendo
+
+    asyncio.run(cenario())
+
+
+def test_falha_no_aquecimento_encerra_o_kernel(gerenciador):
+    async def cenario():
+        gerenciador.liberar = asyncio.Event()
+        gerenciador.liberar.set()
+        gerenciador.falhar = True
+        await gerenciador._repor()
+        assert gerenciador._pool == [] and not gerenciador._aquecendo
+        assert gerenciador.encerrados == ["k0"] and not gerenciador._repondo
+
+    asyncio.run(cenario())
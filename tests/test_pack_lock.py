@@ -0,0 +1,16 @@
+import pack_lock
+
+
+def test_congelar_grava_o_indice_do_catalogo(tmp_path, monkeypatch):
+    recebidos = []
+
+    def resolver(pacotes, extra_args=None):
+        recebidos.append(extra_args)
+        return [("torch", "2.5.1+cpu", "ab" * 32), ("semhash", "1.0", None)]
+
+    monkeypatch.setattr(pack_lock, "resolver", resolver)
+    saida, _ = pack_lock.congelar(2, str(tmp_path / "fase2.txt"))
+    assert recebidos == [["--extra-index-url", "https://download.pytorch.org/whl/cpu"]]
+    linhas = (tmp_path / "fase2.txt").read_text(encoding="utf-8").splitlines()
+    assert "--extra-index-url https://download.pytorch.org/whl/cpu" in linhas
+    assert "torch==2.5.1+cpu \\" in linhas and "semhash==1.0" in linhas
@@ -0,0 +1,37 @@
+import pytest
+
+import pack_catalog
+import pack_index
+import pack_ml_benchmark
+
+
+@pytest.mark.parametrize("framework", pack_ml_benchmark.FRAMEWORKS)
+def test_todos_os_frameworks_rodam_as_mesmas_cargas(framework):
+    # A tabela só compara o mesmo teste entre frameworks se todos o medem
+    for teste in pack_ml_benchmark.FLOPS:
+        assert f'"{teste}": ' in pack_ml_benchmark._CODIGO[framework]
+
+
+def test_comparar_marca_regressao_alem_da_tolerancia():
+    medida = lambda gflops: {"testes": {"matmul": {"gflops": gflops}}}
+    baseline = {"resultados": {"numpy": medida(100.0)}}
+    linhas = pack_ml_benchmark.comparar({"numpy": medida(75.0), "torch": medida(10.0)}, baseline, 0.30)
+    assert linhas == [("numpy", "matmul", 75.0, 100.0, False), ("torch", "matmul", 10.0, None, False)]
+    assert pack_ml_benchmark.comparar({"numpy": medida(69.0)}, baseline, 0.30)[0][4]
+
+
+@pytest.mark.parametrize("benchmark, esperado", [(True, [["torch"]]), (False, [])])
+def test_benchmark_depois_de_instalar_so_quando_pedido(monkeypatch, benchmark, esperado):
+    instalados = {}
+    monkeypatch.setattr(pack_catalog.pack_batch, "instalar_lote",
+                        lambda lote, descricoes, extra_args: instalados.update(dict.fromkeys(lote, "1.0")))
+    chamadas = []
+    monkeypatch.setattr(pack_ml_benchmark, "verificar", chamadas.append)
+    instalador = pack_catalog.CatalogInstaller("machine_learning", benchmark=benchmark)
+    monkeypatch.setattr(instalador, "get_current_version",
+                        lambda pacote: instalados.get(pacote, pack_index.NAO_INSTALADO))
+    monkeypatch.setattr(instalador, "_confirmar_pesados", lambda pacotes: True)
+
+    assert instalador.instalar_pacotes(["torch", "keras"]) == 2
+    # keras, torchvision e torchaudio não são frameworks medidos
+    assert chamadas == esperado
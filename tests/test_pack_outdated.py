@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+import pack_index
+import pack_outdated
+
+
+@pytest.mark.parametrize("instalada, sucesso, situacao", [
+    ("2.5.1", True, pack_outdated.ATUALIZADO),
+    ("2.5.1+cpu", True, pack_outdated.ATUALIZADO),
+    ("2.5.1.0", True, pack_outdated.ATUALIZADO),
+    ("2.6.0", True, pack_outdated.ATUALIZADO),
+    ("2.4.0", True, pack_outdated.RETIDO),
+    ("2.4.0", False, pack_outdated.FALHOU),
+    (pack_index.NAO_INSTALADO, True, pack_outdated.FALHOU),
+])
+def test_situacao_atualizacao(instalada, sucesso, situacao):
+    assert pack_outdated.situacao_atualizacao("2.3.0", instalada, "2.5.1", sucesso) == situacao
+
+
+def test_situacao_com_versao_invalida_compara_o_texto():
+    assert pack_outdated.situacao_atualizacao("abc", "xyz", "xyz", True) == pack_outdated.ATUALIZADO
+    assert pack_outdated.situacao_atualizacao("abc", "abc", "xyz", False) == pack_outdated.FALHOU
+
+
+def _pagina(*versoes):
+    arquivos = [{"filename": f"pacote-{v}-py3-none-any.whl", "url": f"pacote-{v}-py3-none-any.whl", "hashes": {}}
+                for v in versoes]
+    return json.dumps({"name": "pacote", "files": arquivos}).encode()
+
+
+@pytest.fixture
+def indice(servidor, monkeypatch):
+    monkeypatch.delenv("PACK_INDEX_TTL", raising=False)
+    servidor.arquivos["simple/pacote/"] = _pagina("1.0")
+    # max-age como o do PyPI: só deve valer com PACK_INDEX_TTL
+    servidor.cabecalhos["simple/pacote/"] = {"Content-Type": pack_outdated.TIPO_JSON, "ETag": '"v1"',
+                                             "Cache-Control": "max-age=600, public"}
+    return servidor
+
+
+def test_cache_revalida_com_etag_e_ve_lancamento_novo(indice):
+    cliente = pack_outdated.SimpleIndexClient(indice.url("simple"))
+    assert cliente.versao_mais_recente("pacote") == "1.0"
+    assert cliente.versao_mais_recente("pacote") == "1.0"
+    assert indice.pedidos == ["simple/pacote/", "simple/pacote/"]
+    # Lançamento novo: o ETag muda e a próxima consulta já o vê
+    indice.arquivos["simple/pacote/"] = _pagina("1.0", "1.1")
+    indice.cabecalhos["simple/pacote/"]["ETag"] = '"v2"'
+    assert cliente.versao_mais_recente("pacote") == "1.1"
+
+
+def test_ttl_opcional_evita_a_rede(indice, monkeypatch):
+    monkeypatch.setenv("PACK_INDEX_TTL", "60")
+    cliente = pack_outdated.SimpleIndexClient(indice.url("simple"))
+    cliente.versao_mais_recente("pacote")
+    cliente.versao_mais_recente("pacote")
+    assert indice.pedidos == ["simple/pacote/"]
+    # Desligado o TTL, o que foi gravado com validade volta a ser revalidado
+    monkeypatch.delenv("PACK_INDEX_TTL")
+    cliente.versao_mais_recente("pacote")
+    assert len(indice.pedidos) == 2
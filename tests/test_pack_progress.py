@@ -0,0 +1,27 @@
+import pytest
+
+import pack_progress
+
+
+@pytest.mark.parametrize("args", [
+    ["pip", "install", "numpy"],
+    ["/usr/bin/pip3.11", "install", "numpy"],
+    ["pip.exe", "install", "numpy"],
+    ["/venv/bin/python", "-m", "pip", "install", "numpy"],
+    ["python3", "/venv/bin/pip", "install", "numpy"],
+    ["/root/.cargo/bin/uv", "pip", "install", "numpy"],
+])
+def test_e_instalador(args):
+    assert pack_progress._e_instalador(args)
+
+
+@pytest.mark.parametrize("args", [
+    ["uvicorn", "app:main", "install"],
+    ["pipx", "install", "black"],
+    ["pipenv", "install"],
+    ["foo", "pip", "install", "x"],
+    ["pip", "list"],
+    ["python", "-m", "pipx", "install", "x"],
+])
+def test_nao_e_instalador(args):
+    assert not pack_progress._e_instalador(args)
@@ -0,0 +1,80 @@
+import hashlib
+import json
+import os
+
+import pytest
+
+import pack_wheelhouse
+
+
+@pytest.fixture(autouse=True)
+def wheelhouse_isolado(monkeypatch):
+    monkeypatch.delenv("PACK_WHEELHOUSE", raising=False)
+    monkeypatch.setattr(pack_wheelhouse, "OFFLINE", False)
+
+
+def _wheel(pasta, nome, conteudo):
+    caminho = pasta / nome
+    caminho.write_bytes(conteudo)
+    return str(caminho)
+
+
+def _indice():
+    with open(os.path.join(pack_wheelhouse.diretorio(), "index.json"), encoding="utf-8") as fp:
+        return json.load(fp)
+
+
+def test_adicionar_enderecado_pelo_sha256(tmp_path):
+    conteudo = b"wheel de teste" * 1000
+    digest = pack_wheelhouse.adicionar(_wheel(tmp_path, "a-1.0-py3-none-any.whl", conteudo))
+    assert digest == hashlib.sha256(conteudo).hexdigest()
+    objeto = os.path.join(pack_wheelhouse.diretorio(), "objects", digest[:2], digest)
+    destino = os.path.join(pack_wheelhouse.diretorio_wheels(), "a-1.0-py3-none-any.whl")
+    assert os.path.samefile(objeto, destino)
+    assert _indice() == {"a-1.0-py3-none-any.whl": digest}
+    assert pack_wheelhouse.contem("a-1.0-py3-none-any.whl")
+
+
+def test_mesmo_conteudo_com_outro_nome_compartilha_o_objeto(tmp_path):
+    conteudo = b"igual"
+    pack_wheelhouse.adicionar(_wheel(tmp_path, "a-1.0-py3-none-any.whl", conteudo))
+    pack_wheelhouse.adicionar(_wheel(tmp_path, "a-1.0-py2.py3-none-any.whl", conteudo))
+    objetos = [os.path.join(raiz, n) for raiz, _, nomes in os.walk(os.path.join(pack_wheelhouse.diretorio(),
+                                                                                "objects")) for n in nomes]
+    assert len(objetos) == 1 and len(_indice()) == 2
+
+
+def test_mesmo_nome_com_outro_conteudo_religa(tmp_path):
+    nome = "a-1.0-py3-none-any.whl"
+    pack_wheelhouse.adicionar(_wheel(tmp_path, nome, b"primeira"))
+    (tmp_path / "nova").mkdir()
+    digest = pack_wheelhouse.adicionar(_wheel(tmp_path / "nova", nome, b"reconstruida"))
+    destino = os.path.join(pack_wheelhouse.diretorio_wheels(), nome)
+    with open(destino, "rb") as fp:
+        assert fp.read() == b"reconstruida"
+    assert _indice()[nome] == digest and pack_wheelhouse.verificar() == []
+    assert not [n for n in os.listdir(pack_wheelhouse.diretorio_wheels()) if n.endswith(".tmp")]
+
+
+def test_verificar_encontra_wheel_corrompida(tmp_path):
+    pack_wheelhouse.adicionar(_wheel(tmp_path, "a-1.0-py3-none-any.whl", b"original"))
+    destino = os.path.join(pack_wheelhouse.diretorio_wheels(), "a-1.0-py3-none-any.whl")
+    os.remove(destino)
+    with open(destino, "wb") as fp:
+        fp.write(b"alterada")
+    assert pack_wheelhouse.verificar() == ["a-1.0-py3-none-any.whl"]
+
+
+def test_ajustar_comando_offline_remove_indices(monkeypatch):
+    monkeypatch.setattr(pack_wheelhouse, "OFFLINE", True)
+    comando = ["python", "-m", "pip", "install", "--extra-index-url", "https://x", "--index-url=https://y", "torch"]
+    ajustado = pack_wheelhouse.ajustar_comando(comando)
+    assert ajustado == ["python", "-m", "pip", "install", "--no-index", "--find-links",
+                        pack_wheelhouse.diretorio_wheels(), "torch"]
+    assert pack_wheelhouse.ajustar_comando("python -m pip list") == "python -m pip list"
+
+
+def test_lote_da_fase_leva_o_indice_do_catalogo():
+    pacotes, extra = pack_wheelhouse.lote_da_fase(2)
+    assert "torch" in pacotes
+    assert extra == ["--extra-index-url", "https://download.pytorch.org/whl/cpu"]
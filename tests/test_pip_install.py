@@ -0,0 +1,28 @@
+import base64
+import os
+
+import pytest
+
+import pip_install
+
+
+@pytest.mark.parametrize("tamanho_bloco", [5, 7, 64, 1000, 64 * 1024])
+def test_iter_payload_igual_ao_b85decode(tamanho_bloco):
+    dados = os.urandom(5000)
+    texto = base64.b85encode(dados)
+    # Linhas de tamanhos variados, como no DATA embutido (e sem \n no fim)
+    linhas = [texto[i:i + 79] for i in range(0, len(texto), 79)]
+    codificado = b"\n".join(linhas)
+    assert b"".join(pip_install.iter_payload(codificado, tamanho_bloco)) == dados
+
+
+def test_iter_payload_linhas_vazias_e_tamanho_nao_multiplo_de_4():
+    dados = os.urandom(4099)
+    texto = base64.b85encode(dados)
+    codificado = b"\n\n" + texto[:33] + b"\n" + texto[33:] + b"\n\n"
+    assert b"".join(pip_install.iter_payload(codificado, 10)) == dados
+
+
+def test_iter_payload_do_data_embutido():
+    esperado = base64.b85decode(pip_install.DATA.replace(b"\n", b""))
+    assert b"".join(pip_install.iter_payload()) == esperado